@@ -1,33 +1,67 @@
-"""OpenAlex API adapter — wraps the `pyalex` library."""
+"""OpenAlex API adapter — raw paginated HTTP for list queries, `pyalex` for single works."""
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
+from itertools import islice
 from typing import Any
 
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+import httpx
+import pyalex
+from pyalex import Works
 
 from litscout.models import Author, DiscoveryMethod, Paper
+from litscout.utils import work_cache
 from litscout.utils.identifiers import normalize_doi, reconstruct_abstract
 from litscout.utils.rate_limiter import RateLimiter
+from litscout.utils.retry import call_with_retry
 
 logger = logging.getLogger(__name__)
 
+# Single-work records are cached on disk; refresh them weekly so citation
+# counts and OA status do not go stale indefinitely.
+_WORK_CACHE_MAX_AGE = 7 * 24 * 3600.0
+
+# referenced_works are fetched with an OR filter of at most this many IDs,
+# with a few batches in flight at once.
+_REFERENCE_CHUNK_SIZE = 50
+_REFERENCE_WORKERS = 4
+
+_BASE_URL = "https://api.openalex.org"
+_USER_AGENT = "LitScout/0.1 (scientific literature retrieval tool)"
+
+
+def _tail(url: str) -> str:
+    """Return the last path segment of an OpenAlex URL (or the string itself)."""
+    return url.rpartition("/")[2] if url else url
+
+
+def _filter_param(filters: dict[str, Any]) -> str:
+    """Render filters as OpenAlex's ``key:value,key:value`` filter syntax."""
+    return ",".join(f"{k}:{v}" for k, v in filters.items())
+
 
 def _openalex_to_paper(
     work: dict[str, Any],
     discovery_method: DiscoveryMethod = DiscoveryMethod.KEYWORD_SEARCH,
     discovery_query: str | None = None,
+    discovery_date: str | None = None,
 ) -> Paper | None:
-    """Convert an OpenAlex Work dict to a canonical Paper."""
+    """Convert an OpenAlex Work dict to a canonical Paper.
+
+    *discovery_date* defaults to today; paginated callers pass it in so it is
+    computed once per batch rather than once per work.
+    """
     oalex_id = work.get("id", "")
     title = work.get("title")
     if not oalex_id or not title:
         return None
 
     # Extract short ID from URL
-    short_id = oalex_id.split("/")[-1] if "/" in oalex_id else oalex_id
+    short_id = _tail(oalex_id)
 
     # DOI
     doi_raw = work.get("doi")
@@ -38,21 +72,17 @@ def _openalex_to_paper(
     pmid = None
     pmcid = None
     if ids.get("pmid"):
-        pmid_url = ids["pmid"]
-        pmid = pmid_url.split("/")[-1] if "/" in pmid_url else pmid_url
+        pmid = _tail(ids["pmid"])
 
     if ids.get("pmcid"):
-        pmcid_url = ids["pmcid"]
-        pmcid = pmcid_url.split("/")[-1] if "/" in pmcid_url else pmcid_url
+        pmcid = _tail(ids["pmcid"])
 
     # Authors
     authors: list[Author] = []
     for authorship in work.get("authorships", []):
         author_info = authorship.get("author", {})
-        name = author_info.get("display_name")
-        if name:
-            a_id = author_info.get("id", "")
-            short_a_id = a_id.split("/")[-1] if a_id and "/" in a_id else a_id
+        if name := author_info.get("display_name"):
+            short_a_id = _tail(author_info.get("id", ""))
             authors.append(Author(
                 name=name,
                 author_id=f"oalex:{short_a_id}" if short_a_id else None,
@@ -77,7 +107,7 @@ def _openalex_to_paper(
 
     # Fields of study (concepts)
     concepts = work.get("concepts", [])
-    fields_of_study = [c.get("display_name", "") for c in concepts[:5] if c.get("display_name")]
+    fields_of_study = [name for c in concepts[:5] if (name := c.get("display_name"))]
 
     return Paper(
         paper_id=f"oalex:{short_id}",
@@ -97,29 +127,125 @@ def _openalex_to_paper(
         source="openalex",
         discovery_method=discovery_method,
         discovery_query=discovery_query,
-        discovery_date=date.today().isoformat(),
+        discovery_date=discovery_date or date.today().isoformat(),
     )
 
 
 class OpenAlexClient:
-    """Adapter around the `pyalex` library."""
+    """OpenAlex client.
 
-    def __init__(self, email: str = "", api_key: str = "") -> None:
-        import pyalex
+    List queries (search, citing works, reference batches) page through
+    ``/works`` directly over a pooled ``httpx.Client`` and feed the raw JSON
+    into :func:`_openalex_to_paper`; `pyalex` is only used for single-work
+    lookups.
+    """
 
+    def __init__(self, email: str = "", api_key: str = "", *, use_cache: bool = True) -> None:
         if email:
             pyalex.config.email = email
         if api_key:
             pyalex.config.api_key = api_key
 
-        self._limiter = RateLimiter(10.0)
+        # Shared across instances; a small burst lets a batch of reference
+        # lookups start immediately before settling to the sustained rate.
+        self._limiter = RateLimiter.for_host("api.openalex.org", 10.0, capacity=5.0)
+        self._use_cache = use_cache
+        # Raw Work records seen by this client, keyed by short OpenAlex ID.
+        # Raw dicts (not Papers) are kept because callers mutate returned
+        # Papers and each caller needs its own discovery metadata.
+        self._seen_works: dict[str, dict[str, Any]] = {}
+        # Identifier → raw OpenAlex ID, so repeated snowballing from the same
+        # seed skips the lookup round-trip. Failed resolutions are not cached.
+        self._id_cache: dict[str, str] = {}
+
+        auth_params: dict[str, str] = {}
+        if pyalex.config.email:
+            auth_params["mailto"] = pyalex.config.email
+        if pyalex.config.api_key:
+            auth_params["api_key"] = pyalex.config.api_key
+        self._http = httpx.Client(
+            base_url=_BASE_URL,
+            params=auth_params,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            headers={"User-Agent": _USER_AGENT},
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> OpenAlexClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _remember(self, work: dict[str, Any]) -> dict[str, Any]:
+        if oalex_id := work.get("id"):
+            self._seen_works[_tail(oalex_id)] = work
+        return work
+
+    def _fetch_work_json(self, work_id: str) -> dict[str, Any]:
+        """Fetch a raw Work record by OpenAlex ID or DOI URL, via the on-disk cache."""
+        if self._use_cache:
+            cached = work_cache.get(work_id, namespace="openalex", max_age=_WORK_CACHE_MAX_AGE)
+            if cached is not None:
+                return cached
+
+        self._limiter.acquire()
+        work = dict(call_with_retry(lambda: Works()[work_id], description="OpenAlex lookup"))
+        if self._use_cache:
+            work_cache.put(work_id, work, namespace="openalex")
+        return work
+
+    def _get_works_page(self, params: dict[str, Any]) -> dict[str, Any]:
+        resp = self._http.get("/works", params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _paginate(
+        self, params: dict[str, Any], per_page: int, limit: int | None = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw result pages of a ``/works`` query using cursor pagination.
+
+        Each page fetch is rate-limited and retried independently. The next
+        page is requested in the background while the caller processes the
+        current one; prefetching stops once *limit* records have been fetched,
+        so callers that only need the first N results pay no extra request.
+        """
+        def fetch(cursor: str) -> dict[str, Any]:
+            page_params = {**params, "per-page": per_page, "cursor": cursor}
+            self._limiter.acquire()
+            return call_with_retry(
+                lambda: self._get_works_page(page_params), description="OpenAlex page fetch"
+            )
+
+        fetched = 0
+        pool = ThreadPoolExecutor(max_workers=1)
+        pending: Future[dict[str, Any]] | None = None
+        try:
+            data = fetch("*")
+            while True:
+                results = data.get("results") or []
+                if not results:
+                    return
+                fetched += len(results)
+                cursor = (data.get("meta") or {}).get("next_cursor")
+                if cursor and (limit is None or fetched < limit):
+                    pending = pool.submit(fetch, cursor)
+                yield results
+                if not cursor:
+                    return
+                if pending is not None:
+                    data, pending = pending.result(), None
+                else:
+                    data = fetch(cursor)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            pool.shutdown(wait=False)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
-        reraise=True,
-    )
     def search_works(
         self,
         query: str,
@@ -129,109 +255,82 @@ class OpenAlexClient:
         max_results: int = 100,
     ) -> list[Paper]:
         """Search OpenAlex Works by keyword query."""
-        from pyalex import Works
-
-        self._limiter.acquire()
         logger.info("OpenAlex search: query=%r max_results=%d", query, max_results)
 
-        chain = Works().search(query)
-
         filters: dict[str, Any] = {"type": "article"}
         if year_range:
             filters["publication_year"] = f"{year_range[0]}-{year_range[1]}"
         if min_citation_count > 0:
             filters["cited_by_count"] = f">{min_citation_count}"
 
-        chain = chain.filter(**filters)
+        params = {"search": query, "filter": _filter_param(filters)}
 
         papers: list[Paper] = []
-        for page in chain.paginate(per_page=min(max_results, 200)):
-            for work in page:
-                if len(papers) >= max_results:
-                    break
-                paper = _openalex_to_paper(work, DiscoveryMethod.KEYWORD_SEARCH, query)
+        append = papers.append
+        today = date.today().isoformat()
+        for page in self._paginate(params, per_page=min(max_results, 200), limit=max_results):
+            for work in islice(page, max_results - len(papers)):
+                paper = _openalex_to_paper(
+                    self._remember(work), DiscoveryMethod.KEYWORD_SEARCH, query, today
+                )
                 if paper:
-                    papers.append(paper)
+                    append(paper)
             if len(papers) >= max_results:
                 break
 
         logger.info("OpenAlex search returned %d papers", len(papers))
         return papers
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
-        reraise=True,
-    )
     def get_work(self, work_id: str) -> Paper | None:
         """Fetch a single work by OpenAlex ID or DOI."""
-        from pyalex import Works
-
-        self._limiter.acquire()
         try:
-            work = Works()[work_id]
-            return _openalex_to_paper(work)
+            work = self._fetch_work_json(work_id)
+            return _openalex_to_paper(self._remember(work))
         except Exception:
             logger.exception("Failed to fetch OpenAlex work: %s", work_id)
             return None
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
-        reraise=True,
-    )
     def get_cited_by(self, work_id: str, max_results: int = 500) -> list[Paper]:
         """Get works that cite the given work (forward citations).
 
         *work_id* can be an OpenAlex ID (W...), a DOI, or a prefixed paper_id.
         """
-        from pyalex import Works
-
         oalex_id = self._resolve_to_openalex_id(work_id)
         if not oalex_id:
             return []
 
-        self._limiter.acquire()
         logger.info("OpenAlex get_cited_by: %s (resolved=%s) max=%d", work_id, oalex_id, max_results)
 
         papers: list[Paper] = []
-        for page in Works().filter(cites=oalex_id).paginate(per_page=min(max_results, 200)):
-            for work in page:
-                if len(papers) >= max_results:
-                    break
-                paper = _openalex_to_paper(work, DiscoveryMethod.CITATION_FORWARD, work_id)
+        append = papers.append
+        today = date.today().isoformat()
+        params = {"filter": _filter_param({"cites": oalex_id})}
+        for page in self._paginate(params, per_page=min(max_results, 200), limit=max_results):
+            for work in islice(page, max_results - len(papers)):
+                paper = _openalex_to_paper(
+                    self._remember(work), DiscoveryMethod.CITATION_FORWARD, work_id, today
+                )
                 if paper:
-                    papers.append(paper)
+                    append(paper)
             if len(papers) >= max_results:
                 break
 
         logger.info("OpenAlex get_cited_by returned %d papers", len(papers))
         return papers
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
-        reraise=True,
-    )
     def get_references(self, work_id: str, max_results: int = 500) -> list[Paper]:
         """Get works referenced by the given work (backward references).
 
         Uses the referenced_works field on the work object to batch-fetch details.
         """
-        from pyalex import Works
-
         oalex_id = self._resolve_to_openalex_id(work_id)
         if not oalex_id:
             return []
 
-        self._limiter.acquire()
         logger.info("OpenAlex get_references: %s (resolved=%s) max=%d", work_id, oalex_id, max_results)
 
         try:
-            work = Works()[oalex_id]
+            work = self._fetch_work_json(oalex_id)
         except Exception:
             logger.exception("Failed to fetch work for references: %s", work_id)
             return []
@@ -241,25 +340,43 @@ class OpenAlexClient:
             logger.info("OpenAlex: no referenced_works for %s", work_id)
             return []
 
-        # Trim to max_results before fetching details
-        ref_ids = ref_ids[:max_results]
+        # Dedupe and trim to max_results before fetching details
+        ref_ids = [_tail(r) for r in dict.fromkeys(ref_ids)][:max_results]
 
-        # Batch fetch via filter (OpenAlex supports openalex_id filter with | OR)
-        papers: list[Paper] = []
-        # Process in chunks of 50 (API limit on OR filters)
-        for i in range(0, len(ref_ids), 50):
-            chunk = ref_ids[i:i + 50]
-            self._limiter.acquire()
-            id_filter = "|".join(chunk)
+        # Only fetch works this client hasn't already seen
+        to_fetch = [r for r in ref_ids if r not in self._seen_works]
+        if len(to_fetch) < len(ref_ids):
+            logger.info("OpenAlex: %d of %d references already fetched",
+                        len(ref_ids) - len(to_fetch), len(ref_ids))
+
+        # Batch fetch via filter (OpenAlex supports openalex_id filter with | OR),
+        # in chunks of 50 (API limit on OR filters). Chunks are fetched
+        # concurrently; the shared rate limiter still paces every request.
+        def fetch_chunk(chunk: list[str]) -> None:
             try:
-                for page in Works().filter(openalex_id=id_filter).paginate(per_page=200):
+                params = {"filter": _filter_param({"openalex_id": "|".join(chunk)})}
+                for page in self._paginate(params, per_page=200, limit=len(chunk)):
                     for w in page:
-                        paper = _openalex_to_paper(w, DiscoveryMethod.CITATION_BACKWARD, work_id)
-                        if paper:
-                            papers.append(paper)
+                        self._remember(w)
             except Exception:
                 logger.exception("Failed to fetch reference batch for %s", work_id)
 
+        chunks = [to_fetch[i:i + _REFERENCE_CHUNK_SIZE]
+                  for i in range(0, len(to_fetch), _REFERENCE_CHUNK_SIZE)]
+        with ThreadPoolExecutor(max_workers=_REFERENCE_WORKERS) as pool:
+            list(pool.map(fetch_chunk, chunks))
+
+        # Convert in reference order
+        papers: list[Paper] = []
+        today = date.today().isoformat()
+        for ref_id in ref_ids:
+            w = self._seen_works.get(ref_id)
+            if w is None:
+                continue
+            paper = _openalex_to_paper(w, DiscoveryMethod.CITATION_BACKWARD, work_id, today)
+            if paper:
+                papers.append(paper)
+
         logger.info("OpenAlex get_references returned %d papers", len(papers))
         return papers
 
@@ -268,7 +385,8 @@ class OpenAlexClient:
 
         The `cites` filter requires a raw OpenAlex ID, not a DOI URL.
         """
-        from pyalex import Works
+        if paper_id in self._id_cache:
+            return self._id_cache[paper_id]
 
         # Already a raw OpenAlex ID
         if paper_id.startswith("oalex:"):
@@ -285,12 +403,14 @@ class OpenAlexClient:
         else:
             doi_url = paper_id
 
-        self._limiter.acquire()
         try:
-            work = Works()[doi_url]
+            work = self._fetch_work_json(doi_url)
             oalex_id = work.get("id", "")
             # Extract W... from full URL like https://openalex.org/W1234567
-            return oalex_id.split("/")[-1] if "/" in oalex_id else oalex_id
+            resolved = _tail(oalex_id)
         except Exception:
             logger.warning("Could not resolve %s to OpenAlex ID", paper_id)
             return None
+        if resolved:
+            self._id_cache[paper_id] = resolved
+        return resolved
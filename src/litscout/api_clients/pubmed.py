@@ -8,16 +8,26 @@ from typing import Any
 from xml.etree import ElementTree
 
 import httpx
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from Bio import Entrez
 
 from litscout.models import Author, DiscoveryMethod, Paper
 from litscout.utils.identifiers import normalize_doi
 from litscout.utils.rate_limiter import RateLimiter
+from litscout.utils.retry import call_with_retry
 
 logger = logging.getLogger(__name__)
 
+# E-utilities esummary endpoint (JSON document summaries, no abstracts)
+_ESUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+# Maximum number of IDs sent per esummary request
+_ESUMMARY_BATCH_SIZE = 200
+
 # NCBI ID converter URL
 _IDCONV_URL = "https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/"
+# Maximum number of IDs the converter accepts per request
+_IDCONV_BATCH_SIZE = 200
+
+_USER_AGENT = "LitScout/0.1 (scientific literature retrieval tool)"
 
 
 def _xml_text(elem: ElementTree.Element | None, path: str, default: str = "") -> str:
@@ -29,8 +39,16 @@ def _xml_text(elem: ElementTree.Element | None, path: str, default: str = "") ->
     return default
 
 
-def _parse_pubmed_article(article: ElementTree.Element, discovery_query: str | None = None) -> Paper | None:
-    """Parse a single PubmedArticle XML element into a Paper."""
+def _parse_pubmed_article(
+    article: ElementTree.Element,
+    discovery_query: str | None = None,
+    discovery_date: str | None = None,
+) -> Paper | None:
+    """Parse a single PubmedArticle XML element into a Paper.
+
+    *discovery_date* defaults to today; batch callers pass it in so it is
+    computed once per response rather than once per article.
+    """
     medline = article.find("MedlineCitation")
     if medline is None:
         return None
@@ -71,9 +89,12 @@ def _parse_pubmed_article(article: ElementTree.Element, discovery_query: str | N
                 name = f"{fore} {last}".strip() if fore else last
                 authors.append(Author(name=name))
 
+    # Journal element is looked up once and reused for year and venue
+    journal = art.find("Journal")
+
     # Year
     year = None
-    pub_date = art.find("Journal/JournalIssue/PubDate")
+    pub_date = journal.find("JournalIssue/PubDate") if journal is not None else None
     if pub_date is not None:
         year_text = _xml_text(pub_date, "Year")
         medline_date = _xml_text(pub_date, "MedlineDate")
@@ -90,24 +111,21 @@ def _parse_pubmed_article(article: ElementTree.Element, discovery_query: str | N
                 pass
 
     # Journal/venue
-    journal_name = _xml_text(art, "Journal/Title")
-    venue = _xml_text(art, "Journal/ISOAbbreviation") or journal_name
+    journal_name = _xml_text(journal, "Title")
+    venue = _xml_text(journal, "ISOAbbreviation") or journal_name
 
-    # DOI
+    # DOI and PMCID from article ID list
     doi = None
+    pmcid = None
     article_id_list = article.find("PubmedData/ArticleIdList")
     if article_id_list is not None:
         for aid in article_id_list.findall("ArticleId"):
-            if aid.get("IdType") == "doi" and aid.text:
+            if not aid.text:
+                continue
+            id_type = aid.get("IdType")
+            if id_type == "doi":
                 doi = normalize_doi(aid.text.strip())
-            elif aid.get("IdType") == "pmc" and aid.text:
-                pmcid = aid.text.strip()
-
-    # PMCID from article ID list
-    pmcid = None
-    if article_id_list is not None:
-        for aid in article_id_list.findall("ArticleId"):
-            if aid.get("IdType") == "pmc" and aid.text:
+            elif id_type == "pmc":
                 pmcid = aid.text.strip()
                 if not pmcid.startswith("PMC"):
                     pmcid = f"PMC{pmcid}"
@@ -126,7 +144,84 @@ def _parse_pubmed_article(article: ElementTree.Element, discovery_query: str | N
         source="pubmed",
         discovery_method=DiscoveryMethod.KEYWORD_SEARCH,
         discovery_query=discovery_query,
-        discovery_date=date.today().isoformat(),
+        discovery_date=discovery_date or date.today().isoformat(),
+    )
+
+
+def _iter_parse_articles(source: Any, discovery_query: str | None = None) -> list[Paper]:
+    """Incrementally parse a PubmedArticleSet, one PubmedArticle at a time.
+
+    Each article is dropped from the tree once parsed, so peak memory stays
+    near the size of a single article rather than the whole response.
+    """
+    papers: list[Paper] = []
+    today = date.today().isoformat()
+    context = ElementTree.iterparse(source, events=("start", "end"))
+    _, root = next(context)
+    for event, elem in context:
+        if event == "end" and elem.tag == "PubmedArticle":
+            paper = _parse_pubmed_article(elem, discovery_query, today)
+            if paper:
+                papers.append(paper)
+            root.clear()
+    return papers
+
+
+def _summary_to_paper(
+    record: dict[str, Any],
+    discovery_query: str | None = None,
+    discovery_date: str | None = None,
+) -> Paper | None:
+    """Convert one esummary JSON document summary into a Paper (without abstract)."""
+    pmid = str(record.get("uid") or "")
+    title = (record.get("title") or "").strip()
+    if not pmid or not title or "error" in record:
+        return None
+
+    # Collective names are listed with authtype "CollectiveName"; the XML path
+    # skips them too (no LastName), so keep the two paths consistent.
+    authors = [
+        Author(name=a["name"])
+        for a in record.get("authors", [])
+        if a.get("name") and a.get("authtype", "Author") == "Author"
+    ]
+
+    # pubdate looks like "2023 Jan 5" or "2023 Jan-Feb"
+    year = None
+    try:
+        year = int((record.get("pubdate") or "")[:4])
+    except ValueError:
+        pass
+
+    journal_name = record.get("fulljournalname") or ""
+    venue = record.get("source") or journal_name
+
+    doi = None
+    pmcid = None
+    for aid in record.get("articleids", []):
+        value = (aid.get("value") or "").strip()
+        if not value:
+            continue
+        id_type = aid.get("idtype")
+        if id_type == "doi":
+            doi = normalize_doi(value)
+        elif id_type == "pmc":
+            pmcid = value if value.startswith("PMC") else f"PMC{value}"
+
+    return Paper(
+        paper_id=f"pmid:{pmid}",
+        doi=doi,
+        pmid=pmid,
+        pmcid=pmcid,
+        title=title,
+        authors=authors,
+        year=year,
+        venue=venue,
+        journal_name=journal_name,
+        source="pubmed",
+        discovery_method=DiscoveryMethod.KEYWORD_SEARCH,
+        discovery_query=discovery_query,
+        discovery_date=discovery_date or date.today().isoformat(),
     )
 
 
@@ -134,32 +229,46 @@ class PubMedClient:
     """Adapter around Bio.Entrez for PubMed search and retrieval."""
 
     def __init__(self, email: str = "", api_key: str = "") -> None:
-        from Bio import Entrez
-
         self._entrez = Entrez
         if email:
             Entrez.email = email
         if api_key:
             Entrez.api_key = api_key
         effective_rate = 8.0 if api_key else 2.0
-        self._limiter = RateLimiter(effective_rate)
+        self._limiter = RateLimiter.for_host("eutils.ncbi.nlm.nih.gov", effective_rate)
+        # Pooled client so BioC / idconv calls reuse connections instead of
+        # paying a TCP + TLS handshake per request.
+        self._http = httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={"User-Agent": _USER_AGENT, "Accept-Encoding": "gzip"},
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> PubMedClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
-        reraise=True,
-    )
     def search(
         self,
         query: str,
         *,
         year_range: tuple[int, int] | None = None,
         max_results: int = 100,
+        include_abstract: bool = True,
     ) -> list[Paper]:
-        """Search PubMed by keyword query, returning canonical Paper objects."""
-        self._limiter.acquire()
+        """Search PubMed by keyword query, returning canonical Paper objects.
 
+        With ``include_abstract=False`` metadata comes from the esummary JSON
+        endpoint, which is much cheaper to parse than efetch XML but carries no
+        abstracts.
+        """
         # Build date filter
         if year_range:
             query = f"({query}) AND ({year_range[0]}:{year_range[1]}[pdat])"
@@ -167,11 +276,17 @@ class PubMedClient:
         logger.info("PubMed search: query=%r max_results=%d", query, max_results)
 
         # Step 1: esearch to get PMIDs
-        handle = self._entrez.esearch(
-            db="pubmed", term=query, retmax=max_results, sort="relevance"
-        )
-        search_results = self._entrez.read(handle)
-        handle.close()
+        def esearch() -> Any:
+            self._limiter.acquire()
+            handle = self._entrez.esearch(
+                db="pubmed", term=query, retmax=max_results, sort="relevance"
+            )
+            try:
+                return self._entrez.read(handle)
+            finally:
+                handle.close()
+
+        search_results = call_with_retry(esearch, description="PubMed esearch")
 
         pmids = search_results.get("IdList", [])
         if not pmids:
@@ -180,31 +295,59 @@ class PubMedClient:
 
         logger.info("PubMed esearch returned %d PMIDs", len(pmids))
 
-        # Step 2: efetch to get full metadata
+        # Step 2: efetch (or esummary) to get metadata
+        if not include_abstract:
+            return self._fetch_by_pmids_json(pmids, discovery_query=query)
         return self._fetch_by_pmids(pmids, discovery_query=query)
 
     def _fetch_by_pmids(self, pmids: list[str], discovery_query: str | None = None) -> list[Paper]:
         """Fetch full metadata for a list of PMIDs."""
-        self._limiter.acquire()
+        def efetch() -> list[Paper]:
+            self._limiter.acquire()
+            handle = self._entrez.efetch(
+                db="pubmed", id=",".join(pmids), rettype="xml", retmode="xml"
+            )
+            # Feed the response straight into the incremental parser rather than
+            # buffering it with .read() first.
+            try:
+                return _iter_parse_articles(handle, discovery_query)
+            finally:
+                handle.close()
 
-        handle = self._entrez.efetch(
-            db="pubmed", id=",".join(pmids), rettype="xml", retmode="xml"
-        )
-        xml_data = handle.read()
-        handle.close()
+        papers = call_with_retry(efetch, description="PubMed efetch")
 
-        # Parse XML
-        if isinstance(xml_data, bytes):
-            xml_data = xml_data.decode("utf-8")
+        logger.info("PubMed efetch parsed %d papers", len(papers))
+        return papers
 
-        root = ElementTree.fromstring(xml_data)
+    def _fetch_by_pmids_json(
+        self, pmids: list[str], discovery_query: str | None = None
+    ) -> list[Paper]:
+        """Fetch title/author/journal/ID metadata for PMIDs via esummary JSON."""
+        params: dict[str, str] = {"db": "pubmed", "retmode": "json", "tool": "litscout"}
+        if self._entrez.email:
+            params["email"] = self._entrez.email
+        if self._entrez.api_key:
+            params["api_key"] = self._entrez.api_key
+
+        today = date.today().isoformat()
         papers: list[Paper] = []
-        for article in root.findall("PubmedArticle"):
-            paper = _parse_pubmed_article(article, discovery_query)
-            if paper:
-                papers.append(paper)
-
-        logger.info("PubMed efetch parsed %d papers", len(papers))
+        for i in range(0, len(pmids), _ESUMMARY_BATCH_SIZE):
+            chunk = pmids[i:i + _ESUMMARY_BATCH_SIZE]
+
+            def esummary(chunk: list[str] = chunk) -> dict[str, Any]:
+                self._limiter.acquire()
+                resp = self._http.get(_ESUMMARY_URL, params={**params, "id": ",".join(chunk)})
+                resp.raise_for_status()
+                return resp.json().get("result", {})
+
+            result = call_with_retry(esummary, description="PubMed esummary")
+            # "uids" preserves the esearch relevance order
+            for uid in result.get("uids", []):
+                record = result.get(uid)
+                if record and (paper := _summary_to_paper(record, discovery_query, today)):
+                    papers.append(paper)
+
+        logger.info("PubMed esummary parsed %d papers", len(papers))
         return papers
 
     def get_bioc_fulltext(self, pmcid: str) -> str | None:
@@ -217,7 +360,7 @@ class PubMedClient:
 
         self._limiter.acquire()
         try:
-            resp = httpx.get(url, timeout=30.0, follow_redirects=True)
+            resp = self._http.get(url)
             if resp.status_code == 200 and resp.headers.get("content-type", "").startswith("application/json"):
                 return resp.text
         except httpx.HTTPError:
@@ -226,17 +369,27 @@ class PubMedClient:
 
     def pmid_to_pmcid(self, pmid: str) -> str | None:
         """Convert a PMID to a PMCID using the NCBI ID converter."""
-        try:
-            resp = httpx.get(
-                _IDCONV_URL,
-                params={"ids": pmid, "format": "json"},
-                timeout=10.0,
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                records = data.get("records", [])
-                if records and "pmcid" in records[0]:
-                    return records[0]["pmcid"]
-        except Exception:
-            logger.exception("PMID→PMCID conversion failed for %s", pmid)
-        return None
+        return self.pmids_to_pmcids([pmid]).get(pmid)
+
+    def pmids_to_pmcids(self, pmids: list[str]) -> dict[str, str]:
+        """Convert many PMIDs to PMCIDs, one idconv request per chunk of IDs.
+
+        Returns a dict mapping PMID → PMCID; PMIDs without a PMC record are omitted.
+        """
+        mapping: dict[str, str] = {}
+        for i in range(0, len(pmids), _IDCONV_BATCH_SIZE):
+            chunk = pmids[i:i + _IDCONV_BATCH_SIZE]
+            try:
+                resp = self._http.get(
+                    _IDCONV_URL,
+                    params={"ids": ",".join(chunk), "format": "json"},
+                    timeout=10.0,
+                )
+                if resp.status_code == 200:
+                    data = resp.json()
+                    for record in data.get("records", []):
+                        if "pmcid" in record and "pmid" in record:
+                            mapping[str(record["pmid"])] = record["pmcid"]
+            except Exception:
+                logger.exception("PMID→PMCID conversion failed for %s", ",".join(chunk))
+        return mapping
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import httpx
+from pydantic_core import from_json
+from semanticscholar.SemanticScholarException import (
+    GatewayTimeoutException,
+    InternalServerErrorException,
+)
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from litscout.models import Author, DiscoveryMethod, Paper
+from litscout.utils import work_cache
 from litscout.utils.identifiers import normalize_doi
 from litscout.utils.rate_limiter import RateLimiter
+from litscout.utils.retry import call_with_retry
 
 logger = logging.getLogger(__name__)
 
-# Fields to request from the S2 API
-S2_FIELDS = [
+# Fields to request from the S2 API. Tuples, so callers cannot mutate the
+# shared module-level values; the library joins them per request.
+S2_FIELDS = (
     "paperId",
     "externalIds",
     "title",
@@ -31,10 +42,49 @@ S2_FIELDS = [
     "tldr",
     "authors",
     "publicationTypes",
-]
+)
 
 # Citations/references endpoints don't support tldr
-S2_CITATION_FIELDS = [f for f in S2_FIELDS if f != "tldr"]
+S2_CITATION_FIELDS = tuple(f for f in S2_FIELDS if f != "tldr")
+
+# Pre-joined forms for the raw HTTP endpoints
+S2_FIELDS_STR = ",".join(S2_FIELDS)
+S2_CITATION_FIELDS_STR = ",".join(S2_CITATION_FIELDS)
+
+_BASE_URL = "https://api.semanticscholar.org/graph/v1"
+# The /paper/batch endpoint accepts at most this many IDs per request
+_BATCH_SIZE = 500
+# Citation/reference pages: results per request and pages in flight at once
+_EDGE_PAGE_SIZE = 500
+_EDGE_WORKERS = 4
+_USER_AGENT = "LitScout/0.1 (scientific literature retrieval tool)"
+
+# Raw paper records are cached on disk for two weeks
+_CACHE_MAX_AGE = 14 * 24 * 3600.0
+
+# Errors worth retrying: network failures, 429 (raised by the library as
+# ConnectionRefusedError) and 500/504. Anything else is a bug or a bad query.
+_TRANSIENT_ERRORS = (
+    httpx.HTTPError,
+    ConnectionError,
+    InternalServerErrorException,
+    GatewayTimeoutException,
+)
+
+
+def _s2_raw_id(paper_id: str) -> str:
+    """Strip LitScout's ``s2:`` prefix, giving the ID form S2 and the work cache use."""
+    return paper_id.removeprefix("s2:")
+
+
+def _accessor(obj: Any) -> Callable[..., Any]:
+    """Return a ``get(key, default=None)`` function for a dict or attribute-style object.
+
+    The type check happens once here rather than on every field access.
+    """
+    if isinstance(obj, dict):
+        return obj.get
+    return lambda key, default=None: getattr(obj, key, default)
 
 
 def _s2_to_paper(
@@ -46,56 +96,47 @@ def _s2_to_paper(
     if raw is None:
         return None
 
-    # Handle both dict-like and object-like access
-    def get(obj: Any, key: str, default: Any = None) -> Any:
-        if isinstance(obj, dict):
-            return obj.get(key, default)
-        return getattr(obj, key, default)
+    # Handle both dict-like (raw JSON) and object-like (library) results
+    get = _accessor(raw)
 
-    paper_id_raw = get(raw, "paperId")
-    title = get(raw, "title")
+    paper_id_raw = get("paperId")
+    title = get("title")
     if not paper_id_raw or not title:
         return None
 
-    ext_ids = get(raw, "externalIds") or {}
-    if not isinstance(ext_ids, dict):
-        ext_ids = {k: getattr(ext_ids, k, None) for k in ["DOI", "PubMed", "PubMedCentral", "ArXiv"]}
-
-    journal_obj = get(raw, "journal") or {}
-    oa_pdf = get(raw, "openAccessPdf") or {}
-    tldr_obj = get(raw, "tldr") or {}
-    authors_raw = get(raw, "authors") or []
-
-    authors = []
-    for a in authors_raw:
-        a_name = get(a, "name")
-        a_id = get(a, "authorId")
-        if a_name:
-            authors.append(Author(
-                name=a_name,
-                author_id=f"s2:{a_id}" if a_id else None,
-            ))
+    ext = _accessor(get("externalIds") or {})
+    journal_obj = get("journal")
+    oa_pdf = get("openAccessPdf")
+    tldr_obj = get("tldr")
+
+    # Consortium papers can list hundreds of authors; skip the ID lookup for
+    # nameless entries and bind append once.
+    authors: list[Author] = []
+    append = authors.append
+    for a in get("authors") or []:
+        a_get = _accessor(a)
+        if a_name := a_get("name"):
+            a_id = a_get("authorId")
+            append(Author(name=a_name, author_id="s2:" + a_id if a_id else None))
 
     return Paper(
         paper_id=f"s2:{paper_id_raw}",
-        doi=normalize_doi(get(ext_ids, "DOI")),
-        pmid=get(ext_ids, "PubMed"),
-        pmcid=get(ext_ids, "PubMedCentral"),
-        arxiv_id=get(ext_ids, "ArXiv"),
+        doi=normalize_doi(ext("DOI")),
+        pmid=ext("PubMed"),
+        pmcid=ext("PubMedCentral"),
+        arxiv_id=ext("ArXiv"),
         title=title,
         authors=authors,
-        year=get(raw, "year"),
-        venue=get(raw, "venue") or None,
-        journal_name=get(journal_obj, "name") if isinstance(journal_obj, dict) else getattr(journal_obj, "name", None),
-        citation_count=get(raw, "citationCount"),
-        influential_citation_count=get(raw, "influentialCitationCount"),
-        abstract=get(raw, "abstract"),
-        tldr=get(tldr_obj, "text") if isinstance(tldr_obj, dict) else getattr(tldr_obj, "text", None),
-        fields_of_study=get(raw, "fieldsOfStudy") or [],
-        is_open_access=get(raw, "isOpenAccess"),
-        open_access_pdf_url=(
-            get(oa_pdf, "url") if isinstance(oa_pdf, dict) else getattr(oa_pdf, "url", None)
-        ),
+        year=get("year"),
+        venue=get("venue") or None,
+        journal_name=_accessor(journal_obj)("name") if journal_obj else None,
+        citation_count=get("citationCount"),
+        influential_citation_count=get("influentialCitationCount"),
+        abstract=get("abstract"),
+        tldr=_accessor(tldr_obj)("text") if tldr_obj else None,
+        fields_of_study=get("fieldsOfStudy") or [],
+        is_open_access=get("isOpenAccess"),
+        open_access_pdf_url=_accessor(oa_pdf)("url") if oa_pdf else None,
         source="semantic_scholar",
         discovery_method=discovery_method,
         discovery_query=discovery_query,
@@ -106,16 +147,34 @@ def _s2_to_paper(
 class SemanticScholarClient:
     """Adapter around the `semanticscholar` library."""
 
-    def __init__(self, api_key: str = "", rate_limit: float | None = None) -> None:
+    def __init__(
+        self, api_key: str = "", rate_limit: float | None = None, *, use_cache: bool = True
+    ) -> None:
         from semanticscholar import SemanticScholar
         self._sch = SemanticScholar(api_key=api_key) if api_key else SemanticScholar()
         effective_rate = rate_limit or (10.0 if api_key else 0.8)
-        self._limiter = RateLimiter(effective_rate)
+        self._limiter = RateLimiter.for_host("api.semanticscholar.org", effective_rate)
+        self._use_cache = use_cache
+        # Raw HTTP client for endpoints the library only exposes one ID at a time
+        headers = {"User-Agent": _USER_AGENT}
+        if api_key:
+            headers["x-api-key"] = api_key
+        self._http = httpx.Client(base_url=_BASE_URL, headers=headers, timeout=30.0)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> SemanticScholarClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(multiplier=1, max=30),
+        retry=retry_if_exception_type(_TRANSIENT_ERRORS),
         reraise=True,
     )
     def search_papers(
@@ -153,73 +212,139 @@ class SemanticScholarClient:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(multiplier=1, max=30),
+        retry=retry_if_exception_type(_TRANSIENT_ERRORS),
         reraise=True,
     )
     def get_paper(self, paper_id: str) -> Paper | None:
         """Fetch a single paper by its Semantic Scholar ID, DOI, PMID, etc."""
+        raw_id = _s2_raw_id(paper_id)
+        if self._use_cache:
+            cached = work_cache.get(raw_id, namespace="semantic_scholar", max_age=_CACHE_MAX_AGE)
+            if cached is not None:
+                return _s2_to_paper(cached)
+
         self._limiter.acquire()
-        result = self._sch.get_paper(paper_id, fields=S2_FIELDS)
+        result = self._sch.get_paper(raw_id, fields=S2_FIELDS)
+        if self._use_cache and result is not None:
+            work_cache.put(raw_id, result.raw_data, namespace="semantic_scholar")
         return _s2_to_paper(result)
 
-    def _fetch_citation_list(self, fetch_fn, paper_id: str, max_results: int, attr: str,
-                              discovery_method: DiscoveryMethod) -> list[Paper]:
-        """Shared retry + error handling for citations/references/recommendations."""
-        raw_id = paper_id.removeprefix("s2:")
-        results = None
+    def get_papers_batch(self, paper_ids: list[str]) -> list[Paper | None]:
+        """Fetch many papers via the /paper/batch endpoint, one request per 500 IDs.
+
+        Accepts the same identifier forms as :meth:`get_paper` and shares its
+        on-disk cache; only cache misses are requested. The result is aligned
+        with *paper_ids*; IDs S2 does not know map to None.
+        """
+        raw_ids = [_s2_raw_id(pid) for pid in paper_ids]
+        records: dict[str, Any] = {}
+        if self._use_cache:
+            for raw_id in raw_ids:
+                cached = work_cache.get(raw_id, namespace="semantic_scholar", max_age=_CACHE_MAX_AGE)
+                if cached is not None:
+                    records[raw_id] = cached
+        missing = [r for r in dict.fromkeys(raw_ids) if r not in records]
+
+        for i in range(0, len(missing), _BATCH_SIZE):
+            chunk = missing[i:i + _BATCH_SIZE]
+
+            def fetch(chunk: list[str] = chunk) -> list[Any]:
+                self._limiter.acquire()
+                resp = self._http.post(
+                    "/paper/batch",
+                    params={"fields": S2_FIELDS_STR},
+                    json={"ids": chunk},
+                )
+                resp.raise_for_status()
+                return from_json(resp.content)
 
-        # Retry transient errors (504s, network issues) up to 3 times
-        for attempt in range(3):
+            results = call_with_retry(fetch, description="S2 paper batch")
+            for raw_id, item in zip(chunk, results):
+                records[raw_id] = item
+                if self._use_cache and item is not None:
+                    work_cache.put(raw_id, item, namespace="semantic_scholar")
+
+        return [_s2_to_paper(records.get(raw_id)) for raw_id in raw_ids]
+
+    def _fetch_edge_page(self, raw_id: str, edge: str, offset: int, limit: int) -> list[Any]:
+        """Fetch one page of /paper/{id}/citations or /references as raw dicts."""
+        def fetch() -> list[Any]:
             self._limiter.acquire()
-            try:
-                results = fetch_fn(raw_id, fields=S2_CITATION_FIELDS,
-                                   limit=min(max_results, 500))
-                break
-            except TypeError:
-                # S2 library bug: null pagination data for some papers
-                logger.warning("S2 returned no data for %s (attempt %d)", paper_id, attempt + 1)
-                return []
-            except Exception as e:
-                if attempt < 2:
-                    import time
-                    wait = 2 ** (attempt + 1)
-                    logger.info("S2 request failed for %s, retrying in %ds: %s", paper_id, wait, e)
-                    time.sleep(wait)
-                else:
-                    raise
-
-        if results is None:
+            resp = self._http.get(
+                f"/paper/{raw_id}/{edge}",
+                params={"fields": S2_CITATION_FIELDS_STR, "offset": offset, "limit": limit},
+            )
+            resp.raise_for_status()
+            return from_json(resp.content).get("data") or []
+
+        return call_with_retry(fetch, description=f"S2 {edge} page")
+
+    def _fetch_citation_list(self, paper_id: str, edge: str, max_results: int, attr: str,
+                              discovery_method: DiscoveryMethod) -> list[Paper]:
+        """Page through the citations or references of *paper_id*.
+
+        The first page is fetched alone, since most papers fit in it. If it
+        comes back full, the remaining pages are fetched concurrently; every
+        request still passes through the shared rate limiter.
+        """
+        if max_results <= 0:
             return []
+        raw_id = _s2_raw_id(paper_id)
+        page_size = min(max_results, _EDGE_PAGE_SIZE)
+
+        try:
+            pages = [self._fetch_edge_page(raw_id, edge, 0, page_size)]
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning("S2 returned no data for %s", paper_id)
+                return []
+            raise
+
+        offsets = range(page_size, max_results, page_size)
+        if len(pages[0]) == page_size and offsets:
+            with ThreadPoolExecutor(max_workers=min(len(offsets), _EDGE_WORKERS)) as pool:
+                futures = [
+                    pool.submit(self._fetch_edge_page, raw_id, edge, offset, page_size)
+                    for offset in offsets
+                ]
+                # Collect in offset order; a short page means the list is exhausted
+                for future in futures:
+                    page = future.result()
+                    pages.append(page)
+                    if len(page) < page_size:
+                        break
+                for future in futures:
+                    future.cancel()
 
         papers: list[Paper] = []
-        for item in results:
-            if len(papers) >= max_results:
-                break
-            inner = getattr(item, attr, item)
-            paper = _s2_to_paper(inner, discovery_method, paper_id)
-            if paper:
-                papers.append(paper)
+        for page in pages:
+            for item in page:
+                if len(papers) >= max_results:
+                    return papers
+                paper = _s2_to_paper(item.get(attr), discovery_method, paper_id)
+                if paper:
+                    papers.append(paper)
         return papers
 
     def get_paper_citations(self, paper_id: str, max_results: int = 500) -> list[Paper]:
         """Fetch papers that cite the given paper (forward citations)."""
         return self._fetch_citation_list(
-            self._sch.get_paper_citations, paper_id, max_results,
+            paper_id, "citations", max_results,
             "citingPaper", DiscoveryMethod.CITATION_FORWARD,
         )
 
     def get_paper_references(self, paper_id: str, max_results: int = 500) -> list[Paper]:
         """Fetch papers referenced by the given paper (backward references)."""
         return self._fetch_citation_list(
-            self._sch.get_paper_references, paper_id, max_results,
+            paper_id, "references", max_results,
             "citedPaper", DiscoveryMethod.CITATION_BACKWARD,
         )
 
     def get_recommendations(self, paper_ids: list[str], max_results: int = 100) -> list[Paper]:
         """Get algorithmic recommendations based on a set of positive-example papers."""
         self._limiter.acquire()
-        raw_ids = [pid.removeprefix("s2:") for pid in paper_ids]
+        raw_ids = [_s2_raw_id(pid) for pid in paper_ids]
         try:
             results = self._sch.get_recommended_papers(raw_ids[0], limit=min(max_results, 500))
         except TypeError:
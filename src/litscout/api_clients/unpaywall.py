@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
 
 import httpx
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from pydantic_core import from_json
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
+from litscout.utils import work_cache
 from litscout.utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://api.unpaywall.org/v2/"
+# Lookups in flight at once for get_oa_status_many; the limiter still
+# caps the sustained rate.
+_MAX_CONCURRENCY = 10
+
+# OA status changes slowly; cached lookups are reused for two weeks.
+_CACHE_MAX_AGE = 14 * 24 * 3600.0
 
 
 @dataclass
@@ -25,16 +37,72 @@ class UnpaywallResult:
     version: str | None  # "submittedVersion", "acceptedVersion", "publishedVersion"
 
 
+def _not_found_result() -> UnpaywallResult:
+    return UnpaywallResult(is_oa=False, pdf_url=None, landing_page_url=None,
+                           host_type=None, license=None, version=None)
+
+
+def _parse_result(data: dict[str, Any]) -> UnpaywallResult:
+    best = data.get("best_oa_location") or {}
+    return UnpaywallResult(
+        is_oa=data.get("is_oa", False),
+        pdf_url=best.get("url_for_pdf"),
+        landing_page_url=best.get("url_for_landing_page"),
+        host_type=best.get("host_type"),
+        license=best.get("license"),
+        version=best.get("version"),
+    )
+
+
+def _client_options(email: str) -> dict[str, Any]:
+    """httpx client settings shared by the sync pool and the async batch client."""
+    return {
+        "base_url": _BASE_URL,
+        "params": {"email": email},
+        "timeout": 15.0,
+        "follow_redirects": True,
+        # HTTP/2 multiplexes concurrent lookups over one connection; it needs
+        # the optional h2 package.
+        "http2": importlib.util.find_spec("h2") is not None,
+    }
+
+
 class UnpaywallClient:
     """Client for the Unpaywall API."""
 
-    def __init__(self, email: str) -> None:
+    def __init__(self, email: str, *, use_cache: bool = True) -> None:
         self._email = email
-        self._limiter = RateLimiter(10.0)
+        self._use_cache = use_cache
+        # Unpaywall's quota is daily (100k), not per second, so let an idle
+        # client fire a short burst instead of pacing every lookup.
+        self._limiter = RateLimiter.for_host("api.unpaywall.org", 10.0, capacity=10.0)
+        # Keep-alive client so a retrieval pass pays the TLS handshake once,
+        # not once per DOI.
+        self._http = httpx.Client(**_client_options(email))
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> UnpaywallClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _cached(self, doi: str) -> UnpaywallResult | None:
+        if not self._use_cache:
+            return None
+        cached = work_cache.get(doi, namespace="unpaywall", max_age=_CACHE_MAX_AGE)
+        return UnpaywallResult(**cached) if cached is not None else None
+
+    def _store(self, doi: str, result: UnpaywallResult) -> None:
+        if self._use_cache:
+            work_cache.put(doi, asdict(result), namespace="unpaywall")
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
+        wait=wait_random_exponential(multiplier=1, max=30),
         retry=retry_if_exception_type(httpx.HTTPError),
         reraise=True,
     )
@@ -43,28 +111,76 @@ class UnpaywallClient:
         if not doi or not self._email:
             return None
 
+        # Checked before the limiter so cache hits never wait for a slot
+        if (cached := self._cached(doi)) is not None:
+            return cached
+
         self._limiter.acquire()
-        url = f"{_BASE_URL}{doi}"
         logger.debug("Unpaywall lookup: %s", doi)
 
         try:
-            resp = httpx.get(url, params={"email": self._email}, timeout=15.0, follow_redirects=True)
+            resp = self._http.get(doi)
             if resp.status_code == 404:
-                return UnpaywallResult(is_oa=False, pdf_url=None, landing_page_url=None,
-                                        host_type=None, license=None, version=None)
+                result = _not_found_result()
+                self._store(doi, result)
+                return result
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
             logger.warning("Unpaywall HTTP error for %s: %s", doi, e)
             return None
 
-        data = resp.json()
-        best = data.get("best_oa_location") or {}
-
-        return UnpaywallResult(
-            is_oa=data.get("is_oa", False),
-            pdf_url=best.get("url_for_pdf"),
-            landing_page_url=best.get("url_for_landing_page"),
-            host_type=best.get("host_type"),
-            license=best.get("license"),
-            version=best.get("version"),
-        )
+        # Decode the raw bytes with pydantic-core's JSON parser, skipping
+        # httpx's text decode + stdlib json round trip.
+        result = _parse_result(from_json(resp.content))
+        self._store(doi, result)
+        return result
+
+    async def get_oa_status_many(self, dois: Iterable[str]) -> dict[str, UnpaywallResult]:
+        """Look up many DOIs concurrently over one pooled async connection.
+
+        Returns a dict keyed by DOI. DOIs whose lookup failed are omitted so
+        callers can fall back to :meth:`get_oa_status`, which retries.
+        """
+        if not self._email:
+            return {}
+        found: dict[str, UnpaywallResult] = {}
+        unique: list[str] = []
+        for doi in dict.fromkeys(dois):
+            if not doi:
+                continue
+            if (cached := self._cached(doi)) is not None:
+                found[doi] = cached
+            else:
+                unique.append(doi)
+        if not unique:
+            return found
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+        limits = httpx.Limits(max_connections=_MAX_CONCURRENCY,
+                              max_keepalive_connections=_MAX_CONCURRENCY)
+
+        # An AsyncClient is bound to the event loop it first runs on, and each
+        # asyncio.run() brings a new loop, so the async pool lives per call.
+        async with httpx.AsyncClient(**_client_options(self._email), limits=limits) as client:
+            async def lookup(doi: str) -> UnpaywallResult | None:
+                async with semaphore:
+                    await self._limiter.acquire_async()
+                    try:
+                        resp = await client.get(doi)
+                        if resp.status_code == 404:
+                            return _not_found_result()
+                        resp.raise_for_status()
+                        return _parse_result(from_json(resp.content))
+                    except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+                        # A non-JSON body (e.g. a proxy page) or an unexpected
+                        # payload fails this DOI only, not the whole batch
+                        logger.debug("Unpaywall lookup failed for %s: %s", doi, e)
+                        return None
+
+            results = await asyncio.gather(*(lookup(d) for d in unique))
+
+        for doi, result in zip(unique, results):
+            if result is not None:
+                self._store(doi, result)
+                found[doi] = result
+        return found
@@ -11,6 +11,10 @@ from litscout import __version__
 
 logger = logging.getLogger("litscout")
 
+# Kept here rather than imported from litscout.search so that a typo in
+# --sources fails before any backend or config is loaded.
+VALID_SOURCES = frozenset({"semantic_scholar", "pubmed", "openalex"})
+
 
 def _setup_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
@@ -62,11 +66,19 @@ def search(
     tag: tuple[str, ...],
 ) -> None:
     """Search for papers by keyword query."""
+    source_list = [s for s in (x.strip() for x in sources.split(",")) if s]
+    unknown = sorted(set(source_list) - VALID_SOURCES)
+    if unknown or not source_list:
+        raise click.BadParameter(
+            f"unknown source(s): {', '.join(unknown) or '(none given)'}; "
+            f"choose from {', '.join(sorted(VALID_SOURCES))}",
+            param_hint="--sources",
+        )
+
     from litscout.config import load_config
     from litscout.search import run_search
 
     config = load_config(ctx.obj["project_dir"])
-    source_list = [s.strip() for s in sources.split(",")]
 
     click.echo(f"Searching for: {query}")
     click.echo(f"Sources: {', '.join(source_list)}")
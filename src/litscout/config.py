@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import copy
 import os
+import threading
 import tomllib
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiConfig:
     semantic_scholar_api_key: str = ""
     unpaywall_email: str = ""
@@ -17,7 +19,7 @@ class ApiConfig:
     openalex_api_key: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchDefaults:
     year_range: list[int] = field(default_factory=lambda: [2015, 2025])
     min_citation_count: int = 0
@@ -25,7 +27,7 @@ class SearchDefaults:
     fields_of_study: list[str] = field(default_factory=lambda: ["Medicine", "Biology"])
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalConfig:
     fallback_chain: list[str] = field(
         default_factory=lambda: ["semantic_scholar", "unpaywall", "pmc_bioc", "biorxiv"]
@@ -36,7 +38,12 @@ class RetrievalConfig:
     processed_dir: str = "fulltext/inbox/processed/"
 
 
-@dataclass
+@dataclass(slots=True)
+class ExpandConfig:
+    concurrency: int = 5  # seeds expanded in parallel
+
+
+@dataclass(slots=True)
 class ExtractionConfig:
     max_tokens_per_doc: int = 8000
     priority_sections: list[str] = field(
@@ -44,19 +51,20 @@ class ExtractionConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     name: str = ""
     description: str = ""
     created: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     project: ProjectConfig = field(default_factory=ProjectConfig)
     apis: ApiConfig = field(default_factory=ApiConfig)
     search: SearchDefaults = field(default_factory=SearchDefaults)
     retrieval: RetrievalConfig = field(default_factory=RetrievalConfig)
+    expand: ExpandConfig = field(default_factory=ExpandConfig)
     extraction: ExtractionConfig = field(default_factory=ExtractionConfig)
     project_dir: Path = field(default_factory=lambda: Path.cwd())
 
@@ -71,50 +79,70 @@ _ENV_OVERRIDES = {
 }
 
 
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in fields(cls))
+
+
+# TOML table path → Config attribute, with the keys each section accepts.
+# Unknown keys are ignored.
+_SECTIONS: tuple[tuple[tuple[str, ...], str, frozenset[str]], ...] = (
+    (("project",), "project", _field_names(ProjectConfig)),
+    (("apis",), "apis", _field_names(ApiConfig)),
+    (("search", "defaults"), "search", _field_names(SearchDefaults)),
+    (("retrieval",), "retrieval", _field_names(RetrievalConfig)),
+    (("expand",), "expand", _field_names(ExpandConfig)),
+    (("extraction",), "extraction", _field_names(ExtractionConfig)),
+)
+
+# Parsed TOML configs keyed by (toml path, mtime_ns, size), before env overlays.
+# Subcommands that chain (ingest → extract) reload the config; a cache hit
+# skips re-reading and re-parsing the file.
+_CONFIG_CACHE: dict[tuple[str, int, int], Config] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _config_from_toml(project_dir: Path, toml_path: Path) -> Config:
+    """Build a Config from *toml_path* (no env overlays)."""
+    config = Config(project_dir=project_dir)
+
+    with open(toml_path, "rb") as f:
+        data = tomllib.load(f)
+
+    for path, attr, allowed in _SECTIONS:
+        table = data
+        for part in path:
+            table = table.get(part, {})
+        target = getattr(config, attr)
+        for k, v in table.items():
+            if k in allowed:
+                setattr(target, k, v)
+
+    # [retrieval.manual_ingest] maps onto flat RetrievalConfig fields
+    manual_ingest = data.get("retrieval", {}).get("manual_ingest", {})
+    for k in ("inbox_dir", "processed_dir"):
+        if k in manual_ingest:
+            setattr(config.retrieval, k, manual_ingest[k])
+
+    return config
+
+
 def load_config(project_dir: Path | None = None) -> Config:
     """Load config from litscout.toml in *project_dir*, overlaying env vars for API keys."""
     project_dir = Path(project_dir) if project_dir else Path.cwd()
-    config = Config(project_dir=project_dir)
 
     toml_path = project_dir / "litscout.toml"
-    if toml_path.exists():
-        with open(toml_path, "rb") as f:
-            data = tomllib.load(f)
-
-        # Project section
-        if "project" in data:
-            for k, v in data["project"].items():
-                if hasattr(config.project, k):
-                    setattr(config.project, k, v)
-
-        # APIs section
-        if "apis" in data:
-            for k, v in data["apis"].items():
-                if hasattr(config.apis, k):
-                    setattr(config.apis, k, v)
-
-        # Search defaults
-        if "search" in data and "defaults" in data["search"]:
-            for k, v in data["search"]["defaults"].items():
-                if hasattr(config.search, k):
-                    setattr(config.search, k, v)
-
-        # Retrieval section
-        if "retrieval" in data:
-            for k, v in data["retrieval"].items():
-                if k == "manual_ingest":
-                    if "inbox_dir" in v:
-                        config.retrieval.inbox_dir = v["inbox_dir"]
-                    if "processed_dir" in v:
-                        config.retrieval.processed_dir = v["processed_dir"]
-                elif hasattr(config.retrieval, k):
-                    setattr(config.retrieval, k, v)
-
-        # Extraction section
-        if "extraction" in data:
-            for k, v in data["extraction"].items():
-                if hasattr(config.extraction, k):
-                    setattr(config.extraction, k, v)
+    try:
+        st = os.stat(toml_path)
+    except FileNotFoundError:
+        config = Config(project_dir=project_dir)
+    else:
+        key = (str(toml_path), st.st_mtime_ns, st.st_size)
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(key)
+            if cached is None:
+                cached = _CONFIG_CACHE[key] = _config_from_toml(project_dir, toml_path)
+        # Callers may mutate their Config, so never hand out the cached one
+        config = copy.deepcopy(cached)
 
     # Env var overlays for API keys (override empty or missing toml values)
     for env_var, field_name in _ENV_OVERRIDES.items():
@@ -155,6 +183,9 @@ concurrency = 5
 inbox_dir = "fulltext/inbox/"
 processed_dir = "fulltext/inbox/processed/"
 
+[expand]
+concurrency = 5
+
 [extraction]
 max_tokens_per_doc = 8000
 priority_sections = ["abstract", "introduction", "results", "discussion", "conclusion"]
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import to_json
+
 from litscout.config import Config
 from litscout.models import Paper
 from litscout.utils.dedup import DedupIndex
@@ -17,39 +20,6 @@ from litscout.utils.io import append_papers, load_papers
 logger = logging.getLogger(__name__)
 
 
-def _composite_score(
-    paper: Paper,
-    seed_connections: int,
-    total_seeds: int,
-    max_log_citations: float,
-    min_year: int,
-    max_year: int,
-) -> float:
-    """Compute the composite ranking score for a candidate paper.
-
-    score = citation_normalized * 0.3 + seed_connection_ratio * 0.4
-            + recency * 0.2 + influential_ratio * 0.1
-    """
-    # Citation count normalized (log scale)
-    cc = paper.citation_count or 0
-    log_cc = math.log(cc + 1)
-    citation_norm = log_cc / max_log_citations if max_log_citations > 0 else 0
-
-    # Seed connections ratio
-    seed_ratio = seed_connections / total_seeds if total_seeds > 0 else 0
-
-    # Recency score
-    year = paper.year or min_year
-    year_range = max_year - min_year
-    recency = (year - min_year) / year_range if year_range > 0 else 0.5
-
-    # Influential citation ratio
-    icc = paper.influential_citation_count or 0
-    influential_ratio = icc / (cc + 1)
-
-    return citation_norm * 0.3 + seed_ratio * 0.4 + recency * 0.2 + influential_ratio * 0.1
-
-
 def run_expand(
     config: Config,
     *,
@@ -72,11 +42,6 @@ def run_expand(
     from litscout.api_clients.semantic_scholar import SemanticScholarClient
 
     papers_path = config.project_dir / "papers.jsonl"
-    oalex = OpenAlexClient(
-        email=config.apis.unpaywall_email,
-        api_key=config.apis.openalex_api_key,
-    )
-    s2_client = SemanticScholarClient(api_key=config.apis.semantic_scholar_api_key)
 
     # Load seeds
     all_papers = load_papers(papers_path)
@@ -94,109 +59,134 @@ def run_expand(
 
     logger.info("Expanding from %d seed papers, strategy=%s, depth=%d", len(seeds), strategy, depth)
 
-    current_seeds = seeds
-    all_new_papers: list[Paper] = []
-
-    for d in range(depth):
-        logger.info("Expansion depth %d/%d", d + 1, depth)
-
-        # Track how many seeds each candidate is connected to
-        candidate_connections: dict[str, int] = {}  # paper_id -> count
-        candidate_map: dict[str, Paper] = {}
-
-        # Cap per-seed fetch so we don't make huge requests per paper
-        per_seed_limit = min(max_candidates, 100)
-
-        for seed in current_seeds:
-            # Use DOI for OpenAlex lookups (most seeds come from S2 with DOIs)
-            lookup_id = seed.doi if seed.doi else seed.paper_id
-
-            discovered: list[Paper] = []
-
-            if strategy in ("forward", "both", "all"):
-                try:
-                    fwd = oalex.get_cited_by(lookup_id, max_results=per_seed_limit)
-                    discovered.extend(fwd)
-                    logger.info("Forward citations for %s: %d found", lookup_id, len(fwd))
-                except Exception:
-                    logger.exception("Forward citations failed for %s", lookup_id)
-
-            if strategy in ("backward", "both", "all"):
-                try:
-                    bwd = oalex.get_references(lookup_id, max_results=per_seed_limit)
-                    discovered.extend(bwd)
-                    logger.info("Backward references for %s: %d found", lookup_id, len(bwd))
-                except Exception:
-                    logger.exception("Backward references failed for %s", lookup_id)
-
-            if strategy in ("recommend", "all"):
-                try:
-                    recs = s2_client.get_recommendations([seed.paper_id], max_results=per_seed_limit)
-                    discovered.extend(recs)
-                except Exception:
-                    logger.exception("Recommendations failed for %s", seed.paper_id)
-
-            for paper in discovered:
-                paper.seed_paper_id = seed.paper_id
-                pid = paper.paper_id
-                candidate_connections[pid] = candidate_connections.get(pid, 0) + 1
-                if pid not in candidate_map:
-                    candidate_map[pid] = paper
-
-        # Filter by min citations
-        if min_citation_count > 0:
-            candidate_map = {
-                pid: p for pid, p in candidate_map.items()
-                if (p.citation_count or 0) >= min_citation_count
-            }
-            candidate_connections = {
-                pid: c for pid, c in candidate_connections.items()
-                if pid in candidate_map
-            }
-
-        # Score and rank candidates
-        candidates = list(candidate_map.values())
-        if not candidates:
-            break
-
-        all_citations = [math.log((p.citation_count or 0) + 1) for p in candidates]
-        max_log_cc = max(all_citations) if all_citations else 1.0
-        all_years = [p.year for p in candidates if p.year]
-        min_year = min(all_years) if all_years else 2000
-        max_year = max(all_years) if all_years else 2025
-
-        scored: list[tuple[float, Paper]] = []
-        for paper in candidates:
-            sc = _composite_score(
-                paper,
-                seed_connections=candidate_connections.get(paper.paper_id, 1),
-                total_seeds=len(current_seeds),
-                max_log_citations=max_log_cc,
-                min_year=min_year,
-                max_year=max_year,
-            )
-            scored.append((sc, paper))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        top_candidates = [p for _, p in scored[:max_candidates]]
-
-        # Apply tags to candidates
-        if tags:
-            for paper in top_candidates:
-                for t in tags:
-                    if t not in paper.tags:
-                        paper.tags.append(t)
-
-        # Append to papers.jsonl
-        new_count = append_papers(top_candidates, papers_path)
-        all_new_papers.extend(top_candidates[:new_count])
-
-        logger.info("Depth %d: %d candidates found, %d new papers added",
-                     d + 1, len(candidates), new_count)
-
-        # For next depth, use the top newly discovered papers as seeds
-        if d < depth - 1:
-            current_seeds = top_candidates[:min(10, len(top_candidates))]
+    with (
+        OpenAlexClient(
+            email=config.apis.unpaywall_email,
+            api_key=config.apis.openalex_api_key,
+        ) as oalex,
+        SemanticScholarClient(api_key=config.apis.semantic_scholar_api_key) as s2_client,
+    ):
+        current_seeds = seeds
+        all_new_papers: list[Paper] = []
+
+        for d in range(depth):
+            logger.info("Expansion depth %d/%d", d + 1, depth)
+
+            # Track how many seeds each candidate is connected to
+            candidate_connections: Counter[str] = Counter()  # paper_id -> count
+            candidate_map: dict[str, Paper] = {}
+
+            # Cap per-seed fetch so we don't make huge requests per paper
+            per_seed_limit = min(max_candidates, 100)
+
+            def discover(seed: Paper) -> list[Paper]:
+                # Use DOI for OpenAlex lookups (most seeds come from S2 with DOIs)
+                lookup_id = seed.doi if seed.doi else seed.paper_id
+
+                discovered: list[Paper] = []
+
+                if strategy in ("forward", "both", "all"):
+                    try:
+                        fwd = oalex.get_cited_by(lookup_id, max_results=per_seed_limit)
+                        discovered.extend(fwd)
+                        logger.info("Forward citations for %s: %d found", lookup_id, len(fwd))
+                    except Exception:
+                        logger.exception("Forward citations failed for %s", lookup_id)
+
+                if strategy in ("backward", "both", "all"):
+                    try:
+                        bwd = oalex.get_references(lookup_id, max_results=per_seed_limit)
+                        discovered.extend(bwd)
+                        logger.info("Backward references for %s: %d found", lookup_id, len(bwd))
+                    except Exception:
+                        logger.exception("Backward references failed for %s", lookup_id)
+
+                if strategy in ("recommend", "all"):
+                    try:
+                        recs = s2_client.get_recommendations(
+                            [seed.paper_id], max_results=per_seed_limit
+                        )
+                        discovered.extend(recs)
+                    except Exception:
+                        logger.exception("Recommendations failed for %s", seed.paper_id)
+
+                return discovered
+
+            # Seeds are independent, so their API calls overlap; the per-host rate
+            # limiters inside the clients still pace the actual requests.
+            workers = max(1, min(config.expand.concurrency, len(current_seeds)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                seed_results = list(pool.map(discover, current_seeds))
+
+            # Merge in seed order so attribution does not depend on completion order;
+            # a candidate keeps the first seed that discovered it.
+            for seed, discovered in zip(current_seeds, seed_results):
+                for paper in discovered:
+                    pid = paper.paper_id
+                    candidate_connections[pid] += 1
+                    if candidate_map.setdefault(pid, paper) is paper:
+                        paper.seed_paper_id = seed.paper_id
+
+            # Filter by min citations
+            if min_citation_count > 0:
+                candidate_map = {
+                    pid: p for pid, p in candidate_map.items()
+                    if (p.citation_count or 0) >= min_citation_count
+                }
+
+            # Score and rank candidates
+            candidates = list(candidate_map.values())
+            if not candidates:
+                break
+
+            all_citations = [math.log((p.citation_count or 0) + 1) for p in candidates]
+            max_log_cc = max(all_citations) if all_citations else 1.0
+            all_years = [p.year for p in candidates if p.year]
+            min_year = min(all_years) if all_years else 2000
+            max_year = max(all_years) if all_years else 2025
+
+            # Composite score, inlined with the loop-invariant divisions folded
+            # into per-term weights:
+            #   score = citation_normalized * 0.3 + seed_connection_ratio * 0.4
+            #           + recency * 0.2 + influential_ratio * 0.1
+            total_seeds = len(current_seeds)
+            citation_w = 0.3 / max_log_cc if max_log_cc > 0 else 0.0
+            seed_w = 0.4 / total_seeds if total_seeds > 0 else 0.0
+            year_range = max_year - min_year
+            recency_w = 0.2 / year_range if year_range > 0 else 0.0
+            recency_flat = 0.0 if year_range > 0 else 0.1  # 0.5 * 0.2 when all years match
+
+            scored: list[tuple[float, Paper]] = []
+            for paper, log_cc in zip(candidates, all_citations):
+                cc = paper.citation_count or 0
+                sc = (
+                    log_cc * citation_w
+                    + candidate_connections.get(paper.paper_id, 1) * seed_w
+                    + ((paper.year or min_year) - min_year) * recency_w + recency_flat
+                    + (paper.influential_citation_count or 0) / (cc + 1) * 0.1
+                )
+                scored.append((sc, paper))
+
+            scored.sort(key=lambda x: x[0], reverse=True)
+            top_candidates = [p for _, p in scored[:max_candidates]]
+
+            # Apply tags to candidates
+            if tags:
+                for paper in top_candidates:
+                    for t in tags:
+                        if t not in paper.tags:
+                            paper.tags.append(t)
+
+            # Append to papers.jsonl
+            new_count = append_papers(top_candidates, papers_path)
+            all_new_papers.extend(top_candidates[:new_count])
+
+            logger.info("Depth %d: %d candidates found, %d new papers added",
+                         d + 1, len(candidates), new_count)
+
+            # For next depth, use the top newly discovered papers as seeds
+            if d < depth - 1:
+                current_seeds = top_candidates[:min(10, len(top_candidates))]
 
     # Write expansion log
     expansions_dir = config.project_dir / "expansions"
@@ -214,8 +204,8 @@ def run_expand(
         "candidates_found": len(all_new_papers),
         "new_papers_added": len(all_new_papers),
     }
-    with open(log_path, "a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    with open(log_path, "ab") as f:
+        f.write(to_json(log_entry) + b"\n")
 
     summary = {
         "candidates_found": len(all_new_papers),
@@ -2,47 +2,60 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from tqdm import tqdm
+from pydantic_core import from_json
 
 from litscout.config import Config
 from litscout.models import FulltextStatus, Paper
 from litscout.utils.identifiers import sanitize_for_filename
-from litscout.utils.io import load_papers, update_paper
+from litscout.utils.io import load_papers, update_papers
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_bioc_passages(data: Any) -> Iterator[dict[str, Any]]:
+    """Yield passages from a BioC collection, a list of collections, or a list of documents."""
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        documents = item.get("documents", [item]) if isinstance(item, dict) else []
+        for doc in documents:
+            yield from doc.get("passages", [])
+
+
 def _extract_from_bioc_json(json_path: Path) -> dict[str, str]:
     """Extract sections from a BioC JSON file.
 
     Returns a dict mapping section names to text content.
     """
-    sections: dict[str, str] = {}
+    # Collect passage text per section and join once at the end; repeated
+    # str += is quadratic in section length.
+    chunks: dict[str, list[str]] = defaultdict(list)
     try:
-        data = json.loads(json_path.read_text())
-        documents = data if isinstance(data, list) else data.get("documents", [data])
-        for doc in documents:
-            for passage in doc.get("passages", []):
-                infons = passage.get("infons", {})
-                section_type = (
-                    infons.get("section_type", "")
-                    or infons.get("type", "")
-                    or "body"
-                ).lower()
-                text = passage.get("text", "")
-                if text:
-                    if section_type in sections:
-                        sections[section_type] += "\n" + text
-                    else:
-                        sections[section_type] = text
+        # Parse straight from bytes with pydantic-core's JSON parser, skipping
+        # the intermediate decoded str of a potentially multi-MB file.
+        data = from_json(json_path.read_bytes())
+        for passage in _iter_bioc_passages(data):
+            infons = passage.get("infons", {})
+            section_type = (
+                infons.get("section_type", "")
+                or infons.get("type", "")
+                or "body"
+            ).lower()
+            text = passage.get("text", "")
+            if text:
+                chunks[section_type].append(text)
     except Exception:
         logger.exception("Failed to parse BioC JSON: %s", json_path)
-    return sections
+    return {name: "\n".join(parts) for name, parts in chunks.items()}
 
 
 def _extract_from_pdf(pdf_path: Path) -> str:
@@ -69,19 +82,23 @@ def _truncate_to_tokens(
 
     Returns (truncated_sections, total_tokens, shown_tokens).
     """
-    total_tokens = sum(_estimate_tokens(v) for v in sections.values())
+    # Estimate each section once; the passes below only read these.
+    section_tokens = {key: _estimate_tokens(text) for key, text in sections.items()}
+    total_tokens = sum(section_tokens.values())
     if total_tokens <= max_tokens:
         return sections, total_tokens, total_tokens
 
     # Keep priority sections first
     result: dict[str, str] = {}
     used_tokens = 0
+    lower_keys = [(key, key.lower()) for key in sections]
 
     # Add sections in priority order
     for sec_name in priority:
-        for key, text in sections.items():
-            if sec_name in key.lower() and key not in result:
-                tokens = _estimate_tokens(text)
+        for key, key_lower in lower_keys:
+            if sec_name in key_lower and key not in result:
+                text = sections[key]
+                tokens = section_tokens[key]
                 if used_tokens + tokens <= max_tokens:
                     result[key] = text
                     used_tokens += tokens
@@ -97,7 +114,7 @@ def _truncate_to_tokens(
     # Add any remaining sections that fit
     for key, text in sections.items():
         if key not in result:
-            tokens = _estimate_tokens(text)
+            tokens = section_tokens[key]
             if used_tokens + tokens <= max_tokens:
                 result[key] = text
                 used_tokens += tokens
@@ -142,16 +159,17 @@ def _format_output(
     ]
 
     # Output sections in preferred order
+    lower_keys = [(key, key.lower()) for key in sections]
     output_keys: list[str] = []
+    seen: set[str] = set()
     for pref in section_order:
-        for key in sections:
-            if pref in key.lower() and key not in output_keys:
+        for key, key_lower in lower_keys:
+            if pref in key_lower and key not in seen:
+                seen.add(key)
                 output_keys.append(key)
 
     # Add any remaining sections
-    for key in sections:
-        if key not in output_keys:
-            output_keys.append(key)
+    output_keys.extend(key for key in sections if key not in seen)
 
     for key in output_keys:
         label = key.upper().replace("_", " ")
@@ -164,14 +182,15 @@ def _format_output(
 
 def _extract_one(
     paper: Paper,
-    config: Config,
+    project_dir: Path,
     txt_dir: Path,
     max_tokens: int,
+    priority: list[str],
 ) -> bool:
-    """Extract text from one paper. Returns True on success."""
-    project_dir = config.project_dir
-    priority = config.extraction.priority_sections
+    """Extract text from one paper. Returns True on success.
 
+    Takes only picklable arguments so it can run in a worker process.
+    """
     sections: dict[str, str] = {}
 
     # Prefer structured text (BioC JSON/XML) over PDF
@@ -248,20 +267,62 @@ def run_extract(
     skipped = 0
     errors = 0
 
-    for paper in tqdm(to_extract, desc="Extracting text"):
+    project_dir = config.project_dir
+    priority = config.extraction.priority_sections
+    args = (project_dir, txt_dir, effective_max_tokens, priority)
+
+    # BioC XML/JSON parsing is cheap and stays in-process; PDF conversion is
+    # CPU-bound and is farmed out to a process pool when there is more than one.
+    in_process: list[Paper] = []
+    pdf_only: list[Paper] = []
+    for paper in to_extract:
+        if paper.fulltext_xml_path and (project_dir / paper.fulltext_xml_path).exists():
+            in_process.append(paper)
+        else:
+            pdf_only.append(paper)
+
+    # Registry updates are collected and written in one rewrite after the loop
+    paper_updates: dict[str, dict[str, Any]] = {}
+
+    def record(paper: Paper, run: Callable[[], bool]) -> None:
+        nonlocal extracted, skipped, errors
         try:
-            success = _extract_one(paper, config, txt_dir, effective_max_tokens)
-            if success:
-                identifier = paper.doi or paper.paper_id.replace(":", "_")
-                filename = sanitize_for_filename(identifier) + ".txt"
-                rel_path = f"fulltext/txt/{filename}"
-                update_paper(papers_path, paper.paper_id, {"fulltext_txt_path": rel_path})
-                extracted += 1
-            else:
-                skipped += 1
+            success = run()
         except Exception:
             logger.exception("Extraction failed for %s", paper.paper_id)
             errors += 1
+            return
+        if success:
+            identifier = paper.doi or paper.paper_id.replace(":", "_")
+            filename = sanitize_for_filename(identifier) + ".txt"
+            rel_path = f"fulltext/txt/{filename}"
+            paper_updates[paper.paper_id] = {"fulltext_txt_path": rel_path}
+            extracted += 1
+        else:
+            skipped += 1
+
+    workers = min(os.cpu_count() or 1, len(pdf_only))
+    if workers <= 1:
+        in_process.extend(pdf_only)
+        pdf_only = []
+
+    from tqdm import tqdm
+
+    try:
+        with tqdm(total=len(to_extract), desc="Extracting text") as progress:
+            with ProcessPoolExecutor(max_workers=workers) if pdf_only else nullcontext() as pool:
+                futures: dict[Future[bool], Paper] = {
+                    pool.submit(_extract_one, paper, *args): paper for paper in pdf_only
+                }
+                for paper in in_process:
+                    record(paper, partial(_extract_one, paper, *args))
+                    progress.update()
+                for future in as_completed(futures):
+                    record(futures[future], future.result)
+                    progress.update()
+    finally:
+        # One registry rewrite for the whole run, even if it was interrupted
+        update_papers(papers_path, paper_updates)
 
     logger.info("Extraction complete: %d extracted, %d skipped, %d errors",
                 extracted, skipped, errors)
@@ -3,100 +3,115 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from rapidfuzz import fuzz
-
 from litscout.config import Config
 from litscout.models import FulltextSource, FulltextStatus, Paper, RetrievalLogEntry
 from litscout.utils.identifiers import extract_doi_from_string, normalize_doi, sanitize_for_filename
-from litscout.utils.io import generate_manual_list, load_papers, update_paper
+from litscout.utils.io import generate_manual_list, load_papers, update_papers
 
 logger = logging.getLogger(__name__)
 
 
-def _extract_pdf_title(pdf_path: Path) -> str | None:
-    """Extract title from PDF metadata."""
+def _extract_pdf_title_and_first_page(pdf_path: Path) -> tuple[str | None, str | None]:
+    """Extract the metadata title and first-page text from a PDF.
+
+    The document is opened once for both. Either value is None when
+    unavailable or when the PDF cannot be read.
+    """
     try:
         import pymupdf
         doc = pymupdf.open(str(pdf_path))
-        metadata = doc.metadata
-        doc.close()
-        title = metadata.get("title", "").strip() if metadata else ""
-        return title if title and len(title) > 5 else None
     except Exception:
-        return None
+        return None, None
 
-
-def _extract_first_page_text(pdf_path: Path) -> str | None:
-    """Extract text from the first page of a PDF."""
+    title: str | None = None
+    text: str | None = None
     try:
-        import pymupdf
-        doc = pymupdf.open(str(pdf_path))
+        metadata = doc.metadata
+        raw_title = metadata.get("title", "").strip() if metadata else ""
+        title = raw_title if raw_title and len(raw_title) > 5 else None
         if doc.page_count > 0:
-            text = doc[0].get_text().strip()
-            doc.close()
-            return text if text else None
-        doc.close()
+            text = doc[0].get_text().strip() or None
     except Exception:
         pass
-    return None
+    finally:
+        doc.close()
+    return title, text
 
 
-def _match_by_filename(filename: str, papers: list[Paper]) -> Paper | None:
+def _build_doi_index(papers: list[Paper]) -> dict[str, Paper]:
+    """Map normalized DOI → paper; the first paper with a given DOI wins."""
+    index: dict[str, Paper] = {}
+    for paper in papers:
+        if doi := normalize_doi(paper.doi):
+            index.setdefault(doi, paper)
+    return index
+
+
+def _match_by_filename(filename: str, doi_index: dict[str, Paper]) -> Paper | None:
     """Try to match a PDF filename to a paper by DOI in the filename."""
     doi = extract_doi_from_string(filename)
     if not doi:
         return None
-    for paper in papers:
-        if paper.doi and normalize_doi(paper.doi) == doi:
-            return paper
-    return None
+    return doi_index.get(doi)
 
 
-def _match_by_pdf_title(pdf_path: Path, papers: list[Paper]) -> tuple[Paper | None, float]:
-    """Try to match via PDF metadata title. Returns (paper, score)."""
-    pdf_title = _extract_pdf_title(pdf_path)
+def _match_by_pdf_title(
+    pdf_title: str | None, papers: list[Paper], titles_lower: list[str]
+) -> tuple[Paper | None, float]:
+    """Try to match via PDF metadata title. Returns (paper, score).
+
+    *titles_lower* holds the lowercased title of each entry in *papers*.
+    """
     if not pdf_title:
         return None, 0.0
 
-    best_match: Paper | None = None
-    best_score = 0.0
-    for paper in papers:
-        score = fuzz.ratio(pdf_title.lower(), paper.title.lower())
-        if score > best_score:
-            best_score = score
-            best_match = paper
+    from rapidfuzz import fuzz, process
+
+    # One C-level sweep over all titles; candidates under the cutoff are pruned early
+    best = process.extractOne(
+        pdf_title.lower(), titles_lower, scorer=fuzz.ratio, processor=None, score_cutoff=85,
+    )
+    if best is None:
+        return None, 0.0
+    _, score, idx = best
+    if score > 85:
+        return papers[idx], score
+    return None, score
 
-    if best_score > 85:
-        return best_match, best_score
-    return None, best_score
 
+def _match_by_first_page(
+    text: str | None, papers: list[Paper], titles_lower: list[str]
+) -> tuple[Paper | None, float]:
+    """Try to match via first-page text content. Returns (paper, score).
 
-def _match_by_first_page(pdf_path: Path, papers: list[Paper]) -> tuple[Paper | None, float]:
-    """Try to match via first-page text content. Returns (paper, score)."""
-    text = _extract_first_page_text(pdf_path)
+    *titles_lower* holds the lowercased title of each entry in *papers*.
+    """
     if not text:
         return None, 0.0
 
-    text_lower = text.lower()
-    best_match: Paper | None = None
-    best_score = 0.0
+    from rapidfuzz import fuzz, process
 
-    for paper in papers:
-        if paper.title.lower() in text_lower:
+    text_lower = text.lower()
+    for paper, title_lower in zip(papers, titles_lower):
+        if title_lower and title_lower in text_lower:
             return paper, 100.0
-        score = fuzz.partial_ratio(paper.title.lower(), text_lower)
-        if score > best_score:
-            best_score = score
-            best_match = paper
 
-    if best_score > 90:
-        return best_match, best_score
-    return None, best_score
+    # Fuzzy fallback in a single C-level sweep that prunes below the cutoff
+    best = process.extractOne(
+        text_lower, titles_lower, scorer=fuzz.partial_ratio, processor=None, score_cutoff=90,
+    )
+    if best is None:
+        return None, 0.0
+    _, score, idx = best
+    if score > 90:
+        return papers[idx], score
+    return None, score
 
 
 def run_ingest(
@@ -120,7 +135,11 @@ def run_ingest(
     pdf_dir.mkdir(parents=True, exist_ok=True)
 
     # Find PDFs in inbox
-    pdfs = sorted(inbox_dir.glob("*.pdf"))
+    with os.scandir(inbox_dir) as entries:
+        pdfs = sorted(
+            Path(e.path) for e in entries
+            if e.name.endswith(".pdf") and e.is_file()
+        )
     if not pdfs:
         logger.info("No PDFs found in inbox")
         return {"ingested": 0, "unmatched": 0, "still_pending": 0}
@@ -131,88 +150,111 @@ def run_ingest(
     all_papers = load_papers(papers_path)
     manual_papers = [p for p in all_papers if p.needs_manual_retrieval]
 
+    # Built once per run rather than rescanned / re-lowercased for every PDF
+    doi_index = _build_doi_index(all_papers)
+    candidates = manual_papers or all_papers
+    titles_lower = [(p.title or "").lower() for p in candidates]
+
     ingested = 0
     unmatched = 0
+    # Registry updates and log lines are collected and written once after the loop
+    paper_updates: dict[str, dict[str, Any]] = {}
+    log_lines: list[str] = []
 
-    for pdf_path in pdfs:
-        filename = pdf_path.name
-        match: Paper | None = None
-        method = ""
-
-        # Strategy 1: filename match
-        match = _match_by_filename(filename, all_papers)
-        if match:
-            method = "filename"
+    try:
+        for pdf_path in pdfs:
+            filename = pdf_path.name
+            match: Paper | None = None
+            method = ""
 
-        # Strategy 2: PDF metadata title
-        if not match:
-            match, score = _match_by_pdf_title(pdf_path, manual_papers or all_papers)
+            # Strategy 1: filename match
+            match = _match_by_filename(filename, doi_index)
             if match:
-                method = f"pdf_metadata (score={score:.0f})"
+                method = "filename"
 
-        # Strategy 3: first-page text
-        if not match:
-            match, score = _match_by_first_page(pdf_path, manual_papers or all_papers)
-            if match:
-                method = f"first_page_text (score={score:.0f})"
+            # Strategies 2 and 3 read the PDF; open it once for both
+            if not match:
+                pdf_title, first_page = _extract_pdf_title_and_first_page(pdf_path)
 
-        if match:
-            logger.info("  %s -> matched by %s", filename, method)
-            logger.info("    %s (%s)", match.title[:60], match.year)
+            # Strategy 2: PDF metadata title
+            if not match:
+                match, score = _match_by_pdf_title(pdf_title, candidates, titles_lower)
+                if match:
+                    method = f"pdf_metadata (score={score:.0f})"
 
-            if dry_run:
+            # Strategy 3: first-page text
+            if not match:
+                match, score = _match_by_first_page(first_page, candidates, titles_lower)
+                if match:
+                    method = f"first_page_text (score={score:.0f})"
+
+            if match:
+                logger.info("  %s -> matched by %s", filename, method)
+                logger.info("    %s (%s)", match.title[:60], match.year)
+
+                if dry_run:
+                    ingested += 1
+                    continue
+
+                # Copy to fulltext/pdf/
+                identifier = match.doi or match.paper_id.replace(":", "_")
+                dest_filename = sanitize_for_filename(identifier) + ".pdf"
+                dest_path = pdf_dir / dest_filename
+                shutil.copy2(pdf_path, dest_path)
+
+                # Update paper record
+                rel_path = str(dest_path.relative_to(config.project_dir))
+                paper_updates.setdefault(match.paper_id, {}).update({
+                    "fulltext_pdf_path": rel_path,
+                    "fulltext_status": FulltextStatus.MANUAL_RETRIEVED,
+                    "fulltext_source": FulltextSource.MANUAL,
+                    "needs_manual_retrieval": False,
+                })
+
+                # Log
+                entry = RetrievalLogEntry(
+                    doi=match.doi,
+                    paper_id=match.paper_id,
+                    timestamp=datetime.now(timezone.utc).isoformat() + "Z",
+                    format_attempted="pdf",
+                    source_attempted="manual",
+                    url_attempted=None,
+                    status="success",
+                    file_path=rel_path,
+                    file_size_bytes=dest_path.stat().st_size,
+                    content_type="application/pdf",
+                )
+                log_lines.append(entry.model_dump_json())
+
+                # Move original to processed
+                shutil.move(str(pdf_path), str(processed_dir / filename))
                 ingested += 1
-                continue
-
-            # Copy to fulltext/pdf/
-            identifier = match.doi or match.paper_id.replace(":", "_")
-            dest_filename = sanitize_for_filename(identifier) + ".pdf"
-            dest_path = pdf_dir / dest_filename
-            shutil.copy2(pdf_path, dest_path)
-
-            # Update paper record
-            rel_path = str(dest_path.relative_to(config.project_dir))
-            update_paper(papers_path, match.paper_id, {
-                "fulltext_pdf_path": rel_path,
-                "fulltext_status": FulltextStatus.MANUAL_RETRIEVED,
-                "fulltext_source": FulltextSource.MANUAL,
-                "needs_manual_retrieval": False,
-            })
-
-            # Log
-            entry = RetrievalLogEntry(
-                doi=match.doi,
-                paper_id=match.paper_id,
-                timestamp=datetime.now(timezone.utc).isoformat() + "Z",
-                format_attempted="pdf",
-                source_attempted="manual",
-                url_attempted=None,
-                status="success",
-                file_path=rel_path,
-                file_size_bytes=dest_path.stat().st_size,
-                content_type="application/pdf",
-            )
+            else:
+                # Find closest candidate for reporting
+                closest_name = ""
+                closest_score = 0.0
+                from rapidfuzz import fuzz, process
+
+                closest = process.extractOne(
+                    filename.lower(), titles_lower, scorer=fuzz.ratio, processor=None,
+                )
+                if closest is not None and closest[1] > 0:
+                    closest_score = closest[1]
+                    closest_name = candidates[closest[2]].title or ""
+
+                logger.warning("  %s -> no confident match found", filename)
+                if closest_name:
+                    logger.warning("    Closest candidate (score %.0f): %s — skipped",
+                                   closest_score, closest_name[:60])
+                unmatched += 1
+    finally:
+        # Flush even if a later PDF fails, so files already moved to processed/
+        # are reflected in the registry and log.
+        if paper_updates:
+            update_papers(papers_path, paper_updates)
+        if log_lines:
             with open(log_path, "a") as f:
-                f.write(entry.model_dump_json() + "\n")
-
-            # Move original to processed
-            shutil.move(str(pdf_path), str(processed_dir / filename))
-            ingested += 1
-        else:
-            # Find closest candidate for reporting
-            closest_name = ""
-            closest_score = 0.0
-            for p in manual_papers or all_papers:
-                score = fuzz.ratio(filename.lower(), (p.title or "").lower())
-                if score > closest_score:
-                    closest_score = score
-                    closest_name = p.title or ""
-
-            logger.warning("  %s -> no confident match found", filename)
-            if closest_name:
-                logger.warning("    Closest candidate (score %.0f): %s — skipped",
-                               closest_score, closest_name[:60])
-            unmatched += 1
+                f.write("\n".join(log_lines) + "\n")
 
     # Regenerate manual retrieval list
     if not dry_run:
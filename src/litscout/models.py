@@ -30,6 +30,7 @@ class FulltextSource(StrEnum):
     UNPAYWALL = "unpaywall"
     PMC_BIOC = "pmc_bioc"
     BIORXIV = "biorxiv"
+    ARXIV = "arxiv"
     PUBLISHER_OA = "publisher_oa"
     MANUAL = "manual"
 
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 from typing import Any
 
-from tqdm import tqdm
-
 from litscout.config import Config
 from litscout.models import Paper
 from litscout.utils.io import load_papers, update_paper
@@ -15,73 +14,181 @@ from litscout.utils.io import load_papers, update_paper
 logger = logging.getLogger(__name__)
 
 
-def _bibliometric_score(paper: Paper, max_log_citations: float, min_year: int, max_year: int) -> float:
-    """Compute a bibliometric score from citation count and recency.
+_ANTHROPIC_URL = "https://api.anthropic.com/v1"
+_ANTHROPIC_VERSION = "2023-06-01"
+_LLM_MODEL = "claude-haiku-4-5-20251001"
+_RELEVANCE_SYSTEM = (
+    "You are a research relevance scorer. Given a research focus and a paper, "
+    "rate the paper's relevance on a scale of 0 to 10, where 0 means completely "
+    "irrelevant and 10 means directly addresses the research focus. "
+    "Respond with ONLY a single integer from 0 to 10, nothing else."
+)
+# Batch status polling backs off from 5 s up to this cap
+_BATCH_POLL_MAX = 60.0
+# Longest wait for a batch to end before it is cancelled and the papers are
+# scored directly instead
+_BATCH_MAX_WAIT = 3600.0
+# Direct (non-batch) scoring: in-flight cap and rate (50 RPM, the lowest API tier)
+_LLM_MAX_CONCURRENCY = 8
+_LLM_REQUESTS_PER_SECOND = 50 / 60
+
+
+def _anthropic_headers(api_key: str) -> dict[str, str]:
+    return {
+        "x-api-key": api_key,
+        "anthropic-version": _ANTHROPIC_VERSION,
+        "content-type": "application/json",
+    }
+
+
+def _relevance_params(paper: Paper, prompt: str) -> dict[str, Any]:
+    """Build the Messages API parameters for scoring one paper."""
+    paper_text = f"Title: {paper.title}"
+    if paper.abstract:
+        paper_text += f"\nAbstract: {paper.abstract}"
+    if paper.year:
+        paper_text += f"\nYear: {paper.year}"
+    if paper.venue or paper.journal_name:
+        paper_text += f"\nVenue: {paper.venue or paper.journal_name}"
+
+    user_msg = f"Research focus: {prompt}\n\n---\n\n{paper_text}"
+    return {
+        "model": _LLM_MODEL,
+        "max_tokens": 8,
+        "system": _RELEVANCE_SYSTEM,
+        "messages": [{"role": "user", "content": user_msg}],
+    }
 
-    score = citation_normalized * 0.6 + recency * 0.3 + influential_ratio * 0.1
-    """
-    cc = paper.citation_count or 0
-    log_cc = math.log(cc + 1)
-    citation_norm = log_cc / max_log_citations if max_log_citations > 0 else 0
 
-    year = paper.year or min_year
-    year_range = max_year - min_year
-    recency = (year - min_year) / year_range if year_range > 0 else 0.5
+def _parse_relevance(message: dict[str, Any]) -> float:
+    """Turn a Messages API response body into a 0.0–1.0 score."""
+    score = int(message["content"][0]["text"].strip())
+    return max(0.0, min(1.0, score / 10.0))
 
-    icc = paper.influential_citation_count or 0
-    influential_ratio = icc / (cc + 1)
 
-    return citation_norm * 0.6 + recency * 0.3 + influential_ratio * 0.1
+def _relevance_cache_key(params: dict[str, Any]) -> str:
+    """Cache key covering the model, system prompt, research focus and paper text."""
+    from pydantic_core import to_json
 
+    return to_json(params).decode()
 
-def _llm_relevance_score(paper: Paper, prompt: str, api_key: str) -> float:
-    """Score a paper's relevance to a research prompt using an LLM.
 
-    Returns a score from 0.0 to 1.0.
+async def _llm_relevance_score_async(client: Any, request: dict[str, Any]) -> float | None:
+    """Score one request (``custom_id`` + Messages ``params``) using an LLM.
+
+    *client* is an ``httpx.AsyncClient`` carrying the API headers.
+    Returns a score from 0.0 to 1.0, or None if the call failed.
     """
     import httpx
 
-    paper_text = f"Title: {paper.title}"
-    if paper.abstract:
-        paper_text += f"\nAbstract: {paper.abstract}"
-    if paper.year:
-        paper_text += f"\nYear: {paper.year}"
-    if paper.venue or paper.journal_name:
-        paper_text += f"\nVenue: {paper.venue or paper.journal_name}"
+    try:
+        resp = await client.post(f"{_ANTHROPIC_URL}/messages", json=request["params"])
+        resp.raise_for_status()
+        return _parse_relevance(resp.json())
+    except (ValueError, KeyError, httpx.HTTPError) as e:
+        logger.warning("LLM scoring failed for %s: %s", request["custom_id"], e)
+        return None
+
 
-    system_msg = (
-        "You are a research relevance scorer. Given a research focus and a paper, "
-        "rate the paper's relevance on a scale of 0 to 10, where 0 means completely "
-        "irrelevant and 10 means directly addresses the research focus. "
-        "Respond with ONLY a single integer from 0 to 10, nothing else."
+async def _llm_relevance_scores(requests: list[dict[str, Any]], api_key: str) -> dict[str, float]:
+    """Score *requests* with concurrent Messages API calls.
+
+    At most ``_LLM_MAX_CONCURRENCY`` requests are in flight, and a shared
+    token bucket keeps the request rate under the API's per-minute limit.
+    Returns custom_id → score for the requests that succeeded.
+    """
+    import httpx
+    from tqdm.asyncio import tqdm_asyncio
+
+    from litscout.utils.rate_limiter import RateLimiter
+
+    limiter = RateLimiter.for_host(
+        "api.anthropic.com", _LLM_REQUESTS_PER_SECOND, capacity=_LLM_MAX_CONCURRENCY
     )
+    semaphore = asyncio.Semaphore(_LLM_MAX_CONCURRENCY)
+    limits = httpx.Limits(max_connections=_LLM_MAX_CONCURRENCY,
+                          max_keepalive_connections=_LLM_MAX_CONCURRENCY)
+
+    async with httpx.AsyncClient(
+        headers=_anthropic_headers(api_key), timeout=15.0, limits=limits,
+    ) as client:
+        async def score(request: dict[str, Any]) -> float | None:
+            async with semaphore:
+                await limiter.acquire_async()
+                return await _llm_relevance_score_async(client, request)
+
+        results = await tqdm_asyncio.gather(
+            *(score(r) for r in requests), desc="LLM scoring"
+        )
+    return {r["custom_id"]: sc for r, sc in zip(requests, results) if sc is not None}
 
-    user_msg = f"Research focus: {prompt}\n\n---\n\n{paper_text}"
+
+def _cancel_batch(client: Any, batch_id: str) -> None:
+    """Ask the API to cancel *batch_id*; failures are only logged."""
+    import httpx
 
     try:
-        resp = httpx.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": "claude-haiku-4-5-20251001",
-                "max_tokens": 8,
-                "system": system_msg,
-                "messages": [{"role": "user", "content": user_msg}],
-            },
-            timeout=15.0,
-        )
+        client.post(f"/messages/batches/{batch_id}/cancel").raise_for_status()
+        logger.info("Cancelled LLM scoring batch %s", batch_id)
+    except httpx.HTTPError as e:
+        logger.warning("Could not cancel LLM scoring batch %s: %s", batch_id, e)
+
+
+def _submit_relevance_batch(requests: list[dict[str, Any]], api_key: str) -> dict[str, float]:
+    """Score papers through the Message Batches API.
+
+    Submits all *requests* at once, polls until the batch has ended, and
+    returns custom_id → score for the requests that succeeded. Raises
+    ``httpx.HTTPError`` if the API cannot be reached or rejects the batch,
+    and ``TimeoutError`` if it has not ended within ``_BATCH_MAX_WAIT``
+    seconds. A batch abandoned by either, or by Ctrl-C, is cancelled.
+    """
+    import time
+
+    import httpx
+    from pydantic_core import from_json
+
+    headers = _anthropic_headers(api_key)
+    with httpx.Client(base_url=_ANTHROPIC_URL, headers=headers, timeout=60.0) as client:
+        resp = client.post("/messages/batches", json={"requests": requests})
         resp.raise_for_status()
-        data = resp.json()
-        text = data["content"][0]["text"].strip()
-        score = int(text)
-        return max(0.0, min(1.0, score / 10.0))
-    except (ValueError, KeyError, httpx.HTTPError) as e:
-        logger.warning("LLM scoring failed for %s: %s", paper.paper_id, e)
-        return 0.5  # neutral fallback
+        batch = resp.json()
+        logger.info("Submitted LLM scoring batch %s (%d requests)", batch["id"], len(requests))
+
+        deadline = time.monotonic() + _BATCH_MAX_WAIT
+        delay = 5.0
+        try:
+            while batch["processing_status"] != "ended":
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"batch {batch['id']} did not end within {_BATCH_MAX_WAIT:.0f} s"
+                    )
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, _BATCH_POLL_MAX)
+                resp = client.get(f"/messages/batches/{batch['id']}")
+                resp.raise_for_status()
+                batch = resp.json()
+        except BaseException:
+            _cancel_batch(client, batch["id"])
+            raise
+
+        scores: dict[str, float] = {}
+        with client.stream("GET", batch["results_url"]) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line.strip():
+                    continue
+                item = from_json(line)
+                result = item.get("result", {})
+                if result.get("type") != "succeeded":
+                    logger.warning("LLM scoring %s: %s", item.get("custom_id"), result.get("type"))
+                    continue
+                try:
+                    scores[item["custom_id"]] = _parse_relevance(result["message"])
+                except (ValueError, KeyError, IndexError) as e:
+                    logger.warning("LLM scoring %s: unparseable reply (%s)", item.get("custom_id"), e)
+    return scores
 
 
 def run_rank(
@@ -121,12 +228,14 @@ def run_rank(
     papers_path = config.project_dir / "papers.jsonl"
     all_papers = load_papers(papers_path)
 
-    # Apply filters
+    # Apply filters in a single pass
     papers = all_papers
-    if filter_tag:
-        papers = [p for p in papers if filter_tag in p.tags]
-    if filter_method:
-        papers = [p for p in papers if p.discovery_method == filter_method]
+    if filter_tag or filter_method:
+        papers = [
+            p for p in all_papers
+            if (not filter_tag or filter_tag in p.tags)
+            and (not filter_method or p.discovery_method == filter_method)
+        ]
 
     if not papers:
         logger.warning("No papers match the filters")
@@ -139,26 +248,68 @@ def run_rank(
     min_year = min(all_years) if all_years else 2000
     max_year = max(all_years) if all_years else 2025
 
+    # Bibliometric score, with the loop-invariant divisions folded into weights:
+    #   score = citation_normalized * 0.6 + recency * 0.3 + influential_ratio * 0.1
+    citation_w = 0.6 / max_log_cc if max_log_cc > 0 else 0.0
+    year_range = max_year - min_year
+    recency_w = 0.3 / year_range if year_range > 0 else 0.0
+    recency_flat = 0.0 if year_range > 0 else 0.15  # 0.5 * 0.3 when all years match
+
     bib_scores: dict[str, float] = {}
-    for paper in papers:
-        bib_scores[paper.paper_id] = _bibliometric_score(paper, max_log_cc, min_year, max_year)
+    for paper, log_cc in zip(papers, all_citations):
+        bib_scores[paper.paper_id] = (
+            log_cc * citation_w
+            + ((paper.year or min_year) - min_year) * recency_w + recency_flat
+            + (paper.influential_citation_count or 0) / ((paper.citation_count or 0) + 1) * 0.1
+        )
 
     # LLM relevance scoring (optional)
     llm_scores: dict[str, float] = {}
+    use_llm = False
     if relevance_prompt:
         api_key = os.environ.get("ANTHROPIC_API_KEY", "")
         if not api_key:
             logger.error("ANTHROPIC_API_KEY not set — skipping LLM scoring")
         else:
-            logger.info("Scoring %d papers with LLM relevance prompt", len(papers))
-            for paper in tqdm(papers, desc="LLM scoring"):
-                llm_scores[paper.paper_id] = _llm_relevance_score(paper, relevance_prompt, api_key)
-
-    # Combine scores
+            import httpx
+
+            from litscout.utils import work_cache
+
+            use_llm = True
+
+            # Scores are cached by the exact request, so re-ranking with an
+            # unchanged prompt only pays for new or edited papers.
+            params = [_relevance_params(paper, relevance_prompt) for paper in papers]
+            keys = [_relevance_cache_key(pr) for pr in params]
+            # Batch custom_ids must match [A-Za-z0-9_-]{1,64}, which paper_ids
+            # such as "s2:..." do not, so requests are keyed by position.
+            requests: list[dict[str, Any]] = []
+            for i, (paper, key) in enumerate(zip(papers, keys)):
+                cached = work_cache.get(key, namespace="llm_relevance")
+                if cached is not None:
+                    llm_scores[paper.paper_id] = cached["score"]
+                else:
+                    requests.append({"custom_id": f"p{i}", "params": params[i]})
+
+            logger.info("Scoring %d papers with LLM relevance prompt (%d cached)",
+                        len(requests), len(papers) - len(requests))
+            if requests:
+                try:
+                    new_scores = _submit_relevance_batch(requests, api_key)
+                except (httpx.HTTPError, TimeoutError) as e:
+                    logger.warning("LLM batch scoring failed (%s); scoring papers directly", e)
+                    new_scores = asyncio.run(_llm_relevance_scores(requests, api_key))
+                for custom_id, score in new_scores.items():
+                    i = int(custom_id[1:])
+                    llm_scores[papers[i].paper_id] = score
+                    work_cache.put(keys[i], {"score": score}, namespace="llm_relevance")
+
+    # Combine scores; papers whose LLM call failed get a neutral 0.5, so every
+    # LLM-scored run stays on the same scale even if all calls failed
     scored: list[tuple[float, Paper]] = []
     for paper in papers:
         bib = bib_scores[paper.paper_id]
-        if llm_scores:
+        if use_llm:
             llm = llm_scores.get(paper.paper_id, 0.5)
             combined = (1.0 - relevance_weight) * bib + relevance_weight * llm
         else:
@@ -2,84 +2,100 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+import os
 from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json, to_json
+
 from litscout.config import Config
 from litscout.models import Paper
-from litscout.utils.io import load_papers
+from litscout.utils.io import file_stamp, iter_paper_records, record_getter
 
 logger = logging.getLogger(__name__)
 
+# Length of the top-cited and most-recent lists
+_TOP_N = 20
+
 
-def _year_histogram(papers: list[Paper], width: int = 40) -> str:
-    """Generate a text-based year distribution histogram."""
-    years = [p.year for p in papers if p.year]
-    if not years:
+def _year_histogram(counter: Counter[int], width: int = 40) -> str:
+    """Generate a text-based year distribution histogram from per-year counts."""
+    if not counter:
         return "  No year data available"
 
-    counter = Counter(years)
     min_year = min(counter)
     max_year = max(counter)
     max_count = max(counter.values())
 
-    lines: list[str] = []
-    for year in range(min_year, max_year + 1):
-        count = counter.get(year, 0)
-        bar_len = int(count / max_count * width) if max_count > 0 else 0
-        bar = "#" * bar_len
-        lines.append(f"  {year} | {bar} ({count})")
+    # Bar length is floor(count / max_count * width), in integer arithmetic
+    lines = [
+        f"  {year} | {'#' * (count * width // max_count)} ({count})"
+        for year in range(min_year, max_year + 1)
+        for count in (counter.get(year, 0),)
+    ]
     return "\n".join(lines)
 
 
-def _build_stats(papers: list[Paper]) -> dict[str, Any]:
-    """Build comprehensive corpus statistics."""
-    total = len(papers)
-
-    # Discovery method breakdown
-    method_counts = Counter(p.discovery_method for p in papers)
+def _push_top(
+    heap: list[tuple[Any, int, dict[str, Any]]], entry: tuple[Any, int, dict[str, Any]]
+) -> None:
+    """Keep the _TOP_N largest entries in the min-heap *heap*."""
+    if len(heap) < _TOP_N:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
 
-    # Fulltext status breakdown
-    status_counts = Counter(p.fulltext_status for p in papers)
 
-    # Papers with extracted text
-    has_txt = sum(1 for p in papers if p.fulltext_txt_path)
-    has_pdf = sum(1 for p in papers if p.fulltext_pdf_path)
-    has_xml = sum(1 for p in papers if p.fulltext_xml_path)
-    needs_manual = sum(1 for p in papers if p.needs_manual_retrieval)
+def _build_stats(records: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Build comprehensive corpus statistics in a single pass over *records*.
 
-    # Fulltext source breakdown
-    source_counts = Counter(p.fulltext_source for p in papers if p.fulltext_source)
-
-    # Top venues
-    venue_counts = Counter(p.venue or p.journal_name for p in papers if p.venue or p.journal_name)
-    top_venues = venue_counts.most_common(10)
-
-    # Tag distribution
+    *records* are decoded registry lines. Only counters and the bounded top
+    lists are kept, so they can be a stream that is never held in memory as
+    a whole, and only the papers in the top lists are validated into Paper.
+    """
+    total = 0
+    method_counts: Counter[str] = Counter()
+    status_counts: Counter[str] = Counter()
+    source_counts: Counter[str] = Counter()
+    venue_counts: Counter[str] = Counter()
     tag_counts: Counter[str] = Counter()
-    for p in papers:
-        for tag in p.tags:
-            tag_counts[tag] += 1
-
-    # Top cited papers
-    cited_papers = sorted(
-        [p for p in papers if p.citation_count is not None],
-        key=lambda p: p.citation_count or 0,
-        reverse=True,
-    )
-
-    # Most recent papers
-    recent_papers = sorted(
-        [p for p in papers if p.year],
-        key=lambda p: (p.year or 0, p.citation_count or 0),
-        reverse=True,
-    )
-
-    # Citation stats
-    citations = [p.citation_count for p in papers if p.citation_count is not None]
-    avg_citations = sum(citations) / len(citations) if citations else 0
+    year_counts: Counter[int] = Counter()
+    has_txt = has_pdf = has_xml = needs_manual = 0
+    # Bounded min-heaps of the best _TOP_N entries seen so far. The negated
+    # index breaks ties in favour of earlier papers, like a stable sort would.
+    top_cited: list[tuple[int, int, dict[str, Any]]] = []
+    most_recent: list[tuple[tuple[int, int], int, dict[str, Any]]] = []
+    cited_count = 0
+    citation_total = 0
+
+    for i, r in enumerate(records):
+        # Fields a line omits read as Paper's defaults, as they would once validated
+        get = record_getter(r)
+        total += 1
+        method_counts[get("discovery_method")] += 1
+        status_counts[get("fulltext_status")] += 1
+        has_txt += bool(get("fulltext_txt_path"))
+        has_pdf += bool(get("fulltext_pdf_path"))
+        has_xml += bool(get("fulltext_xml_path"))
+        needs_manual += bool(get("needs_manual_retrieval"))
+        if source := get("fulltext_source"):
+            source_counts[source] += 1
+        if venue := get("venue") or get("journal_name"):
+            venue_counts[venue] += 1
+        tag_counts.update(get("tags") or ())
+        citation_count = get("citation_count")
+        if citation_count is not None:
+            cited_count += 1
+            citation_total += citation_count
+            _push_top(top_cited, (citation_count, -i, r))
+        if year := get("year"):
+            year_counts[year] += 1
+            _push_top(most_recent, ((year, citation_count or 0), -i, r))
 
     return {
         "total": total,
@@ -90,15 +106,16 @@ def _build_stats(papers: list[Paper]) -> dict[str, Any]:
         "has_xml": has_xml,
         "needs_manual": needs_manual,
         "source_counts": dict(source_counts),
-        "top_venues": top_venues,
+        "top_venues": venue_counts.most_common(10),
         "tag_counts": dict(tag_counts),
-        "top_cited": cited_papers[:20],
-        "most_recent": recent_papers[:20],
-        "avg_citations": avg_citations,
+        "year_counts": year_counts,
+        "top_cited": [Paper.model_validate(r) for *_, r in sorted(top_cited, reverse=True)],
+        "most_recent": [Paper.model_validate(r) for *_, r in sorted(most_recent, reverse=True)],
+        "avg_citations": citation_total / cited_count if cited_count else 0,
     }
 
 
-def _format_text(stats: dict[str, Any], papers: list[Paper]) -> str:
+def _format_text(stats: dict[str, Any]) -> str:
     """Format stats as plain text."""
     lines: list[str] = []
 
@@ -136,7 +153,7 @@ def _format_text(stats: dict[str, Any], papers: list[Paper]) -> str:
 
     # Year distribution
     lines.append("Year distribution:")
-    lines.append(_year_histogram(papers))
+    lines.append(_year_histogram(stats["year_counts"]))
     lines.append("")
 
     # Top venues
@@ -174,7 +191,7 @@ def _format_text(stats: dict[str, Any], papers: list[Paper]) -> str:
     return "\n".join(lines)
 
 
-def _format_markdown(stats: dict[str, Any], papers: list[Paper]) -> str:
+def _format_markdown(stats: dict[str, Any]) -> str:
     """Format stats as markdown."""
     lines: list[str] = []
 
@@ -207,7 +224,7 @@ def _format_markdown(stats: dict[str, Any], papers: list[Paper]) -> str:
     lines.append("## Year Distribution")
     lines.append("")
     lines.append("```")
-    lines.append(_year_histogram(papers))
+    lines.append(_year_histogram(stats["year_counts"]))
     lines.append("```")
     lines.append("")
 
@@ -234,22 +251,17 @@ def _format_markdown(stats: dict[str, Any], papers: list[Paper]) -> str:
     return "\n".join(lines)
 
 
-def run_report(config: Config, *, fmt: str = "text") -> str:
-    """Generate a corpus summary report.
-
-    Returns the report as a string.
-    """
-    papers_path = config.project_dir / "papers.jsonl"
-    papers = load_papers(papers_path)
-
-    if not papers:
+def _render_report(stats: dict[str, Any], fmt: str) -> str:
+    """Render *stats* as a report in *fmt*."""
+    if not stats["total"]:
         return "No papers in corpus. Run `litscout search` to add papers."
 
-    stats = _build_stats(papers)
-
     if fmt == "json":
         # Serialize non-Paper fields
-        json_stats = {k: v for k, v in stats.items() if k not in ("top_cited", "most_recent")}
+        json_stats = {
+            k: v for k, v in stats.items()
+            if k not in ("top_cited", "most_recent", "year_counts")
+        }
         json_stats["top_cited"] = [
             {"title": p.title, "year": p.year, "doi": p.doi, "citations": p.citation_count}
             for p in stats["top_cited"][:20]
@@ -258,8 +270,64 @@ def run_report(config: Config, *, fmt: str = "text") -> str:
             {"title": p.title, "year": p.year, "doi": p.doi}
             for p in stats["most_recent"][:20]
         ]
+        # stdlib json keeps the output ASCII-only (non-ASCII text \uXXXX-escaped)
         return json.dumps(json_stats, indent=2)
     elif fmt == "markdown":
-        return _format_markdown(stats, papers)
+        return _format_markdown(stats)
     else:
-        return _format_text(stats, papers)
+        return _format_text(stats)
+
+
+# Bumped whenever rendered output changes, so reports cached by older code
+# are regenerated even though the registry is unchanged
+_REPORT_CACHE_FORMAT = 2
+
+
+def _report_cache_path(papers_path: Path) -> Path:
+    return papers_path.with_name(papers_path.name + ".report-cache.json")
+
+
+def _load_report_cache(papers_path: Path, stamp: tuple[int, int]) -> dict[str, str]:
+    """Rendered reports cached for the registry state *stamp*, keyed by format."""
+    try:
+        cache = from_json(_report_cache_path(papers_path).read_bytes())
+        if cache["format"] == _REPORT_CACHE_FORMAT and tuple(cache["stamp"]) == stamp:
+            return dict(cache["reports"])
+    except Exception:
+        # Missing, stale or corrupt cache: regenerate
+        pass
+    return {}
+
+
+def _save_report_cache(papers_path: Path, stamp: tuple[int, int], reports: dict[str, str]) -> None:
+    path = _report_cache_path(papers_path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(to_json(
+            {"format": _REPORT_CACHE_FORMAT, "stamp": list(stamp), "reports": reports}
+        ))
+        os.replace(tmp, path)
+    except OSError:
+        logger.debug("Could not write report cache %s", path, exc_info=True)
+        tmp.unlink(missing_ok=True)
+
+
+def run_report(config: Config, *, fmt: str = "text") -> str:
+    """Generate a corpus summary report.
+
+    Reports are cached beside the registry in ``papers.jsonl.report-cache.json``,
+    keyed by its (mtime_ns, size), so repeated reports on an unchanged corpus
+    skip the pass over the file. Returns the report as a string.
+    """
+    papers_path = config.project_dir / "papers.jsonl"
+    stamp = file_stamp(papers_path)
+    reports = _load_report_cache(papers_path, stamp) if stamp else {}
+    if fmt in reports:
+        return reports[fmt]
+
+    report = _render_report(_build_stats(iter_paper_records(papers_path)), fmt)
+    # Re-stat so a registry rewritten during the pass is not cached under the old stamp
+    if stamp and file_stamp(papers_path) == stamp:
+        reports[fmt] = report
+        _save_report_cache(papers_path, stamp, reports)
+    return report
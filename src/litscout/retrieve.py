@@ -2,62 +2,130 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import importlib.util
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 import httpx
+from pydantic_core import to_json
 from tqdm import tqdm
 
 from litscout.config import Config
-from litscout.models import FulltextSource, FulltextStatus, Paper, RetrievalLogEntry
+from litscout.models import FulltextSource, FulltextStatus, Paper
 from litscout.utils.identifiers import sanitize_for_filename
-from litscout.utils.io import generate_manual_list, load_papers, update_paper
+from litscout.utils.io import generate_manual_list, load_papers, update_papers
+
+if TYPE_CHECKING:
+    from litscout.api_clients.pubmed import PubMedClient
+    from litscout.api_clients.unpaywall import UnpaywallClient
 
 logger = logging.getLogger(__name__)
 
 _USER_AGENT = "LitScout/0.1 (scientific literature retrieval tool)"
 
+# Shared by every download in the process so TCP/TLS connections to the same
+# host (S2 CDN, publishers, arXiv, bioRxiv) are reused; created on first use.
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _http_client() -> httpx.Client:
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            # HTTP/2 multiplexes concurrent downloads from one host over a
+            # single TLS connection; it needs the optional h2 package.
+            _CLIENT = httpx.Client(
+                headers={"User-Agent": _USER_AGENT},
+                timeout=30.0,
+                follow_redirects=True,
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return _CLIENT
+
+
+# Politeness cap on simultaneous downloads from any one host
+_PER_HOST_DOWNLOADS = 2
+_HOST_SLOTS: dict[str, threading.Semaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def _host_slot(url: str) -> threading.Semaphore:
+    host = httpx.URL(url).host
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.Semaphore(_PER_HOST_DOWNLOADS)
+        return slot
+
+
+def close_clients() -> None:
+    """Close the shared download client; the next download opens a new one."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            _CLIENT.close()
+            _CLIENT = None
+
 
 def _download_pdf(url: str, dest: Path) -> tuple[bool, str]:
-    """Download a PDF from *url* to *dest*. Returns (success, error_or_content_type)."""
+    """Download a PDF from *url* to *dest*. Returns (success, error_or_content_type).
+
+    The body is checked for the PDF magic bytes before anything touches the
+    disk, then streamed to a ``.part`` file that replaces *dest* only once
+    complete, so a failed download never leaves a partial or non-PDF file.
+    """
+    part = dest.with_name(dest.name + ".part")
     try:
-        with httpx.stream(
-            "GET", url,
-            follow_redirects=True,
-            timeout=30.0,
-            headers={"User-Agent": _USER_AGENT},
-        ) as resp:
+        with _host_slot(url), _http_client().stream("GET", url) as resp:
             resp.raise_for_status()
+            logger.debug("GET %s -> %s", url, resp.http_version)
             content_type = resp.headers.get("content-type", "")
 
-            # Check for HTML paywall
+            # Reject on headers alone where possible; returning here closes the
+            # stream before any of the body is read.
             if "text/html" in content_type:
                 return False, "failed_paywall"
+            length = resp.headers.get("content-length", "")
+            if length.isdigit() and int(length) < 5:
+                return False, "not_pdf"
+
+            # Verify PDF magic bytes on the first bytes of the stream
+            chunks = resp.iter_bytes(chunk_size=8192)
+            head = b""
+            for chunk in chunks:
+                head += chunk
+                if len(head) >= 5:
+                    break
+            if not head.startswith(b"%PDF-"):
+                return False, "not_pdf"
 
             # Stream to file
             dest.parent.mkdir(parents=True, exist_ok=True)
-            with open(dest, "wb") as f:
-                for chunk in resp.iter_bytes(chunk_size=8192):
+            with open(part, "wb") as f:
+                f.write(head)
+                for chunk in chunks:
                     f.write(chunk)
-
-        # Verify PDF magic bytes
-        with open(dest, "rb") as f:
-            header = f.read(5)
-        if header != b"%PDF-":
-            dest.unlink(missing_ok=True)
-            return False, "not_pdf"
-
+        os.replace(part, dest)
         return True, content_type
     except Exception as e:
-        dest.unlink(missing_ok=True)
+        part.unlink(missing_ok=True)
         return False, str(e)
 
 
+_LOG_LOCK = threading.Lock()
+_LOG_BUFFER_SIZE = 1 << 16
+
+
 def _log_retrieval(
-    log_path: Path,
+    log: TextIO,
     paper: Paper,
     format_attempted: str,
     source_attempted: str,
@@ -68,30 +136,42 @@ def _log_retrieval(
     content_type: str | None = None,
     error: str | None = None,
 ) -> None:
-    entry = RetrievalLogEntry(
-        doi=paper.doi,
-        paper_id=paper.paper_id,
-        timestamp=datetime.now(timezone.utc).isoformat() + "Z",
-        format_attempted=format_attempted,
-        source_attempted=source_attempted,
-        url_attempted=url_attempted,
-        status=status,
-        file_path=file_path,
-        file_size_bytes=file_size,
-        content_type=content_type,
-        error=error,
-    )
-    with open(log_path, "a") as f:
-        f.write(entry.model_dump_json() + "\n")
+    # Plain dict in RetrievalLogEntry's field order: the arguments are already
+    # well-typed, so per-attempt model validation would only add overhead.
+    entry = {
+        "doi": paper.doi,
+        "paper_id": paper.paper_id,
+        "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+        "format_attempted": format_attempted,
+        "source_attempted": source_attempted,
+        "url_attempted": url_attempted,
+        "status": status,
+        "file_path": file_path,
+        "file_size_bytes": file_size,
+        "content_type": content_type,
+        "error": error,
+    }
+    line = to_json(entry).decode() + "\n"
+    with _LOG_LOCK:
+        log.write(line)
 
 
 def _try_pdf_retrieval(
     paper: Paper,
     config: Config,
     pdf_dir: Path,
-    log_path: Path,
-) -> str | None:
-    """Try to retrieve a PDF through the fallback chain. Returns the path on success."""
+    log: TextIO,
+    unpaywall: UnpaywallClient | None = None,
+    unpaywall_results: dict[str, Any] | None = None,
+) -> tuple[str, FulltextSource] | None:
+    """Try to retrieve a PDF through the fallback chain.
+
+    Returns (path, source) for the step that succeeded, or None.
+
+    *unpaywall* is the shared client (None skips Unpaywall) and
+    *unpaywall_results* holds prefetched lookups keyed by DOI; DOIs missing
+    from it are looked up individually.
+    """
     identifier = paper.doi or paper.paper_id.replace(":", "_")
     filename = sanitize_for_filename(identifier) + ".pdf"
     dest = pdf_dir / filename
@@ -99,7 +179,7 @@ def _try_pdf_retrieval(
     # 1. Semantic Scholar OA PDF
     if paper.open_access_pdf_url:
         ok, info = _download_pdf(paper.open_access_pdf_url, dest)
-        _log_retrieval(log_path, paper, "pdf", "semantic_scholar",
+        _log_retrieval(log, paper, "pdf", "semantic_scholar",
                        paper.open_access_pdf_url,
                        "success" if ok else "failed",
                        file_path=str(dest.relative_to(config.project_dir)) if ok else None,
@@ -107,17 +187,16 @@ def _try_pdf_retrieval(
                        content_type=info if ok else None,
                        error=None if ok else info)
         if ok:
-            return str(dest.relative_to(config.project_dir))
+            return str(dest.relative_to(config.project_dir)), FulltextSource.SEMANTIC_SCHOLAR
 
     # 2. Unpaywall
-    if paper.doi and config.apis.unpaywall_email:
-        from litscout.api_clients.unpaywall import UnpaywallClient
-
-        uw = UnpaywallClient(email=config.apis.unpaywall_email)
-        result = uw.get_oa_status(paper.doi)
+    if paper.doi and unpaywall is not None:
+        result = (unpaywall_results or {}).get(paper.doi)
+        if result is None:
+            result = unpaywall.get_oa_status(paper.doi)
         if result and result.pdf_url:
             ok, info = _download_pdf(result.pdf_url, dest)
-            _log_retrieval(log_path, paper, "pdf", "unpaywall",
+            _log_retrieval(log, paper, "pdf", "unpaywall",
                            result.pdf_url,
                            "success" if ok else "failed",
                            file_path=str(dest.relative_to(config.project_dir)) if ok else None,
@@ -125,33 +204,33 @@ def _try_pdf_retrieval(
                            content_type=info if ok else None,
                            error=None if ok else info)
             if ok:
-                return str(dest.relative_to(config.project_dir))
+                return str(dest.relative_to(config.project_dir)), FulltextSource.UNPAYWALL
 
     # 3. bioRxiv/medRxiv (DOI starts with 10.1101/)
     if paper.doi and paper.doi.startswith("10.1101/"):
         biorxiv_url = f"https://www.biorxiv.org/content/{paper.doi}v1.full.pdf"
         ok, info = _download_pdf(biorxiv_url, dest)
-        _log_retrieval(log_path, paper, "pdf", "biorxiv",
+        _log_retrieval(log, paper, "pdf", "biorxiv",
                        biorxiv_url,
                        "success" if ok else "failed",
                        file_path=str(dest.relative_to(config.project_dir)) if ok else None,
                        file_size=dest.stat().st_size if ok and dest.exists() else None,
                        error=None if ok else info)
         if ok:
-            return str(dest.relative_to(config.project_dir))
+            return str(dest.relative_to(config.project_dir)), FulltextSource.BIORXIV
 
     # 4. arXiv
     if paper.arxiv_id:
         arxiv_url = f"https://arxiv.org/pdf/{paper.arxiv_id}"
         ok, info = _download_pdf(arxiv_url, dest)
-        _log_retrieval(log_path, paper, "pdf", "arxiv",
+        _log_retrieval(log, paper, "pdf", "arxiv",
                        arxiv_url,
                        "success" if ok else "failed",
                        file_path=str(dest.relative_to(config.project_dir)) if ok else None,
                        file_size=dest.stat().st_size if ok and dest.exists() else None,
                        error=None if ok else info)
         if ok:
-            return str(dest.relative_to(config.project_dir))
+            return str(dest.relative_to(config.project_dir)), FulltextSource.ARXIV
 
     return None
 
@@ -160,57 +239,69 @@ def _try_structured_text_retrieval(
     paper: Paper,
     config: Config,
     xml_dir: Path,
-    log_path: Path,
+    log: TextIO,
+    pubmed: PubMedClient,
+    pmcids: dict[str, str],
 ) -> str | None:
-    """Try to retrieve structured XML/JSON text. Returns the path on success."""
-    pmcid = paper.pmcid
-
-    # Try to map PMID → PMCID if we don't have it
-    if not pmcid and paper.pmid:
-        from litscout.api_clients.pubmed import PubMedClient
-        client = PubMedClient(
-            email=config.apis.ncbi_email,
-            api_key=config.apis.ncbi_api_key,
-        )
-        pmcid = client.pmid_to_pmcid(paper.pmid)
+    """Try to retrieve structured XML/JSON text. Returns the path on success.
 
+    *pubmed* is the run's shared client and *pmcids* maps PMID → PMCID for
+    the run's papers, resolved up front in one batch.
+    """
+    pmcid = paper.pmcid or (pmcids.get(paper.pmid) if paper.pmid else None)
     if not pmcid:
         return None
 
+    # PMC BioC API
+    bioc_json = pubmed.get_bioc_fulltext(pmcid)
+
     identifier = pmcid
     filename = sanitize_for_filename(identifier) + ".json"
     dest = xml_dir / filename
 
-    # PMC BioC API
-    from litscout.api_clients.pubmed import PubMedClient
-    client = PubMedClient(
-        email=config.apis.ncbi_email,
-        api_key=config.apis.ncbi_api_key,
-    )
-    bioc_json = client.get_bioc_fulltext(pmcid)
     if bioc_json:
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_text(bioc_json)
-        _log_retrieval(log_path, paper, "xml", "pmc_bioc",
+        _log_retrieval(log, paper, "xml", "pmc_bioc",
                        None, "success",
                        file_path=str(dest.relative_to(config.project_dir)),
                        file_size=len(bioc_json))
         return str(dest.relative_to(config.project_dir))
 
-    _log_retrieval(log_path, paper, "xml", "pmc_bioc", None, "failed",
+    _log_retrieval(log, paper, "xml", "pmc_bioc", None, "failed",
                    error="BioC not available")
     return None
 
 
-def _determine_source(pdf_path: str | None, xml_path: str | None) -> FulltextSource | None:
-    """Determine the fulltext_source based on what was retrieved."""
-    if pdf_path and "unpaywall" in pdf_path:
-        return FulltextSource.UNPAYWALL
-    if xml_path:
-        return FulltextSource.PMC_BIOC
-    if pdf_path:
-        return FulltextSource.SEMANTIC_SCHOLAR
-    return None
+def _process_one(
+    paper: Paper,
+    config: Config,
+    pdf_dir: Path,
+    xml_dir: Path,
+    log: TextIO,
+    unpaywall: UnpaywallClient | None,
+    unpaywall_results: dict[str, Any],
+    pubmed: PubMedClient,
+    pmcids: dict[str, str],
+) -> dict[str, Any]:
+    """Run the full retrieval chain for one paper and return its registry updates."""
+    pdf = _try_pdf_retrieval(paper, config, pdf_dir, log, unpaywall, unpaywall_results)
+    xml_path = _try_structured_text_retrieval(paper, config, xml_dir, log, pubmed, pmcids)
+
+    updates: dict[str, Any] = {}
+    if pdf or xml_path:
+        updates["fulltext_status"] = FulltextStatus.RETRIEVED
+        updates["needs_manual_retrieval"] = False
+        if pdf:
+            updates["fulltext_pdf_path"], updates["fulltext_source"] = pdf
+        if xml_path:
+            # Structured text is what extraction prefers, so it names the source
+            updates["fulltext_xml_path"] = xml_path
+            updates["fulltext_source"] = FulltextSource.PMC_BIOC
+    else:
+        updates["fulltext_status"] = FulltextStatus.FAILED
+        updates["needs_manual_retrieval"] = True
+    return updates
 
 
 def run_retrieve(
@@ -262,29 +353,82 @@ def run_retrieve(
 
     retrieved = 0
     failed = 0
-
-    for paper in tqdm(to_process, desc="Retrieving full text"):
-        pdf_path = _try_pdf_retrieval(paper, config, pdf_dir, log_path)
-        xml_path = _try_structured_text_retrieval(paper, config, xml_dir, log_path)
-
-        updates: dict[str, Any] = {}
-        if pdf_path or xml_path:
-            updates["fulltext_status"] = FulltextStatus.RETRIEVED
-            updates["needs_manual_retrieval"] = False
-            if pdf_path:
-                updates["fulltext_pdf_path"] = pdf_path
-            if xml_path:
-                updates["fulltext_xml_path"] = xml_path
-            source = _determine_source(pdf_path, xml_path)
-            if source:
-                updates["fulltext_source"] = source
-            retrieved += 1
+    pending_updates: dict[str, dict[str, Any]] = {}
+
+    # Without an OA link, DOI, PMID/PMCID or arXiv id no source in the chain
+    # can be tried, so send those papers straight to manual retrieval.
+    retrievable: list[Paper] = []
+    for paper in to_process:
+        if (paper.open_access_pdf_url or paper.doi or paper.pmid
+                or paper.pmcid or paper.arxiv_id):
+            retrievable.append(paper)
         else:
-            updates["fulltext_status"] = FulltextStatus.FAILED
-            updates["needs_manual_retrieval"] = True
+            pending_updates[paper.paper_id] = {
+                "fulltext_status": FulltextStatus.MANUAL_PENDING,
+                "needs_manual_retrieval": True,
+            }
             failed += 1
+    to_process = retrievable
+
+    from litscout.api_clients.pubmed import PubMedClient
 
-        update_paper(papers_path, paper.paper_id, updates)
+    uw: UnpaywallClient | None = None
+    pubmed: PubMedClient | None = None
+    unpaywall_results: dict[str, Any] = {}
+    # Client setup and prefetches sit inside the try, so a failure in any of
+    # them still closes what was opened and flushes the pending updates.
+    try:
+        # Papers without an S2 OA link always fall through to Unpaywall, so look
+        # those DOIs up concurrently up front instead of one at a time in the loop.
+        if config.apis.unpaywall_email:
+            from litscout.api_clients.unpaywall import UnpaywallClient
+
+            uw = UnpaywallClient(email=config.apis.unpaywall_email)
+            dois = [p.doi for p in to_process if p.doi and not p.open_access_pdf_url]
+            if dois:
+                unpaywall_results = asyncio.run(uw.get_oa_status_many(dois))
+
+        pubmed = PubMedClient(email=config.apis.ncbi_email, api_key=config.apis.ncbi_api_key)
+
+        # Resolve every missing PMCID in batched idconv calls rather than one
+        # request per paper; PMIDs absent from the result have no PMC record.
+        pmids = list(dict.fromkeys(p.pmid for p in to_process if p.pmid and not p.pmcid))
+        pmcids = pubmed.pmids_to_pmcids(pmids) if pmids else {}
+
+        # One buffered append handle for the whole run instead of an open/close
+        # per logged attempt; entries are flushed in 64 KiB blocks and on close.
+        with open(log_path, "a", buffering=_LOG_BUFFER_SIZE) as log:
+            # Papers are independent and I/O-bound, so their chains run in
+            # parallel; per-host download slots and the API clients' rate
+            # limiters keep each host's load polite.
+            workers = max(1, min(config.retrieval.concurrency, len(to_process)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_process_one, paper, config, pdf_dir, xml_dir, log,
+                                uw, unpaywall_results, pubmed, pmcids): paper
+                    for paper in to_process
+                }
+                for future in tqdm(as_completed(futures), total=len(futures),
+                                   desc="Retrieving full text"):
+                    paper = futures[future]
+                    try:
+                        updates = future.result()
+                    except Exception:
+                        logger.exception("Retrieval failed for %s", paper.paper_id)
+                        continue
+                    if updates["fulltext_status"] == FulltextStatus.RETRIEVED:
+                        retrieved += 1
+                    else:
+                        failed += 1
+                    pending_updates[paper.paper_id] = updates
+    finally:
+        # One registry rewrite for the whole run, even if it was interrupted
+        update_papers(papers_path, pending_updates)
+        close_clients()
+        if pubmed is not None:
+            pubmed.close()
+        if uw is not None:
+            uw.close()
 
     # Generate manual retrieval list
     manual_path = config.project_dir / "manual_retrieval_list.md"
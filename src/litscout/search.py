@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -26,15 +27,15 @@ def _run_semantic_scholar_search(
 ) -> list[Paper]:
     from litscout.api_clients.semantic_scholar import SemanticScholarClient
 
-    client = SemanticScholarClient(api_key=config.apis.semantic_scholar_api_key)
     year_str = f"{year_range[0]}-{year_range[1]}" if year_range else None
-    return client.search_papers(
-        query,
-        year=year_str,
-        fields_of_study=fields_of_study or None,
-        min_citation_count=min_citation_count or None,
-        max_results=max_results,
-    )
+    with SemanticScholarClient(api_key=config.apis.semantic_scholar_api_key) as client:
+        return client.search_papers(
+            query,
+            year=year_str,
+            fields_of_study=fields_of_study or None,
+            min_citation_count=min_citation_count or None,
+            max_results=max_results,
+        )
 
 
 def _run_pubmed_search(
@@ -46,11 +47,11 @@ def _run_pubmed_search(
 ) -> list[Paper]:
     from litscout.api_clients.pubmed import PubMedClient
 
-    client = PubMedClient(
+    with PubMedClient(
         email=config.apis.ncbi_email,
         api_key=config.apis.ncbi_api_key,
-    )
-    return client.search(query, year_range=year_range, max_results=max_results)
+    ) as client:
+        return client.search(query, year_range=year_range, max_results=max_results)
 
 
 def _run_openalex_search(
@@ -63,13 +64,13 @@ def _run_openalex_search(
 ) -> list[Paper]:
     from litscout.api_clients.openalex import OpenAlexClient
 
-    client = OpenAlexClient(email=config.apis.unpaywall_email)
-    return client.search_works(
-        query,
-        year_range=year_range,
-        min_citation_count=min_citation_count,
-        max_results=max_results,
-    )
+    with OpenAlexClient(email=config.apis.unpaywall_email) as client:
+        return client.search_works(
+            query,
+            year_range=year_range,
+            min_citation_count=min_citation_count,
+            max_results=max_results,
+        )
 
 
 _SOURCE_DISPATCH = {
@@ -101,13 +102,14 @@ def run_search(
     if fields_of_study is None:
         fields_of_study = config.search.fields_of_study
 
-    all_papers: list[Paper] = []
+    runnable: list[str] = []
     for source in sources:
-        runner = _SOURCE_DISPATCH.get(source)
-        if runner is None:
+        if source in _SOURCE_DISPATCH:
+            runnable.append(source)
+        else:
             logger.warning("Unknown search source: %s", source)
-            continue
 
+    def search_source(source: str) -> list[Paper]:
         kwargs: dict = dict(
             config=config,
             year_range=year_range,
@@ -120,11 +122,20 @@ def run_search(
             kwargs["min_citation_count"] = min_citation_count
 
         try:
-            results = runner(query, **kwargs)
+            results = _SOURCE_DISPATCH[source](query, **kwargs)
             logger.info("Source %s returned %d results", source, len(results))
-            all_papers.extend(results)
+            return results
         except Exception:
             logger.exception("Search failed for source %s", source)
+            return []
+
+    # Sources are independent network round trips, so query them concurrently;
+    # results are merged in request order so dedup stays deterministic.
+    all_papers: list[Paper] = []
+    if runnable:
+        with ThreadPoolExecutor(max_workers=len(runnable)) as pool:
+            for results in pool.map(search_source, runnable):
+                all_papers.extend(results)
 
     # Cross-source dedup
     dedup = DedupIndex()
@@ -140,8 +151,10 @@ def run_search(
     papers_path = config.project_dir / "papers.jsonl"
     new_count = append_papers(unique_papers, papers_path)
 
+    # One timestamp for both the log entry and its file, so they cannot straddle midnight
+    now = datetime.now(timezone.utc)
     search_log = SearchLog(
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=now.isoformat(),
         query=query,
         sources=sources,
         year_range=list(year_range) if year_range else None,
@@ -157,7 +170,7 @@ def run_search(
     searches_dir = config.project_dir / "searches"
     searches_dir.mkdir(exist_ok=True)
     safe_query = query[:50].replace(" ", "_").replace("/", "_")
-    log_filename = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d')}_{safe_query}.jsonl"
+    log_filename = f"{now.strftime('%Y-%m-%d')}_{safe_query}.jsonl"
     log_path = searches_dir / log_filename
     with open(log_path, "a") as f:
         f.write(search_log.model_dump_json() + "\n")
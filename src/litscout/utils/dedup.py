@@ -3,24 +3,42 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from rapidfuzz import fuzz
+from collections import defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from litscout.utils.identifiers import normalize_doi
 
 if TYPE_CHECKING:
     from litscout.models import Paper
 
+# Upper bound on the title-score matrix built per cdist call (float32 cells)
+_CDIST_MAX_CELLS = 1 << 22
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
 
+@lru_cache(maxsize=131072)
 def _normalize_title(title: str) -> str:
-    """Normalize a title for comparison: lowercase, strip punctuation, collapse whitespace."""
+    """Normalize a title for comparison: lowercase, strip punctuation, collapse whitespace.
+
+    Memoized: a title is normalized on both is_duplicate and add, and again
+    each time an index is rebuilt from the registry.
+    """
     title = title.lower()
-    title = re.sub(r"[^\w\s]", "", title)
-    title = re.sub(r"\s+", " ", title).strip()
+    title = _PUNCT_RE.sub("", title)
+    title = _WS_RE.sub(" ", title).strip()
     return title
 
 
+def _as_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"expected str, got {type(value).__name__}")
+    return value
+
+
 class DedupIndex:
     """Index for fast deduplication of papers by DOI, PMID, and fuzzy title."""
 
@@ -28,8 +46,10 @@ class DedupIndex:
         self._doi_set: set[str] = set()
         self._pmid_set: set[str] = set()
         self._paper_id_set: set[str] = set()
-        # Store (normalized_title, year) tuples for fuzzy matching
-        self._title_year_pairs: list[tuple[str, int | None]] = []
+        # Normalized titles for fuzzy matching, bucketed by publication year
+        self._titles_by_year: dict[int | None, list[str]] = {}
+        # Normalized title -> years it was seen with, for the exact-match fast path
+        self._title_years: dict[str, set[int | None]] = {}
 
     def add(self, paper: Paper) -> None:
         """Add a paper to the dedup index."""
@@ -41,36 +61,160 @@ class DedupIndex:
             self._pmid_set.add(paper.pmid)
         self._paper_id_set.add(paper.paper_id)
         if paper.title:
-            self._title_year_pairs.append((_normalize_title(paper.title), paper.year))
+            norm_title = _normalize_title(paper.title)
+            self._titles_by_year.setdefault(paper.year, []).append(norm_title)
+            self._title_years.setdefault(norm_title, set()).add(paper.year)
+
+    def extend(self, papers: Iterable[Paper]) -> None:
+        """Add many papers to the index, updating each lookup structure in bulk."""
+        dois: list[str] = []
+        pmids: list[str] = []
+        paper_ids: list[str] = []
+        titles_by_year: defaultdict[int | None, list[str]] = defaultdict(list)
+        for paper in papers:
+            if paper.doi and (ndoi := normalize_doi(paper.doi)):
+                dois.append(ndoi)
+            if paper.pmid:
+                pmids.append(paper.pmid)
+            paper_ids.append(paper.paper_id)
+            if paper.title:
+                titles_by_year[paper.year].append(_normalize_title(paper.title))
+
+        self._doi_set.update(dois)
+        self._pmid_set.update(pmids)
+        self._paper_id_set.update(paper_ids)
+        for year, titles in titles_by_year.items():
+            self._titles_by_year.setdefault(year, []).extend(titles)
+            for title in titles:
+                self._title_years.setdefault(title, set()).add(year)
+
+    def to_state(self) -> dict[str, Any]:
+        """Return the index as plain JSON-serializable data (see :meth:`from_state`)."""
+        return {
+            "dois": sorted(self._doi_set),
+            "pmids": sorted(self._pmid_set),
+            "paper_ids": sorted(self._paper_id_set),
+            # JSON object keys must be strings, so buckets are [year, titles] pairs
+            "titles_by_year": [[year, titles] for year, titles in self._titles_by_year.items()],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> DedupIndex:
+        """Rebuild an index from :meth:`to_state` output.
+
+        Raises ``TypeError``/``ValueError``/``KeyError`` if *state* is malformed.
+        """
+        index = cls()
+        index._doi_set = {_as_str(v) for v in state["dois"]}
+        index._pmid_set = {_as_str(v) for v in state["pmids"]}
+        index._paper_id_set = {_as_str(v) for v in state["paper_ids"]}
+        for year, titles in state["titles_by_year"]:
+            if year is not None and type(year) is not int:
+                raise TypeError(f"bad title bucket year: {year!r}")
+            bucket = [_as_str(t) for t in titles]
+            index._titles_by_year.setdefault(year, []).extend(bucket)
+            for title in bucket:
+                index._title_years.setdefault(title, set()).add(year)
+        return index
+
+    def _title_buckets(self, year: int | None) -> list[list[str]]:
+        """Title buckets a paper from *year* is compared against.
+
+        A missing year on either side matches any year.
+        """
+        if year is None:
+            return list(self._titles_by_year.values())
+        return [self._titles_by_year.get(year, []), self._titles_by_year.get(None, [])]
+
+    def _has_exact_title(self, norm_title: str, year: int | None) -> bool:
+        years = self._title_years.get(norm_title)
+        return bool(years) and (year is None or year in years or None in years)
+
+    def _is_id_duplicate(self, paper: Paper) -> bool:
+        # 1. Exact paper_id match: a plain set lookup, and the one that
+        #    rejects re-runs of the same search or expansion
+        if paper.paper_id in self._paper_id_set:
+            return True
 
-    def is_duplicate(self, paper: Paper) -> bool:
-        """Check if a paper is a duplicate of any paper already in the index."""
-        # 1. Exact DOI match
+        # 2. Exact DOI match
         if paper.doi:
             ndoi = normalize_doi(paper.doi)
             if ndoi and ndoi in self._doi_set:
                 return True
 
-        # 2. Exact PMID match
-        if paper.pmid and paper.pmid in self._pmid_set:
-            return True
+        # 3. Exact PMID match
+        return bool(paper.pmid) and paper.pmid in self._pmid_set
 
-        # 3. Exact paper_id match
-        if paper.paper_id in self._paper_id_set:
+    def is_duplicate(self, paper: Paper) -> bool:
+        """Check if a paper is a duplicate of any paper already in the index."""
+        if self._is_id_duplicate(paper):
             return True
 
         # 4. Fuzzy title match (same year + high similarity)
         if paper.title:
             norm_title = _normalize_title(paper.title)
-            for existing_title, existing_year in self._title_year_pairs:
-                if paper.year is not None and existing_year is not None and paper.year != existing_year:
-                    continue
-                ratio = fuzz.ratio(norm_title, existing_title)
-                if ratio > 92:
+            if self._has_exact_title(norm_title, paper.year):
+                return True
+            # rapidfuzz is only loaded once there is something to fuzzy-match
+            buckets = [titles for titles in self._title_buckets(paper.year) if titles]
+            if not buckets:
+                return False
+            from rapidfuzz import fuzz, process
+
+            for titles in buckets:
+                best = process.extractOne(
+                    norm_title, titles, scorer=fuzz.ratio, processor=None, score_cutoff=92,
+                )
+                if best is not None and best[1] > 92:
                     return True
 
         return False
 
+    def filter_duplicates(self, papers: list[Paper]) -> list[Paper]:
+        """Return the non-duplicate papers of a batch, adding them to the index.
+
+        Equivalent to calling ``is_duplicate`` then ``add`` on each paper in
+        turn, but titles are compared against the existing index as one
+        ``rapidfuzz.process.cdist`` matrix per year, spread across all cores.
+        """
+        # Fuzzy matches against the titles indexed before this batch
+        fuzzy_hit = [False] * len(papers)
+        rows_by_year: dict[int | None, list[int]] = {}
+        for i, paper in enumerate(papers):
+            if not paper.title:
+                continue
+            if self._has_exact_title(_normalize_title(paper.title), paper.year):
+                fuzzy_hit[i] = True
+            else:
+                rows_by_year.setdefault(paper.year, []).append(i)
+        for year, rows in rows_by_year.items():
+            choices = [t for bucket in self._title_buckets(year) for t in bucket]
+            if not choices:
+                continue
+            from rapidfuzz import fuzz, process
+
+            # Bound the score matrix to ~_CDIST_MAX_CELLS entries per call
+            step = max(1, _CDIST_MAX_CELLS // len(choices))
+            for lo in range(0, len(rows), step):
+                chunk = rows[lo:lo + step]
+                scores = process.cdist(
+                    [_normalize_title(papers[i].title) for i in chunk], choices,
+                    scorer=fuzz.ratio, processor=None, score_cutoff=92, workers=-1,
+                )
+                for i, best in zip(chunk, scores.max(axis=1)):
+                    fuzzy_hit[i] = bool(best > 92)
+
+        # Identifier checks, and matches within the batch itself, stay sequential
+        batch = DedupIndex()
+        kept: list[Paper] = []
+        for paper, hit in zip(papers, fuzzy_hit):
+            if hit or self._is_id_duplicate(paper) or batch.is_duplicate(paper):
+                continue
+            self.add(paper)
+            batch.add(paper)
+            kept.append(paper)
+        return kept
+
 
 def merge_paper_records(existing: Paper, new: Paper) -> Paper:
     """Merge two paper records, preferring the one with more metadata.
@@ -78,18 +222,19 @@ def merge_paper_records(existing: Paper, new: Paper) -> Paper:
     Fills in missing fields from *new* into *existing* without overwriting
     non-null values.
     """
-    data = existing.model_dump()
-    new_data = new.model_dump()
-
-    for key, value in new_data.items():
-        existing_val = data.get(key)
+    # Build only the changed fields and copy, rather than dumping both records
+    # to dicts and re-validating the result. Lists are copied so the merged
+    # record never shares a list with either input.
+    updates: dict[str, Any] = {}
+    for key in type(existing).model_fields:
+        existing_val = getattr(existing, key)
+        value = getattr(new, key)
         # Fill missing scalar fields
         if existing_val is None and value is not None:
-            data[key] = value
-        # Merge lists (extend without duplicates)
-        elif isinstance(existing_val, list) and isinstance(value, list) and value:
-            if not existing_val:
-                data[key] = value
+            updates[key] = list(value) if isinstance(value, list) else value
+        # Fill empty lists
+        elif isinstance(existing_val, list):
+            take_new = not existing_val and isinstance(value, list) and value
+            updates[key] = list(value if take_new else existing_val)
 
-    from litscout.models import Paper
-    return Paper(**data)
+    return existing.model_copy(update=updates)
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 
+_DOI_PREFIX_RE = re.compile(r"^https?://(?:dx\.)?doi\.org/", re.IGNORECASE)
+
+
+@lru_cache(maxsize=65536)
 def normalize_doi(doi: str | None) -> str | None:
     """Normalize a DOI: strip URL prefixes, lowercase.
 
@@ -12,26 +17,27 @@ def normalize_doi(doi: str | None) -> str | None:
       - 10.1038/s41586-023-06424-7
       - https://doi.org/10.1038/s41586-023-06424-7
       - http://dx.doi.org/10.1038/s41586-023-06424-7
+
+    Results are memoized; the same DOIs recur across sources and dedup passes.
     """
     if not doi:
         return None
-    doi = doi.strip()
     # Strip common URL prefixes
-    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/"):
-        if doi.lower().startswith(prefix):
-            doi = doi[len(prefix):]
-            break
-    return doi.lower().strip()
+    return _DOI_PREFIX_RE.sub("", doi.strip()).lower().strip()
+
 
+# / becomes _, and characters unsafe in filenames are dropped
+_FILENAME_TABLE = str.maketrans({"/": "_", **dict.fromkeys('<>:"|?*\\')})
 
+
+@lru_cache(maxsize=8192)
 def sanitize_for_filename(identifier: str) -> str:
     """Convert an identifier (DOI, paper ID) into a safe filename component.
 
     Replaces / with _, strips characters that are unsafe for filenames.
+    Results are memoized, since the same identifiers recur across stages.
     """
-    s = identifier.replace("/", "_")
-    s = re.sub(r'[<>:"|?*\\]', "", s)
-    return s
+    return identifier.translate(_FILENAME_TABLE)
 
 
 def reconstruct_abstract(inverted_index: dict[str, list[int]]) -> str:
@@ -41,29 +47,31 @@ def reconstruct_abstract(inverted_index: dict[str, list[int]]) -> str:
     """
     if not inverted_index:
         return ""
-    # Find total length
-    max_pos = -1
-    for positions in inverted_index.values():
-        for pos in positions:
-            if pos > max_pos:
-                max_pos = pos
+    # Flatten once, then size the word list from the largest position
+    placed = [(pos, word) for word, positions in inverted_index.items() for pos in positions]
+    if not placed:
+        return ""
+    max_pos = max(pos for pos, _ in placed)
     if max_pos < 0:
         return ""
 
     words: list[str] = [""] * (max_pos + 1)
-    for word, positions in inverted_index.items():
-        for pos in positions:
-            words[pos] = word
+    for pos, word in placed:
+        words[pos] = word
     return " ".join(words)
 
 
+_DOI_EXTRACT_RE = re.compile(r"(10\.\d{4,9}[/_][^\s]+)")
+_DOI_EXT_RE = re.compile(r"\.(pdf|xml|txt|html)$", re.IGNORECASE)
+
+
 def extract_doi_from_string(s: str) -> str | None:
     """Try to extract a DOI from an arbitrary string (e.g. a filename)."""
-    match = re.search(r"(10\.\d{4,9}[/_][^\s]+)", s)
+    match = _DOI_EXTRACT_RE.search(s)
     if match:
         doi = match.group(1)
         # Clean up trailing punctuation or file extensions
-        doi = re.sub(r"\.(pdf|xml|txt|html)$", "", doi, flags=re.IGNORECASE)
+        doi = _DOI_EXT_RE.sub("", doi)
         doi = doi.rstrip(".,;")
         # Convert _ back to / for DOIs that were sanitized
         if "/" not in doi and "_" in doi:
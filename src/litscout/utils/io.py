@@ -2,72 +2,258 @@
 
 from __future__ import annotations
 
-import json
+import io
+import os
+import threading
+from collections.abc import Callable, Iterator
+from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json, to_json
+
 from litscout.models import Paper
 from litscout.utils.dedup import DedupIndex
 
+# Parsed registries, one entry per path, validated against (mtime_ns, size)
+_PAPERS_CACHE: dict[str, tuple[tuple[int, int], list[Paper]]] = {}
+_PAPERS_CACHE_LOCK = threading.Lock()
+
+# Registry files are read and rewritten in 64 KiB blocks rather than the
+# default 8 KiB, cutting read/write syscalls on large registries
+_IO_BUFFER_SIZE = 1 << 16
+
+# append_papers batches larger than this use DedupIndex.filter_duplicates
+_BULK_DEDUP_MIN = 64
+
+# Paper's compiled validator, called directly on decoded records to skip the
+# per-call model_validate wrapper (~20% of a small record's validation cost)
+_validate_paper = Paper.__pydantic_validator__.validate_python
+
+
+def _invalidate_papers_cache(filepath: Path) -> None:
+    with _PAPERS_CACHE_LOCK:
+        _PAPERS_CACHE.pop(str(filepath), None)
+
+
+def iter_paper_records(filepath: Path) -> Iterator[dict[str, Any]]:
+    """Yield the decoded JSON object of each registry line, without validation.
+
+    For read-only consumers (e.g. reports) that only need a few fields and
+    can validate the handful of records they keep with ``Paper.model_validate``.
+    """
+    try:
+        f = open(filepath, "rb", buffering=_IO_BUFFER_SIZE)
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if line.strip():
+                yield from_json(line)
+
+
+def iter_papers(filepath: Path) -> Iterator[Paper]:
+    """Yield papers from a JSONL file one at a time without caching them.
+
+    For single-pass consumers over large registries that do not need the
+    whole list in memory.
+    """
+    try:
+        f = open(filepath, "rb", buffering=_IO_BUFFER_SIZE)
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield Paper.model_validate_json(line)
+
+
+# Field defaults a registry line may omit, as plain JSON values (enum members
+# as their string values), so raw records read like validated papers
+_PAPER_DEFAULTS: dict[str, Any] = {
+    name: field.default.value if isinstance(field.default, Enum) else field.default
+    for name, field in Paper.model_fields.items()
+    if not field.is_required() and field.default_factory is None
+}
+
+
+def record_getter(record: dict[str, Any]) -> Callable[[str], Any]:
+    """Field getter for a decoded registry line, falling back to Paper's defaults."""
+    def get(name: str) -> Any:
+        return record.get(name, _PAPER_DEFAULTS.get(name))
+    return get
+
+
+def _matches(get: Callable[[str], Any], filters: dict[str, Any]) -> bool:
+    """Check a paper's fields, read through *get*, against ``load_papers`` filters.
+
+    A ``tags`` filter must already be a frozenset.
+    """
+    if filters.get("tags") and filters["tags"].isdisjoint(get("tags") or ()):
+        return False
+    if "status" in filters and get("fulltext_status") != filters["status"]:
+        return False
+    if "discovery_method" in filters and get("discovery_method") != filters["discovery_method"]:
+        return False
+    if "needs_manual_retrieval" in filters:
+        if get("needs_manual_retrieval") != filters["needs_manual_retrieval"]:
+            return False
+    return True
+
 
 def load_papers(filepath: Path, **filters: Any) -> list[Paper]:
     """Load papers from a JSONL file with optional filtering.
 
+    The parsed file is cached per process until it changes on disk, so
+    repeated loads (e.g. ingest followed by extract) skip re-validation.
+    Each call returns fresh shallow copies of the cached papers; reassigning
+    fields is safe, but nested lists are shared and must not be mutated in place.
+    A filtered load that misses the cache tests the filters on the decoded
+    JSON and validates only the matching lines, leaving the cache untouched.
+
     Supported filters:
       - tags: list[str] — paper must have at least one of these tags
       - status: str — match fulltext_status
       - discovery_method: str — match discovery_method
       - needs_manual_retrieval: bool
     """
-    if not filepath.exists():
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
         return []
 
-    papers: list[Paper] = []
-    with open(filepath) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            paper = Paper.model_validate_json(line)
+    # Build the tag set once rather than per paper
+    if filters.get("tags"):
+        filters["tags"] = frozenset(filters["tags"])
+
+    key = (st.st_mtime_ns, st.st_size)
+    with _PAPERS_CACHE_LOCK:
+        entry = _PAPERS_CACHE.get(str(filepath))
+    if entry is not None and entry[0] == key:
+        cached = entry[1]
+    elif filters:
+        papers: list[Paper] = []
+        with open(filepath, "rb", buffering=_IO_BUFFER_SIZE) as f:
+            for line in f:
+                if line.strip():
+                    raw = from_json(line)
+                    if _matches(record_getter(raw), filters):
+                        papers.append(_validate_paper(raw))
+        return papers
+    else:
+        cached = list(iter_papers(filepath))
+        with _PAPERS_CACHE_LOCK:
+            _PAPERS_CACHE[str(filepath)] = (key, cached)
+
+    return [
+        paper.model_copy() for paper in cached
+        if _matches(partial(getattr, paper), filters)
+    ]
 
-            # Apply filters
-            if "tags" in filters and filters["tags"]:
-                if not set(filters["tags"]) & set(paper.tags):
-                    continue
-            if "status" in filters and paper.fulltext_status != filters["status"]:
-                continue
-            if "discovery_method" in filters and paper.discovery_method != filters["discovery_method"]:
-                continue
-            if "needs_manual_retrieval" in filters:
-                if paper.needs_manual_retrieval != filters["needs_manual_retrieval"]:
-                    continue
 
-            papers.append(paper)
+def file_stamp(filepath: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for *filepath*, or None if it does not exist."""
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# Bumped whenever DedupIndex.to_state's layout changes, so old sidecars are rebuilt
+_INDEX_FORMAT = 3
+
 
-    return papers
+def _index_path(filepath: Path) -> Path:
+    return filepath.with_name(filepath.name + ".idx")
+
+
+def _load_or_build_index(filepath: Path) -> DedupIndex:
+    """Return the dedup index for a registry.
+
+    The JSON sidecar ``<registry>.idx`` is used when its stamp matches the
+    registry's (mtime_ns, size); otherwise the index is rebuilt from the file.
+    The sidecar is plain data, never unpickled, since project directories
+    may be shared or cloned.
+    """
+    stamp = file_stamp(filepath)
+    if stamp is None:
+        return DedupIndex()
+    try:
+        with open(_index_path(filepath), "rb") as f:
+            saved = from_json(f.read())
+        if saved["format"] == _INDEX_FORMAT and tuple(saved["stamp"]) == stamp:
+            return DedupIndex.from_state(saved["index"])
+    except Exception:
+        # Missing, stale-format or corrupt sidecar: rebuild below
+        pass
+
+    index = DedupIndex()
+    index.extend(load_papers(filepath))
+    return index
+
+
+def _save_index(filepath: Path, index: DedupIndex) -> None:
+    """Write the sidecar index for *filepath*, stamped with its current state."""
+    stamp = file_stamp(filepath)
+    if stamp is None:
+        return
+    path = _index_path(filepath)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(to_json({"format": _INDEX_FORMAT, "stamp": list(stamp),
+                         "index": index.to_state()}))
+    os.replace(tmp, path)
 
 
 def append_papers(papers: list[Paper], filepath: Path) -> int:
     """Append papers to a JSONL file, skipping duplicates against existing content.
 
+    The dedup index is persisted beside the registry, so an append costs
+    O(batch) rather than a re-parse of every existing paper.
     Returns the number of new papers actually written.
     """
-    # Build dedup index from existing papers
-    index = DedupIndex()
-    existing = load_papers(filepath)
-    for p in existing:
-        index.add(p)
+    index = _load_or_build_index(filepath)
 
-    new_count = 0
-    with open(filepath, "a") as f:
+    # Large batches are fuzzy-matched against the index in bulk
+    if len(papers) > _BULK_DEDUP_MIN:
+        kept = index.filter_duplicates(papers)
+    else:
+        kept = []
         for paper in papers:
-            if index.is_duplicate(paper):
-                continue
-            f.write(paper.model_dump_json() + "\n")
-            index.add(paper)
-            new_count += 1
+            if not index.is_duplicate(paper):
+                index.add(paper)
+                kept.append(paper)
 
-    return new_count
+    # Serialize the batch and append it with a single write
+    lines = [paper.model_dump_json() for paper in kept]
+
+    with open(filepath, "a") as f:
+        if lines:
+            f.write("\n".join(lines) + "\n")
+
+    _invalidate_papers_cache(filepath)
+    _save_index(filepath, index)
+    return len(lines)
+
+
+_PAPER_ID_PREFIX = b'{"paper_id":"'
+
+
+def _line_paper_id(line: bytes) -> str | None:
+    """Return the paper_id of a registry line.
+
+    Lines written by this module start with the paper_id, which is sliced
+    out without decoding the rest; anything else is fully parsed.
+    """
+    if line.startswith(_PAPER_ID_PREFIX):
+        start = len(_PAPER_ID_PREFIX)
+        end = line.find(b'"', start)
+        if end != -1 and b"\\" not in line[start:end]:
+            return line[start:end].decode()
+    return from_json(line).get("paper_id")
 
 
 def update_paper(filepath: Path, paper_id: str, updates: dict[str, Any]) -> bool:
@@ -75,26 +261,43 @@ def update_paper(filepath: Path, paper_id: str, updates: dict[str, Any]) -> bool
 
     Returns True if the paper was found and updated.
     """
-    if not filepath.exists():
-        return False
+    return update_papers(filepath, {paper_id: updates}) > 0
 
-    lines: list[str] = []
-    found = False
-    with open(filepath) as f:
-        for line in f:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            data = json.loads(stripped)
-            if data.get("paper_id") == paper_id:
-                data.update(updates)
-                found = True
-            lines.append(json.dumps(data))
-
-    if found:
-        with open(filepath, "w") as f:
-            for line in lines:
-                f.write(line + "\n")
+
+def update_papers(filepath: Path, updates: dict[str, dict[str, Any]]) -> int:
+    """Apply field updates to several papers in a single rewrite of a JSONL file.
+
+    *updates* maps paper_id to the fields to set on that paper.
+    Returns the number of lines that were updated.
+    """
+    if not updates or not filepath.exists():
+        return 0
+
+    # Stream line by line into a file beside the registry and swap it in, so
+    # memory stays bounded and a crash mid-write never leaves a truncated
+    # papers.jsonl behind. Untouched lines are copied verbatim.
+    tmp = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    found = 0
+    try:
+        with (
+            open(filepath, "rb", buffering=_IO_BUFFER_SIZE) as src,
+            open(tmp, "wb", buffering=_IO_BUFFER_SIZE) as dst,
+        ):
+            for line in src:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                if _line_paper_id(stripped) in updates:
+                    data = from_json(stripped)
+                    data.update(updates[data["paper_id"]])
+                    stripped = to_json(data)
+                    found += 1
+                dst.write(stripped + b"\n")
+        if found:
+            os.replace(tmp, filepath)
+            _invalidate_papers_cache(filepath)
+    finally:
+        tmp.unlink(missing_ok=True)
 
     return found
 
@@ -121,22 +324,23 @@ def generate_manual_list(papers_filepath: Path, output_filepath: Path) -> int:
 
     papers.sort(key=sort_key)
 
-    lines = [
-        "# Papers Needing Manual Retrieval",
-        "",
-        f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
-        f"Total: {len(papers)} papers",
-        "",
-        "## How to add papers",
-        "",
-        "1. Download the PDF from the link below (use institutional access, interlibrary loan, etc.)",
-        "2. Name the file using the filename shown below (or any name — the ingest tool will match by content)",
-        "3. Drop it into: `fulltext/inbox/`",
-        "4. Run: `python -m litscout ingest`",
-        "",
-        "---",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "# Papers Needing Manual Retrieval\n"
+        "\n"
+        f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}\n"
+        f"Total: {len(papers)} papers\n"
+        "\n"
+        "## How to add papers\n"
+        "\n"
+        "1. Download the PDF from the link below (use institutional access, interlibrary loan, etc.)\n"
+        "2. Name the file using the filename shown below (or any name — the ingest tool will match by content)\n"
+        "3. Drop it into: `fulltext/inbox/`\n"
+        "4. Run: `python -m litscout ingest`\n"
+        "\n"
+        "---\n"
+    )
 
     from litscout.utils.identifiers import sanitize_for_filename
 
@@ -145,22 +349,19 @@ def generate_manual_list(papers_filepath: Path, output_filepath: Path) -> int:
         if len(paper.authors) > 3:
             authors_str += ", et al."
 
-        lines.append(f"### {i}. {paper.title} ({paper.year or 'n.d.'})")
+        w(f"\n### {i}. {paper.title} ({paper.year or 'n.d.'})\n")
         if authors_str:
-            lines.append(f"- **Authors:** {authors_str}")
+            w(f"- **Authors:** {authors_str}\n")
         if paper.venue:
-            lines.append(f"- **Venue:** {paper.venue}")
+            w(f"- **Venue:** {paper.venue}\n")
         if paper.doi:
-            lines.append(f"- **DOI:** {paper.doi}")
-            lines.append(f"- **Publisher link:** https://doi.org/{paper.doi}")
+            w(f"- **DOI:** {paper.doi}\n- **Publisher link:** https://doi.org/{paper.doi}\n")
         if paper.citation_count is not None:
-            lines.append(f"- **Citations:** {paper.citation_count}")
+            w(f"- **Citations:** {paper.citation_count}\n")
         if paper.discovery_method and paper.discovery_query:
-            lines.append(f"- **Why it matters:** Discovered via {paper.discovery_method}")
+            w(f"- **Why it matters:** Discovered via {paper.discovery_method}\n")
         if paper.doi:
-            fn = sanitize_for_filename(paper.doi) + ".pdf"
-            lines.append(f"- **Suggested filename:** `{fn}`")
-        lines.append("")
+            w(f"- **Suggested filename:** `{sanitize_for_filename(paper.doi)}.pdf`\n")
 
-    output_filepath.write_text("\n".join(lines))
+    output_filepath.write_text(buf.getvalue())
     return len(papers)
@@ -3,42 +3,116 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import threading
 import time
+from typing import ClassVar
+
+# Waits are stretched by up to this fraction so callers that were queued
+# together do not all hit the API at the same instant
+_JITTER_FRACTION = 0.1
+
+# Dedicated generator, so jitter neither reads nor advances the global random state
+_jitter_rng = random.Random()
+
+
+def _jittered(delay_ns: int) -> float:
+    """Return *delay_ns* in seconds, lengthened by a random non-negative jitter."""
+    return delay_ns * (1.0 + _jitter_rng.uniform(0.0, _JITTER_FRACTION)) / 1e9
 
 
 class RateLimiter:
-    """A simple token-bucket rate limiter.
+    """A thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at *requests_per_second* up to *capacity*.
+    Each request takes one token (or *cost* tokens for requests that count
+    as several against the quota); when the bucket is empty the caller sleeps
+    for the computed deficit plus a small random jitter. Concurrent callers
+    queue up by running the bucket into debt, so each waits for its own slot.
 
     Parameters
     ----------
     requests_per_second : float
-        Maximum sustained request rate.
+        Maximum sustained request rate. Zero or negative disables limiting.
+    capacity : float
+        Number of requests that may be issued back-to-back after an idle
+        period. The default of 1 spaces every request evenly.
     """
 
-    def __init__(self, requests_per_second: float) -> None:
+    _shared: ClassVar[dict[tuple[str, float, float], RateLimiter]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, requests_per_second: float, capacity: float = 1.0) -> None:
         self.rate = requests_per_second
-        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
-        self._last_request: float = 0.0
-
-    def acquire(self) -> None:
-        """Block (synchronously) until a request slot is available."""
-        if self._interval <= 0:
-            return
-        now = time.monotonic()
-        elapsed = now - self._last_request
-        if elapsed < self._interval:
-            time.sleep(self._interval - elapsed)
-        self._last_request = time.monotonic()
-
-    async def acquire_async(self) -> None:
-        """Block (asynchronously) until a request slot is available."""
-        if self._interval <= 0:
-            return
-        now = time.monotonic()
-        elapsed = now - self._last_request
-        if elapsed < self._interval:
-            await asyncio.sleep(self._interval - elapsed)
-        self._last_request = time.monotonic()
+        self.capacity = max(1.0, capacity)
+        # The bucket is tracked in integer nanoseconds as the time at which it
+        # would be full again (tokens = capacity - (full_at - now) * rate), so
+        # the hot path is integer arithmetic on one monotonic_ns() reading.
+        self._interval_ns = round(1e9 / requests_per_second) if requests_per_second > 0 else 0
+        self._window_ns = round(self.capacity * self._interval_ns)
+        self._full_at_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+        if requests_per_second <= 0:
+            # Limiting is disabled: shadow the acquire methods with no-ops so
+            # callers skip the bucket entirely instead of re-checking the rate
+            self.acquire = self._acquire_unlimited
+            self.acquire_async = self._acquire_async_unlimited
+
+    @classmethod
+    def for_host(
+        cls, host: str, requests_per_second: float, capacity: float = 1.0
+    ) -> RateLimiter:
+        """Return the process-wide limiter for *host* at this rate, creating it on first use.
+
+        Limiters are shared per (host, rate, capacity): every client talking to
+        a host with the same budget shares one bucket, so separate client
+        instances cannot jointly exceed it. A different rate for the same host
+        (e.g. a keyed vs. keyless PubMed client) gets its own bucket, since the
+        API grants those quotas separately, and neither pins the other's rate.
+        """
+        key = (host, float(requests_per_second), float(capacity))
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls(requests_per_second, capacity)
+                cls._shared[key] = limiter
+            return limiter
+
+    def _reserve(self, cost: float) -> int:
+        """Take *cost* tokens and return how many ns the caller must wait before using them."""
+        with self._lock:
+            now = time.monotonic_ns()
+            self._full_at_ns = max(self._full_at_ns, now) + round(cost * self._interval_ns)
+            return self._full_at_ns - now - self._window_ns
+
+    def next_allowed_in(self, cost: float = 1.0) -> float:
+        """Return seconds until *cost* tokens would be available, without taking them."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic_ns()
+            full_at = max(self._full_at_ns, now) + round(cost * self._interval_ns)
+        return max(0, full_at - now - self._window_ns) / 1e9
+
+    @staticmethod
+    def _acquire_unlimited(cost: float = 1.0) -> None:
+        return None
+
+    @staticmethod
+    async def _acquire_async_unlimited(cost: float = 1.0) -> None:
+        return None
+
+    def acquire(self, cost: float = 1.0) -> None:
+        """Block (synchronously) until *cost* request slots are available."""
+        delay_ns = self._reserve(cost)
+        if delay_ns > 0:
+            time.sleep(_jittered(delay_ns))
+
+    async def acquire_async(self, cost: float = 1.0) -> None:
+        """Block (asynchronously) until *cost* request slots are available."""
+        delay_ns = self._reserve(cost)
+        if delay_ns > 0:
+            await asyncio.sleep(_jittered(delay_ns))
 
 
 # Pre-configured limiters for each API source
@@ -0,0 +1,64 @@
+"""Minimal retry helper for API calls — a lighter alternative to tenacity decorators."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Exponential backoff ceiling: 2s, 4s, 8s, ... capped at 30s. The actual wait
+# is drawn uniformly below the ceiling ("full jitter") so concurrent callers
+# that failed together do not retry in lockstep.
+_BASE_WAIT = 2.0
+_MAX_WAIT = 30.0
+
+
+def is_transient_error(exc: Exception) -> bool:
+    """Return True for failures that retrying may fix.
+
+    HTTP status errors (httpx and requests expose ``.response``, urllib's
+    ``HTTPError`` a ``.code``) are transient only for 429 and 5xx. Otherwise
+    only network-level failures are: httpx transport errors and timeouts,
+    and ``OSError``, which covers the socket, urllib (Bio.Entrez) and
+    requests (pyalex) connection errors. Anything else, such as a
+    ``ValueError`` or ``KeyError`` raised by a bug in the call, is not retried.
+    """
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(exc, "code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return isinstance(exc, (httpx.TransportError, OSError))
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    *,
+    attempts: int = 3,
+    should_retry: Callable[[Exception], bool] = is_transient_error,
+    description: str = "Request",
+) -> T:
+    """Call *fn*, retrying with jittered exponential backoff on failure.
+
+    The last exception is re-raised once *attempts* are exhausted or when
+    *should_retry* rejects it.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= attempts - 1 or not should_retry(e):
+                raise
+            wait = random.uniform(0, min(_MAX_WAIT, _BASE_WAIT * 2 ** attempt))
+            logger.info("%s failed, retrying in %.1fs: %s", description, wait, e)
+            time.sleep(wait)
+    raise ValueError("attempts must be at least 1")
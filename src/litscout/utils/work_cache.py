@@ -0,0 +1,78 @@
+"""Content-addressed on-disk cache for raw API records (e.g. OpenAlex Work JSON)."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every existing entry (e.g. when the cached payload shape
+# or the Paper schema derived from it changes).
+CACHE_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Return the cache root: $LITSCOUT_CACHE_DIR, else $XDG_CACHE_HOME/litscout."""
+    override = os.environ.get("LITSCOUT_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "litscout"
+
+
+def _entry_path(key: str, namespace: str, cache_dir: Path | None) -> Path:
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{key}".encode()).hexdigest()
+    root = cache_dir or default_cache_dir()
+    return root / namespace / digest[:2] / f"{digest}.json.gz"
+
+
+def get(
+    key: str,
+    *,
+    namespace: str = "openalex",
+    max_age: float | None = None,
+    cache_dir: Path | None = None,
+) -> dict[str, Any] | None:
+    """Return the cached record for *key*, or None on a miss.
+
+    Entries older than *max_age* seconds are treated as misses.
+    """
+    path = _entry_path(key, namespace, cache_dir)
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable cache entry: %s", path)
+        return None
+
+
+def put(
+    key: str,
+    value: dict[str, Any],
+    *,
+    namespace: str = "openalex",
+    cache_dir: Path | None = None,
+) -> None:
+    """Store *value* under *key*. Writes are atomic, so concurrent readers never see partial files."""
+    path = _entry_path(key, namespace, cache_dir)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("Failed to write cache entry: %s", path)
+        tmp.unlink(missing_ok=True)
@@ -0,0 +1,47 @@
+"""Tests for litscout.cli."""
+
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from litscout.cli import cli
+
+# Backends that subcommands import lazily; none should load for --help/init.
+_HEAVY_MODULES = ("pydantic", "httpx", "semanticscholar", "pyalex", "Bio", "tenacity")
+
+
+def test_cli_import_does_not_load_backends():
+    code = (
+        "import sys, litscout.cli; "
+        f"print(','.join(m for m in {_HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_cli_help_lists_subcommands():
+    result = CliRunner().invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    assert set(cli.commands) == {
+        "search", "expand", "rank", "retrieve", "ingest", "extract", "report", "init",
+    }
+    for name in cli.commands:
+        assert name in result.output
+
+
+def test_search_rejects_unknown_source(tmp_path):
+    result = CliRunner().invoke(
+        cli, ["-d", str(tmp_path), "search", "query", "--sources", "pubmed,scopus"]
+    )
+    assert result.exit_code == 2
+    assert "scopus" in result.output
+
+
+def test_valid_sources_match_search_backends():
+    from litscout.cli import VALID_SOURCES
+    from litscout.search import _SOURCE_DISPATCH
+
+    assert VALID_SOURCES == set(_SOURCE_DISPATCH)
@@ -51,3 +51,44 @@ def test_generate_default_toml():
     assert "[project]" in toml
     assert "[apis]" in toml
     assert "unpaywall_email" in toml
+
+
+def test_load_config_cached_copy_is_independent(tmp_path: Path):
+    (tmp_path / "litscout.toml").write_text('[search.defaults]\nyear_range = [2020, 2025]\n')
+    first = load_config(tmp_path)
+    first.search.year_range.append(2030)
+    second = load_config(tmp_path)
+    assert second.search.year_range == [2020, 2025]
+    assert second is not first
+
+
+def test_load_config_picks_up_edits(tmp_path: Path):
+    toml_path = tmp_path / "litscout.toml"
+    toml_path.write_text('[project]\nname = "before"\n')
+    assert load_config(tmp_path).project.name == "before"
+    toml_path.write_text('[project]\nname = "after!"\n')
+    assert load_config(tmp_path).project.name == "after!"
+
+
+def test_load_config_sections_and_manual_ingest(tmp_path: Path):
+    (tmp_path / "litscout.toml").write_text('''\
+[retrieval]
+concurrency = 2
+unknown_key = "ignored"
+
+[retrieval.manual_ingest]
+inbox_dir = "in/"
+
+[expand]
+concurrency = 3
+
+[extraction]
+max_tokens_per_doc = 1234
+''')
+    config = load_config(tmp_path)
+    assert config.retrieval.concurrency == 2
+    assert config.expand.concurrency == 3
+    assert config.retrieval.inbox_dir == "in/"
+    assert config.retrieval.processed_dir == "fulltext/inbox/processed/"
+    assert config.extraction.max_tokens_per_doc == 1234
+    assert not hasattr(config.retrieval, "unknown_key")
@@ -74,6 +74,63 @@ def test_dedup_same_title_different_year():
     assert not idx.is_duplicate(p2)
 
 
+def test_dedup_fuzzy_title_missing_year():
+    idx = DedupIndex()
+    idx.add(_make_paper(paper_id="s2:1", title="Dopamine neuron loss in PD", year=2021))
+    idx.add(_make_paper(paper_id="s2:2", title="Gut microbiome and PD"))
+
+    # No year on the candidate: compared against every year
+    assert idx.is_duplicate(_make_paper(paper_id="s2:3", title="Dopamine neuron loss in PD."))
+    # No year on the indexed paper: matches a candidate from any year
+    assert idx.is_duplicate(_make_paper(paper_id="s2:4", title="Gut microbiome and PD", year=2020))
+
+
+def test_filter_duplicates_matches_sequential():
+    existing = [
+        _make_paper(paper_id="s2:1", title="Alpha-synuclein aggregation in PD", year=2023),
+        _make_paper(paper_id="s2:2", title="Gut microbiome and PD"),
+        _make_paper(paper_id="s2:3", title="LRRK2 kinase inhibitors", doi="10.1/lrrk2"),
+    ]
+    batch = [
+        _make_paper(paper_id="s2:10", title="Alpha-synuclein aggregation in PD.", year=2023),
+        _make_paper(paper_id="s2:11", title="Alpha-synuclein aggregation in PD", year=2022),
+        _make_paper(paper_id="s2:12", title="Gut microbiome and PD", year=2019),
+        _make_paper(paper_id="s2:13", title="A new paper", doi="10.1/LRRK2"),
+        _make_paper(paper_id="s2:14", title="Deep brain stimulation outcomes", year=2020),
+        _make_paper(paper_id="s2:15", title="Deep brain stimulation outcomes.", year=2020),
+        _make_paper(paper_id="s2:16", title="Another unrelated study", year=2020),
+    ]
+
+    sequential = DedupIndex()
+    bulk = DedupIndex()
+    for p in existing:
+        sequential.add(p)
+        bulk.add(p)
+    expected = []
+    for p in batch:
+        if not sequential.is_duplicate(p):
+            sequential.add(p)
+            expected.append(p.paper_id)
+
+    assert [p.paper_id for p in bulk.filter_duplicates(batch)] == expected
+    assert expected == ["s2:11", "s2:14", "s2:16"]
+    assert bulk.is_duplicate(_make_paper(paper_id="s2:99", title="Another unrelated study"))
+
+
+def test_extend_matches_add():
+    papers = [
+        _make_paper(paper_id="s2:1", title="Paper One", doi="10.1/A", year=2020),
+        _make_paper(paper_id="s2:2", title="Paper Two", pmid="123"),
+        _make_paper(paper_id="s2:3", title="Paper One", year=2021),
+    ]
+    added = DedupIndex()
+    for p in papers:
+        added.add(p)
+    extended = DedupIndex()
+    extended.extend(papers)
+    assert vars(extended) == vars(added)
+
+
 def test_merge_paper_records():
     existing = _make_paper(paper_id="s2:1", doi="10.1234/test", pmid=None, year=2023)
     new = _make_paper(paper_id="s2:2", doi="10.1234/test", pmid="12345", year=2022)
@@ -83,3 +140,17 @@ def test_merge_paper_records():
     assert merged.doi == "10.1234/test"
     assert merged.pmid == "12345"  # filled from new
     assert merged.year == 2023  # keep existing non-null
+
+
+def test_dedup_state_round_trip():
+    index = DedupIndex()
+    index.add(_make_paper(paper_id="s2:1", title="Dated Paper", year=2020, doi="10.1/a"))
+    index.add(_make_paper(paper_id="s2:2", title="Undated Paper", pmid="42"))
+
+    restored = DedupIndex.from_state(index.to_state())
+    assert restored.is_duplicate(_make_paper(paper_id="s2:1", title="X"))
+    assert restored.is_duplicate(_make_paper(paper_id="s2:8", title="Y", doi="10.1/A"))
+    assert restored.is_duplicate(_make_paper(paper_id="s2:9", title="Z", pmid="42"))
+    assert restored.is_duplicate(_make_paper(paper_id="s2:7", title="Dated Paper", year=2020))
+    assert restored.is_duplicate(_make_paper(paper_id="s2:6", title="Undated Paper", year=1999))
+    assert not restored.is_duplicate(_make_paper(paper_id="s2:5", title="Dated Paper", year=2001))
@@ -0,0 +1,41 @@
+"""Tests for litscout.extract."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from litscout import extract
+from litscout.config import Config
+from litscout.extract import run_extract
+from litscout.models import Paper
+from litscout.utils.io import append_papers, load_papers
+
+
+def test_run_extract_writes_registry_once(tmp_project: Path, monkeypatch: pytest.MonkeyPatch):
+    papers = []
+    for i in (1, 2):
+        xml_rel = f"fulltext/xml/p{i}.json"
+        bioc = {"documents": [{"passages": [
+            {"infons": {"section_type": "ABSTRACT"}, "text": f"Abstract {i}."},
+        ]}]}
+        (tmp_project / xml_rel).write_text(json.dumps(bioc))
+        papers.append(Paper(paper_id=f"s2:{i}", title=f"Paper {i}", fulltext_xml_path=xml_rel))
+    papers_path = tmp_project / "papers.jsonl"
+    append_papers(papers, papers_path)
+
+    calls: list[dict] = []
+    real_update_papers = extract.update_papers
+
+    def spy(filepath, updates):
+        calls.append(dict(updates))
+        return real_update_papers(filepath, updates)
+
+    monkeypatch.setattr(extract, "update_papers", spy)
+    result = run_extract(Config(project_dir=tmp_project))
+
+    assert result == {"extracted": 2, "skipped": 0, "errors": 0}
+    assert len(calls) == 1
+    txt_paths = {p.paper_id: p.fulltext_txt_path for p in load_papers(papers_path)}
+    assert txt_paths == {"s2:1": "fulltext/txt/s2_1.txt", "s2:2": "fulltext/txt/s2_2.txt"}
+    assert (tmp_project / "fulltext/txt/s2_1.txt").read_text().startswith("TITLE: Paper 1")
@@ -3,7 +3,15 @@
 from pathlib import Path
 
 from litscout.models import Author, Paper
-from litscout.utils.io import append_papers, generate_manual_list, load_papers, update_paper
+from litscout.utils.io import (
+    append_papers,
+    generate_manual_list,
+    iter_paper_records,
+    iter_papers,
+    load_papers,
+    update_paper,
+    update_papers,
+)
 
 
 def _make_paper(**kwargs) -> Paper:
@@ -17,6 +25,28 @@ def test_load_papers_empty(tmp_path: Path):
     assert papers == []
 
 
+def test_iter_papers(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    assert list(iter_papers(filepath)) == []
+
+    append_papers([
+        _make_paper(paper_id="s2:1", title="Paper 1", doi="10.1234/a"),
+        _make_paper(paper_id="s2:2", title="Paper 2", doi="10.1234/b"),
+    ], filepath)
+    assert [p.paper_id for p in iter_papers(filepath)] == ["s2:1", "s2:2"]
+
+
+def test_iter_paper_records(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    assert list(iter_paper_records(filepath)) == []
+
+    append_papers([_make_paper(paper_id="s2:1", title="Paper 1", year=2020)], filepath)
+    records = list(iter_paper_records(filepath))
+    assert records[0]["paper_id"] == "s2:1"
+    assert records[0]["year"] == 2020
+    assert Paper.model_validate(records[0]).title == "Paper 1"
+
+
 def test_append_and_load(tmp_path: Path):
     filepath = tmp_path / "papers.jsonl"
     papers = [
@@ -70,6 +100,101 @@ def test_update_paper_not_found(tmp_path: Path):
     assert updated is False
 
 
+def test_update_papers_single_rewrite(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    papers = [
+        _make_paper(paper_id="s2:1", title="Paper 1"),
+        _make_paper(paper_id="s2:2", title="Paper 2"),
+        _make_paper(paper_id="s2:3", title="Paper 3"),
+    ]
+    append_papers(papers, filepath)
+
+    count = update_papers(filepath, {
+        "s2:1": {"fulltext_status": "retrieved"},
+        "s2:3": {"needs_manual_retrieval": True},
+        "s2:missing": {"title": "x"},
+    })
+    assert count == 2
+
+    loaded = {p.paper_id: p for p in load_papers(filepath)}
+    assert loaded["s2:1"].fulltext_status == "retrieved"
+    assert loaded["s2:2"].fulltext_status != "retrieved"
+    assert loaded["s2:3"].needs_manual_retrieval is True
+
+
+def test_update_papers_hand_edited_line(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    append_papers([_make_paper(paper_id="s2:1", title="Paper 1")], filepath)
+    # A line whose keys are not in the order this module writes them
+    with open(filepath, "a") as f:
+        f.write('{"title": "Paper 2", "paper_id": "s2:2"}\n')
+
+    assert update_papers(filepath, {"s2:2": {"tags": ["seed"]}}) == 1
+    assert update_papers(filepath, {"s2:missing": {"tags": ["x"]}}) == 0
+    loaded = {p.paper_id: p for p in load_papers(filepath)}
+    assert loaded["s2:2"].tags == ["seed"]
+    assert loaded["s2:1"].tags == []
+    assert [f.name for f in tmp_path.iterdir() if f.suffix == ".tmp"] == []
+
+
+def test_load_papers_cached_copies_are_independent(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    append_papers([_make_paper(paper_id="s2:1", title="Paper 1")], filepath)
+
+    first = load_papers(filepath)
+    first[0].title = "Mutated"
+    second = load_papers(filepath)
+    assert second[0].title == "Paper 1"
+    assert second[0] is not first[0]
+
+
+def test_load_papers_sees_writes(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    append_papers([_make_paper(paper_id="s2:1", title="Paper 1")], filepath)
+    assert len(load_papers(filepath)) == 1
+
+    append_papers([_make_paper(paper_id="s2:2", title="Paper 2", doi="10.1234/b")], filepath)
+    update_paper(filepath, "s2:1", {"title": "Paper X"})
+    loaded = load_papers(filepath)
+    assert [p.title for p in loaded] == ["Paper X", "Paper 2"]
+
+
+def test_append_papers_persists_dedup_index(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    append_papers([_make_paper(paper_id="s2:1", title="Paper 1", doi="10.1234/a")], filepath)
+    assert (tmp_path / "papers.jsonl.idx").exists()
+
+    # Reused sidecar still catches duplicates
+    dup = _make_paper(paper_id="s2:9", title="Other", doi="10.1234/A")
+    assert append_papers([dup], filepath) == 0
+
+    # A registry edited outside append_papers invalidates the sidecar
+    external = _make_paper(paper_id="s2:2", title="Paper 2", doi="10.1234/b")
+    with open(filepath, "a") as f:
+        f.write(external.model_dump_json() + "\n")
+    dup = _make_paper(paper_id="s2:3", title="Paper 3", doi="10.1234/b")
+    assert append_papers([dup], filepath) == 0
+    assert len(load_papers(filepath)) == 2
+
+
+def test_append_papers_never_unpickles_sidecar(tmp_path: Path):
+    import pickle
+
+    filepath = tmp_path / "papers.jsonl"
+    append_papers([_make_paper(paper_id="s2:1", title="Paper 1", doi="10.1234/a")], filepath)
+    marker = tmp_path / "pwned"
+
+    class Payload:
+        def __reduce__(self):
+            return (open, (str(marker), "w"))
+
+    # A hostile sidecar from a shared project is ignored and rebuilt, not executed
+    (tmp_path / "papers.jsonl.idx").write_bytes(pickle.dumps(Payload()))
+    dup = _make_paper(paper_id="s2:9", title="Other", doi="10.1234/a")
+    assert append_papers([dup], filepath) == 0
+    assert not marker.exists()
+
+
 def test_load_papers_filter_by_tag(tmp_path: Path):
     filepath = tmp_path / "papers.jsonl"
     papers = [
@@ -83,6 +208,40 @@ def test_load_papers_filter_by_tag(tmp_path: Path):
     assert seed_papers[0].paper_id == "s2:1"
 
 
+def test_load_papers_filtered_cold_and_cached(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    papers = [
+        _make_paper(paper_id="s2:1", title="Paper 1", authors=[Author(name="Jane Doe")],
+                    fulltext_status="failed"),
+        _make_paper(paper_id="s2:2", title="Paper 2", discovery_method="manual"),
+    ]
+    append_papers(papers, filepath)
+
+    # Cold (registry just written) and warm (after an unfiltered load) agree
+    cold = load_papers(filepath, status="failed")
+    load_papers(filepath)
+    warm = load_papers(filepath, status="failed")
+    assert [p.paper_id for p in cold] == [p.paper_id for p in warm] == ["s2:1"]
+    assert cold[0].authors[0].name == "Jane Doe"
+    assert [p.paper_id for p in load_papers(filepath, discovery_method="manual")] == ["s2:2"]
+
+
+def test_load_papers_filters_sparse_line_like_defaults(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    # A hand-written line that omits every defaulted field
+    filepath.write_text('{"paper_id": "s2:1", "title": "Sparse"}\n')
+
+    filters = [
+        {"needs_manual_retrieval": False},
+        {"status": "not_attempted"},
+        {"discovery_method": "keyword_search"},
+    ]
+    cold = [[p.paper_id for p in load_papers(filepath, **f)] for f in filters]
+    load_papers(filepath)
+    warm = [[p.paper_id for p in load_papers(filepath, **f)] for f in filters]
+    assert cold == warm == [["s2:1"]] * 3
+
+
 def test_generate_manual_list(tmp_path: Path):
     filepath = tmp_path / "papers.jsonl"
     papers = [
@@ -0,0 +1,69 @@
+"""Tests for litscout.rank."""
+
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pytest
+
+from litscout import rank
+from litscout.config import Config
+from litscout.models import Paper
+from litscout.rank import run_rank
+from litscout.utils.io import append_papers
+
+
+@pytest.fixture
+def llm_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Config:
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("LITSCOUT_CACHE_DIR", str(tmp_path / "cache"))
+    papers = [
+        Paper(paper_id="s2:1", title="Paper One", year=2020, citation_count=100),
+        Paper(paper_id="s2:2", title="Paper Two", year=2024, citation_count=1),
+    ]
+    append_papers(papers, tmp_path / "papers.jsonl")
+    return Config(project_dir=tmp_path)
+
+
+def test_rank_failed_llm_scores_count_as_neutral(
+    llm_env: Config, monkeypatch: pytest.MonkeyPatch
+):
+    bib_only = {p.paper_id: sc for sc, p in run_rank(llm_env)}
+
+    async def no_scores(requests, api_key):
+        return {}
+
+    monkeypatch.setattr(rank, "_submit_relevance_batch", lambda requests, api_key: {})
+    monkeypatch.setattr(rank, "_llm_relevance_scores", no_scores)
+    ranked = run_rank(llm_env, relevance_prompt="focus", relevance_weight=0.5)
+    for score, paper in ranked:
+        assert score == pytest.approx(0.5 * bib_only[paper.paper_id] + 0.5 * 0.5)
+
+
+def test_rank_batch_timeout_cancels_and_scores_directly(
+    llm_env: Config, monkeypatch: pytest.MonkeyPatch
+):
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(f"{request.method} {request.url.path}")
+        if request.url.path == "/v1/messages/batches":
+            return httpx.Response(200, json={"id": "b1", "processing_status": "in_progress"})
+        return httpx.Response(200, json={"id": "b1", "processing_status": "canceling"})
+
+    direct: list[int] = []
+
+    async def direct_scores(requests, api_key):
+        direct.append(len(requests))
+        return {r["custom_id"]: 1.0 for r in requests}
+
+    monkeypatch.setattr(
+        httpx, "Client", partial(httpx.Client, transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(rank, "_BATCH_MAX_WAIT", 0.0)
+    monkeypatch.setattr(rank, "_llm_relevance_scores", direct_scores)
+
+    ranked = run_rank(llm_env, relevance_prompt="focus")
+    assert "POST /v1/messages/batches/b1/cancel" in calls
+    assert direct == [2]
+    assert len(ranked) == 2
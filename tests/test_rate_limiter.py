@@ -27,3 +27,79 @@ def test_rate_limiter_zero_rate():
     # Should not block
     limiter.acquire()
     limiter.acquire()
+
+
+def test_rate_limiter_spaces_concurrent_threads():
+    import threading
+
+    limiter = RateLimiter(50.0)  # 0.02s between requests
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(4)]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - start
+    assert elapsed >= 0.05  # 4 calls need at least 3 intervals
+
+
+def test_rate_limiter_spaces_concurrent_coroutines():
+    import asyncio
+
+    limiter = RateLimiter(50.0)  # 0.02s between requests
+    finished: list[float] = []
+
+    async def worker() -> None:
+        await limiter.acquire_async()
+        finished.append(time.monotonic())
+
+    async def main() -> None:
+        await asyncio.gather(*(worker() for _ in range(4)))
+
+    start = time.monotonic()
+    asyncio.run(main())
+    # Each coroutine waits for its own slot instead of sharing one
+    assert max(finished) - start >= 0.05
+    assert sorted(finished)[1] - start >= 0.01
+
+
+def test_rate_limiter_burst_capacity():
+    limiter = RateLimiter(10.0, capacity=3)  # 0.1s between requests once drained
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05  # burst is immediate
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.05  # fourth call waits for a refill
+
+
+def test_rate_limiter_idle_does_not_exceed_capacity():
+    limiter = RateLimiter(10.0, capacity=3)
+    time.sleep(0.35)  # idle long enough to refill several times over
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.05  # idle time is capped at one full bucket
+
+
+def test_rate_limiter_for_host_is_shared():
+    a = RateLimiter.for_host("test.example.org", 5.0)
+    assert RateLimiter.for_host("test.example.org", 5.0) is a
+    assert RateLimiter.for_host("other.example.org", 5.0) is not a
+
+
+def test_rate_limiter_for_host_keeps_each_rate():
+    keyless = RateLimiter.for_host("rates.example.org", 2.0)
+    keyed = RateLimiter.for_host("rates.example.org", 8.0)
+    assert keyless is not keyed
+    assert (keyless.rate, keyed.rate) == (2.0, 8.0)
+
+
+def test_rate_limiter_next_allowed_in_does_not_consume():
+    limiter = RateLimiter(10.0, capacity=2)
+    assert limiter.next_allowed_in() == 0.0
+    assert limiter.next_allowed_in() == 0.0  # peeking took nothing
+    limiter.acquire(cost=2)
+    assert 0.05 < limiter.next_allowed_in() <= 0.1
+    assert RateLimiter(0.0).next_allowed_in() == 0.0
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from litscout.models import Paper
 from litscout.report import run_report
 from litscout.config import Config
@@ -20,42 +22,67 @@ def test_report_empty_corpus(tmp_path: Path):
     assert "No papers" in result
 
 
-def test_report_text(tmp_path: Path):
-    filepath = tmp_path / "papers.jsonl"
+@pytest.fixture(scope="module")
+def corpus_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A two-paper project written once and shared by the read-only report tests."""
+    project_dir = tmp_path_factory.mktemp("corpus")
     papers = [
         _make_paper(paper_id="s2:1", title="Paper One", year=2023, citation_count=10, venue="Nature"),
         _make_paper(paper_id="s2:2", title="Paper Two", year=2024, citation_count=5, venue="Science"),
     ]
-    append_papers(papers, filepath)
+    append_papers(papers, project_dir / "papers.jsonl")
+    return project_dir
 
-    config = Config(project_dir=tmp_path)
-    result = run_report(config, fmt="text")
+
+def test_report_text(corpus_dir: Path):
+    result = run_report(Config(project_dir=corpus_dir), fmt="text")
     assert "Total papers: 2" in result
     assert "Nature" in result
 
 
-def test_report_markdown(tmp_path: Path):
+def test_report_markdown(corpus_dir: Path):
+    result = run_report(Config(project_dir=corpus_dir), fmt="markdown")
+    assert "# LitScout Corpus Report" in result
+    assert "**Total papers:** 2" in result
+
+
+def test_report_json(corpus_dir: Path):
+    result = run_report(Config(project_dir=corpus_dir), fmt="json")
+    import json
+    data = json.loads(result)
+    assert data["total"] == 2
+
+
+def test_report_cached_until_registry_changes(tmp_path: Path):
     filepath = tmp_path / "papers.jsonl"
-    papers = [
-        _make_paper(paper_id="s2:1", title="Paper One", year=2023, citation_count=10),
-    ]
-    append_papers(papers, filepath)
+    append_papers([_make_paper(paper_id="s2:1", title="Paper One", year=2023)], filepath)
 
     config = Config(project_dir=tmp_path)
-    result = run_report(config, fmt="markdown")
-    assert "# LitScout Corpus Report" in result
-    assert "**Total papers:** 1" in result
+    first = run_report(config, fmt="text")
+    assert (tmp_path / "papers.jsonl.report-cache.json").exists()
+    assert run_report(config, fmt="text") == first
+
+    append_papers([_make_paper(paper_id="s2:2", title="Paper Two", year=2024)], filepath)
+    assert "Total papers: 2" in run_report(config, fmt="text")
 
 
-def test_report_json(tmp_path: Path):
+def test_report_sparse_line_uses_defaults(tmp_path: Path):
     filepath = tmp_path / "papers.jsonl"
-    papers = [
-        _make_paper(paper_id="s2:1", title="Paper One", year=2023, citation_count=10),
-    ]
-    append_papers(papers, filepath)
+    append_papers([_make_paper(paper_id="s2:1", title="Paper One", year=2023)], filepath)
+    with open(filepath, "a") as f:
+        f.write('{"paper_id": "s2:2", "title": "B"}\n')
 
-    config = Config(project_dir=tmp_path)
-    result = run_report(config, fmt="json")
-    import json
-    data = json.loads(result)
-    assert data["total"] == 1
+    result = run_report(Config(project_dir=tmp_path), fmt="text")
+    assert "Total papers: 2" in result
+    assert "not_attempted: 2" in result
+    assert "keyword_search: 2" in result
+
+
+def test_report_json_escapes_non_ascii(tmp_path: Path):
+    filepath = tmp_path / "papers.jsonl"
+    paper = _make_paper(paper_id="s2:1", title="Café études", year=2023, citation_count=1)
+    append_papers([paper], filepath)
+
+    result = run_report(Config(project_dir=tmp_path), fmt="json")
+    assert result.isascii()
+    assert '"title": "Caf\\u00e9 \\u00e9tudes"' in result
@@ -0,0 +1,38 @@
+"""Tests for litscout.retrieve."""
+
+from pathlib import Path
+
+import pytest
+
+from litscout.api_clients.unpaywall import UnpaywallClient
+from litscout.config import Config
+from litscout.models import FulltextStatus, Paper
+from litscout.retrieve import run_retrieve
+from litscout.utils.io import append_papers, load_papers
+
+
+def test_run_retrieve_flushes_updates_when_prefetch_fails(
+    tmp_project: Path, monkeypatch: pytest.MonkeyPatch
+):
+    papers = [
+        Paper(paper_id="s2:1", title="No Identifiers"),
+        Paper(paper_id="s2:2", title="Has DOI", doi="10.1234/x"),
+    ]
+    append_papers(papers, tmp_project / "papers.jsonl")
+
+    closed: list[bool] = []
+
+    async def failing_prefetch(self, dois):
+        raise RuntimeError("unpaywall down")
+
+    monkeypatch.setattr(UnpaywallClient, "get_oa_status_many", failing_prefetch)
+    monkeypatch.setattr(UnpaywallClient, "close", lambda self: closed.append(True))
+
+    config = Config(project_dir=tmp_project)
+    config.apis.unpaywall_email = "test@example.org"
+    with pytest.raises(RuntimeError):
+        run_retrieve(config)
+
+    assert closed == [True]
+    status = {p.paper_id: p.fulltext_status for p in load_papers(tmp_project / "papers.jsonl")}
+    assert status["s2:1"] == FulltextStatus.MANUAL_PENDING
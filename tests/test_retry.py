@@ -0,0 +1,101 @@
+"""Tests for litscout.utils.retry."""
+
+import httpx
+import pytest
+
+from litscout.utils import retry
+from litscout.utils.retry import call_with_retry, is_transient_error
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+
+
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.org")
+    return httpx.HTTPStatusError("err", request=request, response=httpx.Response(code, request=request))
+
+
+def test_call_with_retry_success_first_try():
+    assert call_with_retry(lambda: 42) == 42
+
+
+def test_call_with_retry_recovers():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise httpx.ConnectError("boom")
+        return "ok"
+
+    assert call_with_retry(flaky) == "ok"
+    assert len(calls) == 3
+
+
+def test_call_with_retry_reraises_after_attempts():
+    calls = []
+
+    def always_fails():
+        calls.append(1)
+        raise httpx.ConnectError("boom")
+
+    with pytest.raises(httpx.ConnectError):
+        call_with_retry(always_fails, attempts=2)
+    assert len(calls) == 2
+
+
+def test_call_with_retry_does_not_retry_client_errors():
+    calls = []
+
+    def not_found():
+        calls.append(1)
+        raise _status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retry(not_found)
+    assert len(calls) == 1
+
+
+def test_is_transient_error():
+    assert is_transient_error(httpx.ConnectError("boom"))
+    assert is_transient_error(httpx.ReadTimeout("slow"))
+    assert is_transient_error(ConnectionResetError())
+    assert is_transient_error(_status_error(429))
+    assert is_transient_error(_status_error(503))
+    assert not is_transient_error(_status_error(404))
+    assert not is_transient_error(KeyError("missing"))
+    assert not is_transient_error(TypeError("bug"))
+
+
+def test_is_transient_error_urllib_status():
+    from urllib.error import HTTPError
+
+    assert is_transient_error(HTTPError("https://example.org", 502, "Bad Gateway", {}, None))
+    assert not is_transient_error(HTTPError("https://example.org", 400, "Bad Request", {}, None))
+
+
+def test_call_with_retry_does_not_retry_value_error():
+    calls = []
+
+    def buggy():
+        calls.append(1)
+        raise ValueError("not a transient failure")
+
+    with pytest.raises(ValueError):
+        call_with_retry(buggy)
+    assert len(calls) == 1
+
+
+def test_call_with_retry_jitters_within_backoff_ceiling(monkeypatch):
+    waits = []
+    monkeypatch.setattr(retry.time, "sleep", waits.append)
+
+    def always_fails():
+        raise httpx.ConnectError("boom")
+
+    with pytest.raises(httpx.ConnectError):
+        call_with_retry(always_fails, attempts=4)
+    assert len(waits) == 3
+    assert all(0 <= w <= ceiling for w, ceiling in zip(waits, (2, 4, 8)))
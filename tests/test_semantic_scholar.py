@@ -0,0 +1,26 @@
+"""Tests for litscout.api_clients.semantic_scholar."""
+
+from pathlib import Path
+
+import pytest
+
+from litscout.api_clients.semantic_scholar import SemanticScholarClient
+from litscout.utils import work_cache
+
+
+def test_get_paper_and_batch_share_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("LITSCOUT_CACHE_DIR", str(tmp_path))
+    record = {"paperId": "abc123", "title": "Cached Paper", "year": 2024}
+    work_cache.put("abc123", record, namespace="semantic_scholar")
+
+    with SemanticScholarClient() as client:
+        # Both lookups are served from the cache entry, whichever ID form is passed
+        assert client.get_paper("s2:abc123").title == "Cached Paper"
+        assert client.get_paper("abc123").paper_id == "s2:abc123"
+        assert [p.title for p in client.get_papers_batch(["s2:abc123"])] == ["Cached Paper"]
+
+
+def test_citation_lists_with_zero_max_results_make_no_requests():
+    with SemanticScholarClient(use_cache=False) as client:
+        assert client.get_paper_citations("s2:abc123", max_results=0) == []
+        assert client.get_paper_references("s2:abc123", max_results=0) == []
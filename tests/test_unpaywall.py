@@ -0,0 +1,45 @@
+"""Tests for litscout.api_clients.unpaywall."""
+
+import asyncio
+from functools import partial
+
+import httpx
+import pytest
+
+from litscout.api_clients.unpaywall import UnpaywallClient
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    doi = request.url.path.removeprefix("/v2/")
+    if doi == "10.1/oa":
+        return httpx.Response(200, json={
+            "is_oa": True,
+            "best_oa_location": {"url_for_pdf": "https://example.org/oa.pdf",
+                                 "host_type": "repository"},
+        })
+    if doi == "10.1/missing":
+        return httpx.Response(404)
+    if doi == "10.1/html":
+        return httpx.Response(200, text="<html>Please complete the captcha</html>")
+    if doi == "10.1/shape":
+        return httpx.Response(200, json=["not", "an", "object"])
+    return httpx.Response(500)
+
+
+def test_get_oa_status_many_mock_transport(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        httpx, "AsyncClient", partial(httpx.AsyncClient, transport=httpx.MockTransport(_handler))
+    )
+    with UnpaywallClient("test@example.org", use_cache=False) as client:
+        results = asyncio.run(
+            client.get_oa_status_many(
+                ["10.1/oa", "10.1/missing", "10.1/error", "10.1/html", "10.1/shape", "10.1/oa"]
+            )
+        )
+
+    assert results["10.1/oa"].is_oa
+    assert results["10.1/oa"].pdf_url == "https://example.org/oa.pdf"
+    assert not results["10.1/missing"].is_oa
+    # Failed lookups, including non-JSON or misshapen 200 bodies, are omitted
+    # so callers can fall back to the retrying path
+    assert set(results) == {"10.1/oa", "10.1/missing"}
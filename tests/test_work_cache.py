@@ -0,0 +1,38 @@
+"""Tests for litscout.utils.work_cache."""
+
+import os
+import time
+from pathlib import Path
+
+from litscout.utils import work_cache
+
+
+def test_cache_miss(tmp_path: Path):
+    assert work_cache.get("W1", cache_dir=tmp_path) is None
+
+
+def test_cache_roundtrip(tmp_path: Path):
+    record = {"id": "https://openalex.org/W1", "title": "A Work", "cited_by_count": 3}
+    work_cache.put("W1", record, cache_dir=tmp_path)
+    assert work_cache.get("W1", cache_dir=tmp_path) == record
+
+
+def test_cache_namespaces_are_separate(tmp_path: Path):
+    work_cache.put("key", {"v": 1}, namespace="openalex", cache_dir=tmp_path)
+    assert work_cache.get("key", namespace="other", cache_dir=tmp_path) is None
+
+
+def test_cache_max_age(tmp_path: Path):
+    work_cache.put("W1", {"v": 1}, cache_dir=tmp_path)
+    entry = next(tmp_path.rglob("*.json.gz"))
+    old = time.time() - 3600
+    os.utime(entry, (old, old))
+    assert work_cache.get("W1", max_age=60, cache_dir=tmp_path) is None
+    assert work_cache.get("W1", max_age=7200, cache_dir=tmp_path) == {"v": 1}
+
+
+def test_cache_ignores_corrupt_entry(tmp_path: Path):
+    work_cache.put("W1", {"v": 1}, cache_dir=tmp_path)
+    entry = next(tmp_path.rglob("*.json.gz"))
+    entry.write_bytes(b"not gzip")
+    assert work_cache.get("W1", cache_dir=tmp_path) is None